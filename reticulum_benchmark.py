@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║           RETICULUM NETWORK STACK - CONFIG TOOLING BENCHMARKS                ║
+║                                                                              ║
+║  Time the config linter, batched fix application and every configurator    ║
+║  operation on generated configs, fit their complexity and catch regressions║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from rnstools.benchmark import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║           RETICULUM NETWORK STACK - LOCAL MULTI-INSTANCE TESTBED             ║
+║                                                                              ║
+║  Generate and launch N isolated rnsd instances on this machine, linked      ║
+║  with TCP interfaces in a line, star, mesh or random topology               ║
+║                                                                              ║
+║  Configs are built with the same code as reticulum_configurator.py          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from rnstools.testbed import main
+
+
+if __name__ == "__main__":
+    main()
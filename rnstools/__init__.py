@@ -0,0 +1,7 @@
+"""Interactive installer, configurators and tooling for the Reticulum network stack
+
+Run ``rnstools`` (or ``python3 -m rnstools``) for the list of tools. The
+submodules are imported on demand, so importing the package itself is free.
+"""
+
+__version__ = "1.0.0"
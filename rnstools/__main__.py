@@ -0,0 +1,7 @@
+"""python3 -m rnstools"""
+
+import sys
+
+from rnstools.cli import main
+
+sys.exit(main())
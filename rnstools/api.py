@@ -0,0 +1,463 @@
+"""Local JSON-RPC management API over HTTP or a Unix socket"""
+
+import os
+import sys
+import hmac
+import json
+import stat
+import hashlib
+import threading
+
+from rnstools.api_defaults import API_HOST, API_PORT
+from rnstools.configdiff import apply_patch, diff_configs
+from rnstools.lint import apply_edits, lint_config
+from rnstools.profiles import PERFORMANCE_PROFILES
+from rnstools.reticulum import ReticulumConfigurator, interface_summary
+from rnstools.schema import INTERFACE_SCHEMAS, validate_template
+
+
+API_MAX_BODY = 1024 * 1024      # bytes; configs are a few kB
+
+# JSON-RPC 2.0 error codes; -32000 and below are ours
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_INTERNAL_ERROR = -32603
+RPC_FAILED = -32000
+RPC_NOT_FOUND = -32001
+RPC_UNAUTHORIZED = -32003
+
+# Accepted types of every param a method reads, checked before the method runs
+PARAM_TYPES = {
+    "section": str,
+    "key": str,
+    "value": (str, int, float, bool),
+    "name": str,
+    "type": str,
+    "values": dict,
+    "host": str,
+    "port": int,
+    "listen_ip": str,
+    "listen_port": int,
+    "enabled": bool,
+    "profile": str,
+    "patch": (dict, list),
+    "dry_run": bool,
+    "rnsd": bool,
+}
+SCALAR_TYPES = (str, int, float, bool)
+
+
+class ApiError(Exception):
+    """Error reported to the API client as a JSON-RPC error object"""
+    
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class ConfigApi:
+    """JSON-RPC methods over one config kept in memory for the life of the server"""
+    
+    def __init__(self, configurator):
+        self.configurator = configurator
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.cache_content = None
+        self.methods = {
+            "config.get": self.config_get,
+            "config.reload": self.config_reload,
+            "settings.get": self.settings_get,
+            "settings.set": self.settings_set,
+            "interfaces.list": self.interfaces_list,
+            "interfaces.get": self.interfaces_get,
+            "interfaces.add": self.interfaces_add,
+            "interfaces.add_tcp": self.interfaces_add_tcp,
+            "interfaces.add_tcp_server": self.interfaces_add_tcp_server,
+            "interfaces.set": self.interfaces_set,
+            "interfaces.toggle": self.interfaces_toggle,
+            "interfaces.remove": self.interfaces_remove,
+            "profiles.list": self.profiles_list,
+            "profiles.apply": self.profiles_apply,
+            "lint": self.lint,
+            "fix": self.fix,
+            "validate": self.validate,
+            "patch.apply": self.patch_apply,
+        }
+    
+    def handle(self, request):
+        """Answer one JSON-RPC request object, or None for a notification"""
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+                raise ApiError(RPC_INVALID_REQUEST, "Invalid request")
+            method = self.methods.get(request["method"])
+            if method is None:
+                raise ApiError(RPC_METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise ApiError(RPC_INVALID_PARAMS, "params must be an object")
+            self.check_param_types(params)
+            with self.lock:
+                self.refresh()
+                result = method(params)
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except ApiError as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": e.code, "message": e.message}}
+        except OSError as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": {"code": RPC_FAILED, "message": str(e)}}
+        except Exception as e:
+            # A bug must not take the connection down with it
+            error = {"code": RPC_INTERNAL_ERROR, "message": f"Internal error: {type(e).__name__}: {e}"}
+            response = {"jsonrpc": "2.0", "id": request_id, "error": error}
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+    
+    def handle_body(self, body):
+        """Answer a request body holding one request or a batch, return the JSON reply or None"""
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": RPC_PARSE_ERROR, "message": "Parse error"}}
+        if isinstance(payload, list):
+            if not payload:
+                return {"jsonrpc": "2.0", "id": None, "error": {"code": RPC_INVALID_REQUEST, "message": "Empty batch"}}
+            responses = [r for r in (self.handle(request) for request in payload) if r is not None]
+            return responses or None
+        return self.handle(payload)
+    
+    def refresh(self):
+        """Reload the config if another program changed the file since the last request"""
+        configurator = self.configurator
+        if not configurator.watcher.changed.is_set():
+            return
+        configurator.watcher.acknowledge()
+        try:
+            with open(configurator.config_path, 'r') as f:
+                on_disk = f.read()
+        except OSError:
+            return
+        # Our own writes also trigger the watcher; keep the cache for those
+        if on_disk != configurator.original_content:
+            configurator.config_content = configurator.original_content = on_disk
+    
+    def cached(self, name, compute):
+        """Result of compute() for the current config content, computed once per content"""
+        if self.cache_content is not self.configurator.config_content:
+            self.cache = {}
+            self.cache_content = self.configurator.config_content
+        if name not in self.cache:
+            self.cache[name] = compute()
+        return self.cache[name]
+    
+    def interfaces(self):
+        return self.cached("interfaces", self.configurator.parse_interfaces)
+    
+    def check_param_types(self, params):
+        """Raise an invalid params error for a known param of the wrong JSON type"""
+        for name, value in params.items():
+            types = PARAM_TYPES.get(name)
+            if types is None:
+                continue
+            accepted = types if isinstance(types, tuple) else (types,)
+            # JSON true and false are Python bools, which are also ints
+            if not isinstance(value, accepted) or (isinstance(value, bool) and bool not in accepted):
+                names = " or ".join(t.__name__ for t in accepted)
+                raise ApiError(RPC_INVALID_PARAMS, f"{name} must be of type {names}")
+    
+    def require(self, params, *names):
+        """Values of the named params, raising an invalid params error if one is missing"""
+        missing = [name for name in names if name not in params]
+        if missing:
+            raise ApiError(RPC_INVALID_PARAMS, f"Missing params: {', '.join(missing)}")
+        return [params[name] for name in names]
+    
+    def require_interface(self, name):
+        iface = next((i for i in self.interfaces() if i["name"] == name), None)
+        if iface is None:
+            raise ApiError(RPC_NOT_FOUND, f"No interface named '{name}'")
+        return iface
+    
+    def change(self, params, edit):
+        """Run edit() on the config, then back up and write unless dry_run, return the diff"""
+        configurator = self.configurator
+        before = configurator.config_content
+        edit()
+        after = configurator.config_content
+        result = {"changed": after != before, "changes": diff_configs(before, after), "backup": None}
+        if params.get("dry_run"):
+            configurator.config_content = before
+            configurator.has_changes = False
+        elif after != before:
+            backup = configurator.create_backup(verbose=False)
+            configurator.write_config()
+            result["backup"] = backup.name.split(".")[0] if backup else None
+        return result
+    
+    def config_get(self, params):
+        content = self.configurator.config_content
+        return {
+            "path": str(self.configurator.config_path),
+            "sha256": hashlib.sha256(content.encode()).hexdigest(),
+            "content": content,
+        }
+    
+    def config_reload(self, params):
+        if not self.configurator.read_config():
+            raise ApiError(RPC_FAILED, f"Could not read config: {self.configurator.config_path}")
+        return self.config_get(params)
+    
+    def settings_get(self, params):
+        section, key = self.require(params, "section", "key")
+        return self.configurator.get_setting(section, key, None)
+    
+    def settings_set(self, params):
+        section, key, value = self.require(params, "section", "key", "value")
+        return self.change(params, lambda: self.configurator.set_setting(section, key, str(value)))
+    
+    def interfaces_list(self, params):
+        return [interface_summary(iface) for iface in self.interfaces()]
+    
+    def interfaces_get(self, params):
+        name, = self.require(params, "name")
+        return interface_summary(self.require_interface(name))
+    
+    def interfaces_add(self, params):
+        name, iface_type = self.require(params, "name", "type")
+        if iface_type not in INTERFACE_SCHEMAS:
+            raise ApiError(RPC_INVALID_PARAMS, f"Unknown interface type: {iface_type}")
+        if any(i["name"] == name for i in self.interfaces()):
+            raise ApiError(RPC_FAILED, f"An interface named '{name}' already exists")
+        values = params.get("values", {})
+        if not all(isinstance(value, SCALAR_TYPES) for value in values.values()):
+            raise ApiError(RPC_INVALID_PARAMS, "values must map keys to strings, numbers or booleans")
+        problems = validate_template(iface_type, values)
+        if problems:
+            raise ApiError(RPC_INVALID_PARAMS, "; ".join(message for key, message in problems))
+        return self.change(params, lambda: self.configurator.add_interface(name, iface_type, values))
+    
+    def interfaces_add_tcp(self, params):
+        name, host, port = self.require(params, "name", "host", "port")
+        if any(i["name"] == name for i in self.interfaces()):
+            raise ApiError(RPC_FAILED, f"An interface named '{name}' already exists")
+        return self.change(params, lambda: self.configurator.add_tcp_interface(name, host, port))
+    
+    def interfaces_add_tcp_server(self, params):
+        name, port = self.require(params, "name", "listen_port")
+        if any(i["name"] == name for i in self.interfaces()):
+            raise ApiError(RPC_FAILED, f"An interface named '{name}' already exists")
+        listen_ip = params.get("listen_ip", "0.0.0.0")
+        return self.change(params, lambda: self.configurator.add_tcp_server_interface(name, listen_ip, port))
+    
+    def interfaces_set(self, params):
+        name, key, value = self.require(params, "name", "key", "value")
+        self.require_interface(name)
+        return self.change(params, lambda: self.configurator.set_interface_property(name, key, str(value)))
+    
+    def interfaces_toggle(self, params):
+        name, enabled = self.require(params, "name", "enabled")
+        self.require_interface(name)
+        return self.change(params, lambda: self.configurator.toggle_interface(name, enabled))
+    
+    def interfaces_remove(self, params):
+        name, = self.require(params, "name")
+        self.require_interface(name)
+        return self.change(params, lambda: self.configurator.remove_interface(name))
+    
+    def profiles_list(self, params):
+        return [
+            {"profile": key, "name": profile["name"], "description": profile["description"]}
+            for key, profile in PERFORMANCE_PROFILES.items()
+        ]
+    
+    def profiles_apply(self, params):
+        profile, = self.require(params, "profile")
+        if profile not in PERFORMANCE_PROFILES:
+            raise ApiError(RPC_NOT_FOUND, f"Unknown profile: {profile}")
+        return self.change(params, lambda: self.configurator.apply_profile(profile))
+    
+    def diagnostics(self):
+        configurator = self.configurator
+        return self.cached("lint", lambda: lint_config(
+            configurator.config_content, config_dir=configurator.config_path.parent
+        ))
+    
+    def lint(self, params):
+        return self.diagnostics()
+    
+    def fix(self, params):
+        edits = [edit for d in self.diagnostics() if d["fix"] for edit in d["fix"]["edits"]]
+        
+        def edit():
+            self.configurator.config_content = apply_edits(self.configurator.config_content, edits)
+        return self.change(params, edit)
+    
+    def validate(self, params):
+        if params.get("rnsd"):
+            ok, error = self.cached("validate_rnsd", lambda: self.configurator.validate_config(with_rnsd=True))
+        else:
+            ok, error = self.cached("validate", self.configurator.validate_config)
+        return {"valid": ok, "error": error}
+    
+    def patch_apply(self, params):
+        patch, = self.require(params, "patch")
+        try:
+            changes = patch["changes"] if isinstance(patch, dict) else patch
+            patched = apply_patch(self.configurator.config_content, changes)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ApiError(RPC_INVALID_PARAMS, f"Invalid patch: {e}")
+        
+        def edit():
+            self.configurator.config_content = patched
+        return self.change(params, edit)
+
+
+def make_api_handler(api, token=None):
+    """HTTP request handler class serving the API: POST runs JSON-RPC, GET reports health"""
+    from http.server import BaseHTTPRequestHandler
+    
+    class ApiRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def send_json(self, status, payload):
+            body = b"" if payload is None else json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def authorized(self):
+            if token is None:
+                return True
+            # Constant time, so the token cannot be guessed from response times
+            given = (self.headers.get("Authorization") or "").encode()
+            return hmac.compare_digest(given, f"Bearer {token}".encode())
+        
+        def from_browser(self):
+            # Browsers send Origin on cross-site requests; API clients have no reason to
+            if self.headers.get("Origin") is None:
+                return False
+            self.close_connection = True
+            self.send_json(403, {"error": "cross-origin requests are not accepted"})
+            return True
+        
+        def do_GET(self):
+            if self.from_browser():
+                return
+            if not self.authorized():
+                self.send_json(401, {"error": "unauthorized"})
+                return
+            self.send_json(200, {"status": "ok", "config": str(api.configurator.config_path)})
+        
+        def do_POST(self):
+            if self.from_browser():
+                return
+            # A page can post text/plain without a preflight, but not application/json
+            content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                self.reject(415, RPC_INVALID_REQUEST, "Content-Type must be application/json")
+                return
+            if not self.authorized():
+                self.reject(401, RPC_UNAUTHORIZED, "Unauthorized")
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                self.reject(400, RPC_INVALID_REQUEST, "Invalid Content-Length")
+                return
+            if length > API_MAX_BODY:
+                self.reject(413, RPC_INVALID_REQUEST, f"Request body over {API_MAX_BODY} bytes")
+                return
+            reply = api.handle_body(self.rfile.read(length))
+            self.send_json(200 if reply is not None else 204, reply)
+        
+        def reject(self, status, code, message):
+            # The body is left unread, so the connection cannot carry another request
+            self.close_connection = True
+            self.send_json(status, {"jsonrpc": "2.0", "id": None, "error": {"code": code, "message": message}})
+        
+        def log_message(self, format, *args):
+            pass
+    
+    return ApiRequestHandler
+
+
+def remove_stale_socket(path):
+    """Delete a socket file left behind by an earlier server, refusing to touch anything else"""
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise FileExistsError(f"{path} exists and is not a socket")
+    os.unlink(path)
+
+
+def make_api_server(api, host=API_HOST, port=API_PORT, socket_path=None, token=None):
+    """HTTP server for the API on a TCP port, or on a Unix socket when socket_path is given"""
+    import socketserver
+    from http.server import ThreadingHTTPServer
+    
+    handler = make_api_handler(api, token)
+    if socket_path is None:
+        return ThreadingHTTPServer((host, port), handler)
+    
+    class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+        
+        def get_request(self):
+            # BaseHTTPRequestHandler expects a (host, port) client address
+            request, _ = super().get_request()
+            return request, ("local", 0)
+    
+    remove_stale_socket(socket_path)
+    # Only the owner may connect: the API can rewrite the config
+    old_umask = os.umask(0o177)
+    try:
+        return UnixHTTPServer(socket_path, handler)
+    finally:
+        os.umask(old_umask)
+
+
+def run_serve(args):
+    """Handle the serve command"""
+    configurator = ReticulumConfigurator(config_path=args.config)
+    if not configurator.read_config():
+        print(f"❌ Could not read config: {configurator.config_path}", file=sys.stderr)
+        return 1
+    
+    token = args.token or os.environ.get("RNSTOOLS_API_TOKEN") or None
+    if args.socket is None and token is None:
+        # Any local user or program could rewrite the config, and with it what rnsd runs
+        print("❌ Serving on a TCP port needs --token (or RNSTOOLS_API_TOKEN); "
+              "use --socket PATH for an owner-only Unix socket", file=sys.stderr)
+        return 1
+    api = ConfigApi(configurator)
+    try:
+        server = make_api_server(api, args.host, args.port, args.socket, token)
+    except OSError as e:
+        print(f"❌ Cannot listen: {e}", file=sys.stderr)
+        return 1
+    
+    configurator.watcher.start()
+    where = args.socket or f"http://{args.host}:{args.port}/"
+    print(f"Serving {configurator.config_path} on {where}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        configurator.watcher.stop()
+        if args.socket:
+            try:
+                remove_stale_socket(args.socket)
+            except OSError:
+                pass
+    return 0
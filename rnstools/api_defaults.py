@@ -0,0 +1,4 @@
+"""Defaults of the management API, apart from it so the command line can show them without loading the server"""
+
+API_HOST = "127.0.0.1"
+API_PORT = 4280
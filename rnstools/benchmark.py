@@ -0,0 +1,353 @@
+"""Benchmarks and regression checks for the config tooling"""
+
+import sys
+import argparse
+import time
+import json
+import math
+import platform
+import io
+import contextlib
+from datetime import datetime
+
+from rnstools import nomadnet
+from rnstools.lint import LINT_RULES, apply_edits, lint_config
+from rnstools.reticulum import DEFAULT_CONFIG, ReticulumConfigurator
+
+
+DEFAULT_SIZES = [100, 1000, 5000]
+DEFAULT_REPEAT = 5
+DEFAULT_FIX_SIZES = [100, 250, 500]
+DEFAULT_SCALE_SIZES = [10, 100, 1000, 10000]
+DEFAULT_THRESHOLD = 0.5     # allowed slowdown against the baseline
+MIN_REGRESSION_MS = 1.0     # ignore differences smaller than timer noise
+OPERATION_TIME_LIMIT = 5.0  # seconds; larger sizes of a slower operation are skipped
+
+
+def generate_config(interfaces, broken=0.0):
+    """Build a config with the given number of TCP client interfaces
+
+    A fraction of them are broken in ways the linter reports: bad indentation
+    and duplicated names.
+    """
+    broken_every = int(1 / broken) if broken else 0
+    blocks = [DEFAULT_CONFIG.rstrip("\n")]
+    for i in range(interfaces):
+        is_broken = broken_every and i % broken_every == 0
+        name = f"Node {i - 1 if is_broken and i else i}"
+        indent = " " if is_broken else "  "
+        blocks.append(
+            f"\n{indent}[[{name}]]\n"
+            f"    type = TCPClientInterface\n"
+            f"    enabled = yes\n"
+            f"    target_host = node{i}.example.net\n"
+            f"    target_port = 4242"
+        )
+    return "\n".join(blocks) + "\n"
+
+
+def best_time(function, repeat):
+    """Fastest of several runs, in milliseconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def bench_lint(sizes, repeat, broken):
+    """Time the linter with all rules, with none (the parse alone) and with each rule alone"""
+    results = []
+    for size in sizes:
+        content = generate_config(size, broken)
+        diagnostics = lint_config(content)
+        row = {
+            "interfaces": size,
+            "lines": content.count("\n"),
+            "diagnostics": len(diagnostics),
+            "all_ms": best_time(lambda: lint_config(content), repeat),
+            "parse_ms": best_time(lambda: lint_config(content, codes=[]), repeat),
+            "rules_ms": {},
+        }
+        for code in LINT_RULES["reticulum"]:
+            row["rules_ms"][code] = best_time(lambda: lint_config(content, codes=[code]), repeat)
+        results.append(row)
+    return results
+
+
+def print_lint_results(results):
+    """Print the lint timings as a table"""
+    codes = list(LINT_RULES["reticulum"])
+    print(f"{'Interfaces':>10} {'Lines':>7} {'Diags':>6} {'All rules':>10} {'Parse only':>11}")
+    for row in results:
+        print(f"{row['interfaces']:>10} {row['lines']:>7} {row['diagnostics']:>6} {row['all_ms']:>8.1f}ms {row['parse_ms']:>9.1f}ms")
+    
+    print("\nSingle rule (parse included)" + "".join(f"{row['interfaces']:>10}" for row in results))
+    for code in codes:
+        print(f"{code:<28}" + "".join(f"{row['rules_ms'][code]:>8.1f}ms" for row in results))
+
+
+def fix_batched(content):
+    """Lint once and apply every fix in a single rewrite"""
+    diagnostics = lint_config(content)
+    return apply_edits(content, [edit for d in diagnostics if d["fix"] for edit in d["fix"]["edits"]])
+
+
+def fix_sequential(content):
+    """Apply one fix at a time, re-linting after each since line numbers shift"""
+    while True:
+        fixable = [d for d in lint_config(content) if d["fix"]]
+        if not fixable:
+            return content
+        content = apply_edits(content, fixable[0]["fix"]["edits"])
+
+
+def bench_fix(sizes, repeat):
+    """Time fixing configs where every interface is broken, batched and one by one"""
+    results = []
+    for size in sizes:
+        content = generate_config(size, broken=1.0)
+        fixed = fix_batched(content)
+        results.append({
+            "interfaces": size,
+            "fixes": sum(1 for d in lint_config(content) if d["fix"]),
+            "remaining": sum(1 for d in lint_config(fixed) if d["fix"]),
+            "same_result": fixed == fix_sequential(content),
+            "batched_ms": best_time(lambda: fix_batched(content), repeat),
+            "sequential_ms": best_time(lambda: fix_sequential(content), 1),
+        })
+    return results
+
+
+def print_fix_results(results):
+    """Print the fix timings as a table"""
+    print(f"{'Interfaces':>10} {'Fixes':>6} {'Batched':>10} {'One by one':>12} {'Speedup':>8}  Left  Same")
+    for row in results:
+        speedup = row["sequential_ms"] / row["batched_ms"] if row["batched_ms"] else 0
+        print(f"{row['interfaces']:>10} {row['fixes']:>6} {row['batched_ms']:>8.1f}ms {row['sequential_ms']:>10.1f}ms "
+              f"{speedup:>7.0f}x {row['remaining']:>5}  {'yes' if row['same_result'] else 'NO'}")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SCALING SUITE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def generate_nomadnet_config(keys):
+    """Build a NomadNet config padded with the given number of extra [client] keys"""
+    padding = "".join(f"custom_setting_{i} = value {i}\n" for i in range(keys))
+    return nomadnet.DEFAULT_CONFIG.replace("[textui]", padding + "\n[textui]", 1)
+
+
+def reticulum_instance(content):
+    """A Reticulum configurator holding content, without touching any file"""
+    configurator = ReticulumConfigurator(config_path="/nonexistent/config")
+    configurator.config_content = configurator.original_content = content
+    return configurator
+
+
+def nomadnet_instance(content):
+    """A NomadNet configurator holding content, without touching any file"""
+    configurator = nomadnet.NomadNetConfigurator()
+    configurator.config_content = configurator.original_content = content
+    return configurator
+
+
+def middle_interface(size):
+    """Name of an interface in the middle of a generated config"""
+    return f"Node {size // 2}"
+
+
+# name -> (config kind, operation(configurator, size)); every run gets a fresh configurator
+SCALE_OPERATIONS = {
+    "parse_interfaces": ("reticulum", lambda c, n: c.parse_interfaces()),
+    "get_setting": ("reticulum", lambda c, n: c.get_setting("logging", "loglevel")),
+    "set_setting": ("reticulum", lambda c, n: c.set_setting("logging", "loglevel", "5")),
+    "add_tcp_interface": ("reticulum", lambda c, n: c.add_tcp_interface("New Node", "new.example.net", 4242)),
+    "remove_interface": ("reticulum", lambda c, n: c.remove_interface(middle_interface(n))),
+    "toggle_interface": ("reticulum", lambda c, n: c.toggle_interface(middle_interface(n), False)),
+    "lint": ("reticulum", lambda c, n: lint_config(c.config_content)),
+    "rebuild_config": ("reticulum", lambda c, n: c.rebuild_config()),
+    "nomadnet_get_setting": ("nomadnet", lambda c, n: c.get_setting("node", "node_name")),
+    "nomadnet_set_setting": ("nomadnet", lambda c, n: c.set_setting("node", "node_name", "Bench")),
+    "nomadnet_lint": ("nomadnet", lambda c, n: lint_config(c.config_content, target="nomadnet")),
+    "nomadnet_rebuild_config": ("nomadnet", lambda c, n: c.rebuild_config()),
+}
+
+
+def time_operation(kind, operation, content, size, repeat):
+    """Fastest of several runs of an operation on a fresh configurator, in milliseconds"""
+    make = reticulum_instance if kind == "reticulum" else nomadnet_instance
+    times = []
+    for _ in range(repeat):
+        configurator = make(content)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            operation(configurator, size)
+            times.append((time.perf_counter() - start) * 1000)
+    return min(times)
+
+
+def fit_exponent(points):
+    """Least-squares slope of log(time) against log(size): 0 constant, 1 linear, 2 quadratic"""
+    points = [(n, ms) for n, ms in points if ms and ms > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(ms) for _, ms in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def complexity_label(exponent):
+    """Big-O name for a fitted exponent"""
+    if exponent is None:
+        return "?"
+    if exponent < 0.5:
+        return "O(1)"
+    if exponent < 1.5:
+        return "O(n)"
+    if exponent < 2.5:
+        return "O(n²)"
+    return "O(n³+)"
+
+
+def bench_scale(sizes, repeat, operations=None):
+    """Time every operation at every size and fit its complexity"""
+    contents = {}
+    results = {}
+    for name, (kind, operation) in SCALE_OPERATIONS.items():
+        if operations and name not in operations:
+            continue
+        timings = {}
+        for size in sizes:
+            if (kind, size) not in contents:
+                contents[(kind, size)] = generate_config(size) if kind == "reticulum" else generate_nomadnet_config(size)
+            # Repeat less at large sizes, the runs are long enough to be stable
+            runs = repeat if size <= 1000 else min(repeat, 3)
+            ms = time_operation(kind, operation, contents[(kind, size)], size, runs)
+            timings[str(size)] = ms
+            if ms / 1000 > OPERATION_TIME_LIMIT:
+                break
+        # Small sizes are dominated by constant overhead, fit on the larger ones
+        points = [(int(n), ms) for n, ms in timings.items()]
+        large = [p for p in points if p[0] >= 100]
+        exponent = fit_exponent(large if len(large) >= 2 else points)
+        results[name] = {"timings_ms": timings, "exponent": exponent, "complexity": complexity_label(exponent)}
+    
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "sizes": sizes,
+        "operations": results,
+    }
+
+
+def compare_scale(current, baseline, threshold):
+    """Regressions of current results against a baseline, as readable strings"""
+    regressions = []
+    for name, result in current["operations"].items():
+        old = baseline.get("operations", {}).get(name)
+        if not old:
+            continue
+        for size, ms in result["timings_ms"].items():
+            old_ms = old["timings_ms"].get(size)
+            if old_ms and ms > old_ms * (1 + threshold) and ms - old_ms > MIN_REGRESSION_MS:
+                regressions.append(f"{name} @ {size}: {old_ms:.2f}ms → {ms:.2f}ms (+{(ms / old_ms - 1) * 100:.0f}%)")
+        if result["exponent"] is not None and old.get("exponent") is not None and result["exponent"] > old["exponent"] + 0.5:
+            regressions.append(f"{name}: complexity {old['complexity']} → {result['complexity']}")
+    return regressions
+
+
+def print_scale_results(report):
+    """Print the timings and fitted complexity of every operation"""
+    sizes = [str(size) for size in report["sizes"]]
+    print(f"{'Operation':<26}" + "".join(f"{size:>11}" for size in sizes) + f"{'Exponent':>10}  Complexity")
+    for name, result in report["operations"].items():
+        cells = "".join(
+            f"{result['timings_ms'][size]:>9.2f}ms" if size in result["timings_ms"] else f"{'skipped':>11}"
+            for size in sizes
+        )
+        exponent = f"{result['exponent']:.2f}" if result["exponent"] is not None else "-"
+        print(f"{name:<26}{cells}{exponent:>10}  {result['complexity']}")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAIN ENTRY POINT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    if sys.version_info < (3, 7):
+        print("❌ Error: Python 3.7 or higher is required.")
+        sys.exit(1)
+    
+    parser = argparse.ArgumentParser(description="Benchmarks for the Reticulum config tooling")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    lint = commands.add_parser("lint", help="time the config linter")
+    lint.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="interface counts to test")
+    lint.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per measurement, the fastest is kept")
+    lint.add_argument("--broken", type=float, default=0.0, help="fraction of interfaces to break (0-1)")
+    lint.add_argument("--json", action="store_true", help="print the results as JSON")
+    
+    fix = commands.add_parser("fix", help="time batched fix application on fully broken configs")
+    fix.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_FIX_SIZES, help="broken interface counts to test")
+    fix.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per batched measurement")
+    fix.add_argument("--json", action="store_true", help="print the results as JSON")
+    
+    scale = commands.add_parser("scale", help="time every configurator operation from 10 to 10,000 interfaces")
+    scale.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SCALE_SIZES, help="config sizes to test")
+    scale.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per measurement up to 1,000 interfaces")
+    scale.add_argument("--only", nargs="+", choices=list(SCALE_OPERATIONS), help="operations to run")
+    scale.add_argument("--save-baseline", metavar="FILE", help="write the results as the new baseline")
+    scale.add_argument("--baseline", metavar="FILE", help="compare against a baseline and fail on regressions")
+    scale.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="allowed slowdown, 0.5 = 50%%")
+    scale.add_argument("--json", action="store_true", help="print the results as JSON")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "lint":
+        results = bench_lint(args.sizes, args.repeat, args.broken)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_lint_results(results)
+    
+    if args.command == "fix":
+        results = bench_fix(args.sizes, args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            print_fix_results(results)
+    
+    if args.command == "scale":
+        report = bench_scale(args.sizes, args.repeat, args.only)
+        if args.json:
+            print(json.dumps(report, indent=2))
+        else:
+            print_scale_results(report)
+        
+        if args.save_baseline:
+            with open(args.save_baseline, 'w') as f:
+                json.dump(report, f, indent=2)
+            print(f"\n💾 Baseline saved to {args.save_baseline}")
+        
+        if args.baseline:
+            with open(args.baseline, 'r') as f:
+                baseline = json.load(f)
+            regressions = compare_scale(report, baseline, args.threshold)
+            if regressions:
+                print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+                for regression in regressions:
+                    print(f"  {regression}")
+                sys.exit(1)
+            print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
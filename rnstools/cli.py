@@ -0,0 +1,38 @@
+"""The rnstools command: one entry point for every tool, importing only the one that runs"""
+
+import sys
+import importlib
+
+# Tool name -> (module with a main(argv) function, description)
+TOOLS = {
+    "reticulum": ("rnstools.reticulum_cli", "configure Reticulum (~/.reticulum/config)"),
+    "nomadnet": ("rnstools.nomadnet", "configure NomadNet (~/.nomadnetwork/config)"),
+    "install": ("rnstools.installer", "install RNS, LXMF, NomadNet, Sideband and more"),
+    "testbed": ("rnstools.testbed", "local multi-node rnsd testbed"),
+    "benchmark": ("rnstools.benchmark", "benchmarks for the config tooling"),
+}
+
+
+def usage():
+    """Help text listing the tools"""
+    lines = ["usage: rnstools TOOL [ARGS...]", "", "tools:"]
+    lines += [f"  {name:<12}{description}" for name, (_, description) in TOOLS.items()]
+    lines += ["", "Run 'rnstools TOOL --help' for the commands of a tool. The configurators",
+              "open their interactive menu when run without arguments."]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Run one tool, return the process exit code"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ["-h", "--help"]:
+        print(usage())
+        return 0 if argv else 2
+    
+    if argv[0] not in TOOLS:
+        print(f"rnstools: unknown tool '{argv[0]}'\n", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+    
+    module = importlib.import_module(TOOLS[argv[0]][0])
+    return module.main(argv[1:])
@@ -0,0 +1,354 @@
+"""Semantic diff, patch and three-way merge of ConfigObj-style configs"""
+
+import re
+import json
+
+
+PATCH_FORMAT = "rnstools-config-patch"
+PATCH_VERSION = 1
+
+SECTION_LINE = re.compile(r'^(\s*)(\[+)\s*([^\[\]]+?)\s*\]+\s*(?:#.*)?$')
+KEY_LINE = re.compile(r'^(\s*)([^\s=#\[][^=]*?)\s*=\s*(.*?)\s*$')
+
+
+class ConfigIndex:
+    """Single-pass line index of a config: where each section and key lives"""
+    
+    def __init__(self, content):
+        self.lines = content.split('\n')
+        # path tuple -> {"header", "end", "body_end", "indent", "keys": {key: (line, value)}}
+        self.sections = {(): {"header": -1, "end": len(self.lines), "body_end": -1, "indent": "", "keys": {}}}
+        stack = [()]
+        current = self.sections[()]
+        
+        for number, line in enumerate(self.lines):
+            section_match = SECTION_LINE.match(line)
+            if section_match:
+                depth = len(section_match.group(2))
+                while len(stack) > depth:
+                    self.sections[stack.pop()]["end"] = number
+                path = stack[-1] + (section_match.group(3),)
+                stack.append(path)
+                current = {"header": number, "end": len(self.lines), "body_end": number, "indent": None, "keys": {}}
+                self.sections[path] = current
+                continue
+            
+            key_match = KEY_LINE.match(line)
+            if key_match:
+                current["keys"][key_match.group(2)] = (number, key_match.group(3))
+                current["body_end"] = number
+                if current["indent"] is None:
+                    current["indent"] = key_match.group(1)
+    
+    def top_level_span(self, number):
+        """(first, end) lines of the top-level section holding a line, or of the lines before the first one"""
+        first, end = 0, len(self.lines)
+        for path, section in self.sections.items():
+            if len(path) != 1:
+                continue
+            if section["header"] > number:
+                end = min(end, section["header"])
+                break
+            first, end = section["header"], section["end"]
+        return first, end
+    
+    def updated(self, content):
+        """Index of an edited version of this text, re-parsing only the top-level sections that changed
+        
+        Sections before and after the changed ones are carried over, their
+        line numbers shifted by the change in length.
+        """
+        lines = content.split('\n')
+        if lines == self.lines:
+            return self
+        limit = min(len(lines), len(self.lines))
+        prefix = 0
+        while prefix < limit and lines[prefix] == self.lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and lines[-1 - suffix] == self.lines[-1 - suffix]:
+            suffix += 1
+        
+        # Changed lines belong to the section of the line above them
+        first = self.top_level_span(max(prefix - 1, 0))[0]
+        changed_end = len(self.lines) - suffix
+        end = self.top_level_span(changed_end)[1] if changed_end < len(self.lines) else len(self.lines)
+        shift = len(lines) - len(self.lines)
+        chunk = ConfigIndex('\n'.join(lines[first:end + shift]))
+        
+        def moved(section, offset):
+            keys = {key: (number + offset, value) for key, (number, value) in section["keys"].items()}
+            return dict(section, keys=keys,
+                        header=section["header"] + offset if section["header"] >= 0 else -1,
+                        end=section["end"] + offset,
+                        body_end=section["body_end"] + offset if section["body_end"] >= 0 else -1)
+        
+        root = moved(chunk.sections[()], 0) if first == 0 else dict(self.sections[()])
+        root["end"] = len(lines)
+        index = ConfigIndex.__new__(ConfigIndex)
+        index.lines = lines
+        index.sections = {(): root}
+        parts = [
+            ((path, section) for path, section in self.sections.items() if path and section["header"] < first),
+            ((path, moved(section, first)) for path, section in chunk.sections.items() if path),
+            ((path, moved(section, shift)) for path, section in self.sections.items() if path and section["header"] >= end),
+        ]
+        for part in parts:
+            for path, section in part:
+                if path in index.sections:
+                    return ConfigIndex(content)  # a repeated section, where the full parse decides
+                index.sections[path] = section
+        return index
+    
+    def tree(self):
+        """Return {section path: {key: value}} in file order"""
+        return {
+            path: {key: value for key, (_, value) in section["keys"].items()}
+            for path, section in self.sections.items()
+        }
+    
+    def last_content_line(self, path):
+        """Index of the last non-blank line belonging to a section and its subsections"""
+        section = self.sections[path]
+        number = section["end"] - 1
+        while number > section["header"] and not self.lines[number].strip():
+            number -= 1
+        return number
+
+
+def parse_config_tree(content):
+    """Parse config text into {section path: {key: value}}"""
+    return ConfigIndex(content).tree()
+
+
+def section_header(path):
+    """Config header line for a section path, indented like rnsd's example config"""
+    depth = len(path)
+    return "  " * (depth - 1) + "[" * depth + path[-1] + "]" * depth
+
+
+def key_indent(path):
+    """Default indentation for keys of a section path"""
+    return "  " * len(path) if len(path) > 1 else ""
+
+
+def diff_configs(old_content, new_content):
+    """Semantic changes turning one config into another, as a list of patch operations"""
+    return diff_trees(parse_config_tree(old_content), parse_config_tree(new_content))
+
+
+def diff_trees(old_tree, new_tree):
+    """Patch operations turning one parsed config tree into another"""
+    changes = []
+    
+    for path in old_tree:
+        if path and path not in new_tree and path[:-1] in new_tree:
+            changes.append({"op": "remove_section", "section": list(path)})
+    
+    for path, keys in new_tree.items():
+        if path not in old_tree:
+            changes.append({"op": "add_section", "section": list(path), "keys": keys})
+            continue
+        old_keys = old_tree[path]
+        for key, value in keys.items():
+            if old_keys.get(key) != value:
+                changes.append({"op": "set", "section": list(path), "key": key, "old": old_keys.get(key), "value": value})
+        for key, value in old_keys.items():
+            if key not in keys:
+                changes.append({"op": "unset", "section": list(path), "key": key, "old": value})
+    
+    return changes
+
+
+def format_section_path(path):
+    """Readable section path such as [interfaces] > [[RMap World]]"""
+    return " > ".join("[" * (depth + 1) + name + "]" * (depth + 1) for depth, name in enumerate(path)) or "(top)"
+
+
+def format_diff(changes):
+    """Human-readable lines describing a list of changes"""
+    lines = []
+    for change in changes:
+        where = format_section_path(change["section"])
+        if change["op"] == "add_section":
+            lines.append(f"  + {where}")
+            lines.extend(f"  +     {key} = {value}" for key, value in change["keys"].items())
+        elif change["op"] == "remove_section":
+            lines.append(f"  - {where}")
+        elif change["op"] == "set" and change.get("old") is None:
+            lines.append(f"  + {where} {change['key']} = {change['value']}")
+        elif change["op"] == "set":
+            lines.append(f"  ~ {where} {change['key']}: {change['old']} → {change['value']}")
+        elif change["op"] == "unset":
+            lines.append(f"  - {where} {change['key']}")
+    return lines
+
+
+def apply_patch(content, changes, index=None):
+    """Apply patch operations to config text with line edits, leaving everything else untouched"""
+    index = index or ConfigIndex(content)
+    lines = index.lines
+    replace = {}
+    key_inserts = {}
+    section_inserts = {}
+    # path -> {"lines": header and keys, "children": new subsections}
+    new_sections = {}
+    
+    def add_block(path):
+        parent = path[:-1]
+        if parent and parent not in index.sections and parent not in new_sections:
+            add_block(parent)
+        new_sections[path] = {"lines": ["", section_header(path)], "children": []}
+        if parent in new_sections:
+            new_sections[parent]["children"].append(path)
+        else:
+            number = index.last_content_line(parent if parent in index.sections else ())
+            section_inserts.setdefault(number, []).append(path)
+        return new_sections[path]["lines"]
+    
+    def block_lines(path):
+        block = list(new_sections[path]["lines"])
+        for child in new_sections[path]["children"]:
+            block.extend(block_lines(child))
+        return block
+    
+    def inserted_after(number):
+        # Keys first, as they belong to the section ending on this line; then new
+        # sections, deepest first so each lands inside its parent before it closes
+        block = list(key_inserts.get(number, []))
+        for path in sorted(section_inserts.get(number, []), key=len, reverse=True):
+            block.extend(block_lines(path))
+        return block
+    
+    for change in changes:
+        path = tuple(change["section"])
+        op = change["op"]
+        
+        if op == "remove_section":
+            section = index.sections.get(path)
+            if section:
+                for number in range(section["header"], section["end"]):
+                    replace[number] = None
+            continue
+        
+        if op == "add_section" and path not in index.sections and path not in new_sections:
+            block = add_block(path)
+            block.extend(f"{key_indent(path)}{key} = {value}" for key, value in change["keys"].items())
+            continue
+        
+        items = change["keys"].items() if op == "add_section" else [(change["key"], change.get("value"))]
+        for key, value in items:
+            if path in new_sections:
+                if op != "unset":
+                    new_sections[path]["lines"].append(f"{key_indent(path)}{key} = {value}")
+                continue
+            
+            section = index.sections.get(path)
+            if section is None:
+                if op != "unset":
+                    add_block(path).append(f"{key_indent(path)}{key} = {value}")
+                continue
+            
+            if key in section["keys"]:
+                number = section["keys"][key][0]
+                if op == "unset":
+                    replace[number] = None
+                else:
+                    key_match = KEY_LINE.match(lines[number])
+                    replace[number] = f"{key_match.group(1)}{key} = {value}"
+            elif op != "unset":
+                indent = section["indent"] if section["indent"] is not None else key_indent(path)
+                key_inserts.setdefault(section["body_end"], []).append(f"{indent}{key} = {value}")
+    
+    output = inserted_after(-1)
+    for number, line in enumerate(lines):
+        if number in replace:
+            if replace[number] is not None:
+                output.append(replace[number])
+        else:
+            output.append(line)
+        output.extend(inserted_after(number))
+    
+    result = '\n'.join(output)
+    if content.endswith('\n') and not result.endswith('\n'):
+        result += '\n'
+    return result
+
+
+def merge_trees(base, ours, theirs, resolve=None):
+    """Three-way merge of parsed trees, return (merged tree, conflicts)
+
+    resolve(conflict) returns "ours" or "theirs"; without it theirs wins.
+    """
+    merged = {}
+    conflicts = []
+    
+    def pick(conflict):
+        choice = resolve(conflict) if resolve else "theirs"
+        conflict["resolution"] = choice
+        conflicts.append(conflict)
+        return conflict[choice]
+    
+    for path in dict.fromkeys(list(theirs) + list(ours) + list(base)):
+        in_base, in_ours, in_theirs = path in base, path in ours, path in theirs
+        base_keys = base.get(path, {})
+        
+        if in_ours != in_theirs:
+            # One side removed or added the section; conflict if the other side also edited it
+            kept = ours if in_ours else theirs
+            if in_base and kept[path] != base_keys:
+                present = pick({
+                    "section": list(path), "key": None, "base": True,
+                    "ours": in_ours, "theirs": in_theirs,
+                })
+            else:
+                present = in_ours if in_ours != in_base else in_theirs
+            if present:
+                merged[path] = dict(kept[path])
+            continue
+        if not in_ours:
+            continue
+        
+        keys = {}
+        our_keys, their_keys = ours[path], theirs[path]
+        for key in dict.fromkeys(list(their_keys) + list(our_keys) + list(base_keys)):
+            b, o, t = base_keys.get(key), our_keys.get(key), their_keys.get(key)
+            if o == t or o == b:
+                value = t
+            elif t == b:
+                value = o
+            else:
+                value = pick({"section": list(path), "key": key, "base": b, "ours": o, "theirs": t})
+            if value is not None:
+                keys[key] = value
+        merged[path] = keys
+    
+    return merged, conflicts
+
+
+def three_way_merge(base_content, theirs_content, ours_content, resolve=None, base_index=None):
+    """Merge our edits and an external edit of the same base, return (text, conflicts)
+
+    The result is their text with only the sections and keys that need to
+    change patched in, so their formatting and comments survive. With the
+    base already indexed, both edits only re-parse the sections they touch.
+    """
+    base_index = base_index or ConfigIndex(base_content)
+    their_index = base_index.updated(theirs_content)
+    their_tree = their_index.tree()
+    merged, conflicts = merge_trees(base_index.tree(), base_index.updated(ours_content).tree(), their_tree, resolve)
+    return apply_patch(theirs_content, diff_trees(their_tree, merged), their_index), conflicts
+
+
+def make_patch(changes):
+    """Wrap changes in the on-disk patch format"""
+    return {"format": PATCH_FORMAT, "version": PATCH_VERSION, "changes": changes}
+
+
+def load_patch(path):
+    """Read a patch file, return its list of changes"""
+    with open(path, 'r') as f:
+        patch = json.load(f)
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError(f"{path} is not a config patch")
+    return patch["changes"]
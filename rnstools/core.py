@@ -0,0 +1,305 @@
+"""Shared base of the interactive tools: translations, menus and config file handling"""
+
+import re
+import json
+import importlib
+from pathlib import Path
+
+from rnstools.configdiff import diff_configs, format_diff
+from rnstools.lint import FIX_MESSAGES, apply_edits, lint_config
+from rnstools.store import BackupStore, atomic_write
+from rnstools.tui import get_screen
+
+
+LANGUAGES = {"1": "en", "2": "it", "3": "es", "4": "de", "5": "ru"}
+
+
+class TerminalTool:
+    """Translated strings, screen handling and language selection"""
+    
+    # Module in rnstools.translations holding this tool's TRANSLATIONS
+    TRANSLATIONS_MODULE = None
+    
+    def __init__(self):
+        self.lang = "en"
+    
+    @property
+    def translations(self):
+        # Imported on first use, so commands that print no menus never load the strings
+        return importlib.import_module(f"rnstools.translations.{self.TRANSLATIONS_MODULE}").TRANSLATIONS
+    
+    def t(self, key):
+        """Get translated string"""
+        translations = self.translations
+        return translations.get(self.lang, translations["en"]).get(key, key)
+    
+    def clear_screen(self):
+        """Start a new screen, redrawn in place of the previous one"""
+        get_screen().clear()
+    
+    def select_language(self):
+        """Display language selection menu"""
+        self.clear_screen()
+        print("""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         🌐 LANGUAGE SELECTION                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🇬🇧 English
+  [2] 🇮🇹 Italiano
+  [3] 🇪🇸 Español
+  [4] 🇩🇪 Deutsch
+  [5] 🇷🇺 Русский
+
+""")
+        while True:
+            choice = input("  Enter your choice (1-5): ").strip()
+            if choice in LANGUAGES:
+                self.lang = LANGUAGES[choice]
+                break
+            print("  ❌ Invalid choice. Please enter 1-5.")
+
+
+class BaseConfigurator(TerminalTool):
+    """Loading, editing, backing up and saving one ConfigObj-style config file"""
+    
+    # Written by create_default_config
+    DEFAULT_CONFIG = ""
+    # Translation key telling the user which program creates the config
+    CREATE_HINT = None
+    
+    def __init__(self, config_path=None):
+        super().__init__()
+        self.config_path = None
+        self.config_content = ""
+        self.original_content = ""
+        self.has_changes = False
+        if config_path is not None:
+            self.config_path = Path(config_path)
+        else:
+            self.find_config()
+    
+    def config_locations(self):
+        """Where the config is looked for, in order; the first one is the default"""
+        return []
+    
+    def find_config(self):
+        """Find the config file in the common locations"""
+        locations = self.config_locations()
+        self.config_path = next((path for path in locations if path.exists()), locations[0])
+    
+    def load_config(self):
+        """Load the configuration file"""
+        if not self.config_path.exists():
+            print(f"\n{self.t('config_not_found')}")
+            print(f"  {self.config_path}")
+            print(f"\n{self.t(self.CREATE_HINT)}")
+            
+            response = input(f"\n{self.t('create_default')}").strip().lower()
+            if response == self.t("yes"):
+                self.create_default_config()
+            else:
+                return False
+        
+        try:
+            with open(self.config_path, 'r') as f:
+                self.config_content = f.read()
+                self.original_content = self.config_content
+            print(f"\n{self.t('config_found')}")
+            print(f"  {self.config_path}")
+            return True
+        except PermissionError:
+            print(f"\n{self.t('permission_denied')}")
+            return False
+        except Exception as e:
+            print(f"\n❌ Error loading config: {e}")
+            return False
+    
+    def read_config(self):
+        """Read the config file without prompting, return False if it cannot be read"""
+        try:
+            with open(self.config_path, 'r') as f:
+                self.config_content = f.read()
+            self.original_content = self.config_content
+            return True
+        except OSError:
+            return False
+    
+    def create_default_config(self):
+        """Create a default configuration file"""
+        print(f"\n{self.t('creating_default')}")
+        
+        try:
+            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(self.config_path, self.DEFAULT_CONFIG)
+            self.config_content = self.DEFAULT_CONFIG
+            self.original_content = self.DEFAULT_CONFIG
+            print(f"✅ Created: {self.config_path}")
+        except PermissionError:
+            print(f"\n{self.t('permission_denied')}")
+            return False
+        except Exception as e:
+            print(f"\n❌ Error: {e}")
+            return False
+        return True
+    
+    def create_backup(self, verbose=True):
+        """Back up the on-disk config into the backup store, return its path or None"""
+        if self.config_path.exists():
+            with open(self.config_path, 'r') as f:
+                backup_path = BackupStore(self.config_path).save(f.read())
+            if verbose:
+                print(f"\n{self.t('backup_created')}")
+                print(f"  {backup_path}")
+            return backup_path
+        return None
+    
+    def write_config(self):
+        """Write the in-memory config to disk without prompting"""
+        atomic_write(self.config_path, self.config_content)
+        self.original_content = self.config_content
+        self.has_changes = False
+    
+    def save_config(self):
+        """Save the configuration file"""
+        if self.config_content == self.original_content:
+            print(f"\n{self.t('no_changes')}")
+            return True
+        
+        print()
+        for line in format_diff(diff_configs(self.original_content, self.config_content)):
+            print(line)
+        
+        response = input(f"\n{self.t('save_changes')}").strip().lower()
+        if response != self.t("yes"):
+            return False
+        
+        self.create_backup()
+        
+        try:
+            self.write_config()
+            print(f"\n{self.t('changes_saved')}")
+            return True
+        except PermissionError:
+            print(f"\n{self.t('permission_denied')}")
+            return False
+        except Exception as e:
+            print(f"\n❌ Error saving config: {e}")
+            return False
+    
+    def get_setting(self, section, key, default=""):
+        """Get a setting value from config"""
+        # Pattern to find section and key (not interface subsections)
+        section_pattern = rf'\[{re.escape(section)}\]\s*\n(.*?)(?=\n\[[^\[]|\Z)'
+        section_match = re.search(section_pattern, self.config_content, re.DOTALL)
+        
+        if section_match:
+            section_content = section_match.group(1)
+            # Match key with optional leading whitespace
+            key_pattern = rf'^\s*{re.escape(key)}\s*=\s*(.+)$'
+            key_match = re.search(key_pattern, section_content, re.MULTILINE)
+            if key_match:
+                return key_match.group(1).strip()
+        
+        return default
+    
+    def set_setting(self, section, key, value):
+        """Set a setting value in config"""
+        # Check if section exists (but not [interfaces] subsections)
+        section_pattern = rf'(\[{re.escape(section)}\])(\s*\n)(.*?)(?=\n\[[^\[]|\Z)'
+        section_match = re.search(section_pattern, self.config_content, re.DOTALL)
+        
+        if section_match:
+            section_content = section_match.group(3)
+            # Match key with optional leading whitespace
+            key_pattern = rf'^(\s*)({re.escape(key)}\s*=\s*)(.+)$'
+            
+            if re.search(key_pattern, section_content, re.MULTILINE):
+                # Replace existing key, preserving indentation
+                new_section = re.sub(
+                    key_pattern,
+                    rf'\g<1>\g<2>{value}',
+                    section_content,
+                    flags=re.MULTILINE
+                )
+                self.config_content = self.config_content.replace(
+                    section_match.group(0),
+                    section_match.group(1) + section_match.group(2) + new_section
+                )
+            else:
+                # Add new key to section (no indentation for main sections)
+                section_end = section_match.group(0).rstrip()
+                new_content = section_end + f"\n{key} = {value}\n"
+                self.config_content = self.config_content.replace(
+                    section_match.group(0),
+                    new_content
+                )
+        else:
+            # Section doesn't exist, add it
+            self.config_content = self.config_content.rstrip() + f"\n\n[{section}]\n{key} = {value}\n"
+        
+        self.has_changes = True
+    
+    def apply_fixes(self, fixes):
+        """Apply the fixes of a list of lint diagnostics to the config in one pass"""
+        edits = [edit for diagnostic in fixes for edit in diagnostic["fix"]["edits"]]
+        self.config_content = apply_edits(self.config_content, edits)
+        self.has_changes = True
+        
+        for diagnostic in fixes:
+            message = FIX_MESSAGES.get(diagnostic["fix"]["action"])
+            if message:
+                print("  ✅ " + message.format_map({**diagnostic["params"], **diagnostic["fix"]}))
+    
+    def test_pending_config(self, test):
+        """Run test() with unsaved changes written to disk, restoring the file afterwards"""
+        original_on_disk = None
+        if self.config_content != self.original_content:
+            try:
+                if self.config_path.exists():
+                    with open(self.config_path, 'r') as f:
+                        original_on_disk = f.read()
+                atomic_write(self.config_path, self.config_content)
+            except Exception as e:
+                return None, f"Could not save for testing: {e}"
+        
+        try:
+            return test()
+        finally:
+            if original_on_disk is not None:
+                try:
+                    atomic_write(self.config_path, original_on_disk)
+                except OSError:
+                    pass
+
+
+def save_cli_changes(configurator, dry_run=False):
+    """Print what a command changed and write it with a backup unless dry_run"""
+    changed = configurator.config_content != configurator.original_content
+    changes = diff_configs(configurator.original_content, configurator.config_content)
+    for line in format_diff(changes) or (["  Formatting changes only"] if changed else ["No changes"]):
+        print(line)
+    if changed and not dry_run:
+        configurator.create_backup(verbose=False)
+        configurator.write_config()
+    return 0
+
+
+def cli_lint(configurator, args, target="reticulum"):
+    """Print lint diagnostics, exit 1 if any is an error"""
+    diagnostics = lint_config(configurator.config_content, target=target, config_dir=configurator.config_path.parent)
+    if args.json:
+        print(json.dumps(diagnostics, indent=2))
+    else:
+        for d in diagnostics:
+            fixable = " (fixable)" if d["fix"] else ""
+            print(f"{configurator.config_path}:{d['line']}:{d['column']}: {d['severity']} [{d['code']}] {d['message']}{fixable}")
+    return 1 if any(d["severity"] == "error" for d in diagnostics) else 0
+
+
+def cli_fix(configurator, args, target="reticulum"):
+    """Apply every automatic lint fix"""
+    diagnostics = lint_config(configurator.config_content, target=target, config_dir=configurator.config_path.parent)
+    edits = [edit for d in diagnostics if d["fix"] for edit in d["fix"]["edits"]]
+    configurator.config_content = apply_edits(configurator.config_content, edits)
+    return save_cli_changes(configurator, args.dry_run)
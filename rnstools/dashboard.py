@@ -0,0 +1,103 @@
+"""Per-interface traffic statistics from the running rnsd instance"""
+
+import json
+import subprocess
+
+
+DASHBOARD_INTERVAL = 2
+
+
+def format_bytes(count, suffix="B"):
+    """Human readable byte count, e.g. 1.2 KB"""
+    for unit in ["", "K", "M", "G", "T"]:
+        if abs(count) < 1000:
+            return f"{count:.1f} {unit}{suffix}" if unit else f"{count:.0f} {suffix}"
+        count /= 1000
+    return f"{count:.1f} P{suffix}"
+
+
+class InterfaceStatsSource:
+    """Reads interface statistics from the local rnsd shared instance
+    
+    Connects to the shared instance in-process when RNS is importable, and
+    falls back to parsing `rnstatus -j` output otherwise.
+    """
+    
+    def __init__(self, config_dir):
+        self.config_dir = str(config_dir)
+        self.reticulum = None
+        self.use_rnstatus = False
+    
+    def _connect(self):
+        """Attach to the shared instance, never starting interfaces of our own"""
+        try:
+            import RNS
+        except ImportError:
+            self.use_rnstatus = True
+            return
+        try:
+            self.reticulum = RNS.Reticulum(
+                configdir=self.config_dir,
+                loglevel=RNS.LOG_CRITICAL,
+                require_shared_instance=True
+            )
+        except Exception:
+            # Older RNS without require_shared_instance, or no instance running
+            self.use_rnstatus = True
+    
+    def fetch(self):
+        """Return the interface stats dict, or None if they cannot be read"""
+        if self.reticulum is None and not self.use_rnstatus:
+            self._connect()
+        
+        if self.reticulum is not None:
+            try:
+                return self.reticulum.get_interface_stats()
+            except Exception:
+                return None
+        
+        try:
+            result = subprocess.run(
+                ["rnstatus", "-a", "-j", "--config", self.config_dir],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            return json.loads(result.stdout)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            return None
+
+
+def interface_rates(previous, current, elapsed):
+    """Compute per-interface rx/tx rates in bytes/s between two stats snapshots"""
+    before = {}
+    if previous:
+        before = {iface["name"]: iface for iface in previous.get("interfaces", [])}
+    
+    rows = []
+    for iface in current.get("interfaces", []):
+        old = before.get(iface["name"])
+        if old is not None and elapsed > 0:
+            rx_rate = max(0, iface.get("rxb", 0) - old.get("rxb", 0)) / elapsed
+            tx_rate = max(0, iface.get("txb", 0) - old.get("txb", 0)) / elapsed
+        else:
+            rx_rate = tx_rate = None
+        
+        peers = iface.get("clients")
+        if peers is None:
+            peers = iface.get("peers")
+        
+        rows.append({
+            "name": iface.get("short_name") or iface["name"],
+            "up": bool(iface.get("status")),
+            "rx_rate": rx_rate,
+            "tx_rate": tx_rate,
+            "rxb": iface.get("rxb", 0),
+            "txb": iface.get("txb", 0),
+            "announces_in": (iface.get("incoming_announce_frequency") or 0) * 60,
+            "announces_out": (iface.get("outgoing_announce_frequency") or 0) * 60,
+            "peers": peers,
+        })
+    
+    rows.sort(key=lambda r: ((r["rx_rate"] or 0) + (r["tx_rate"] or 0), r["rxb"] + r["txb"]), reverse=True)
+    return rows
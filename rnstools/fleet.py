@@ -0,0 +1,148 @@
+"""Apply the same changes to many config files in parallel"""
+
+import os
+import sys
+import argparse
+from pathlib import Path
+
+from rnstools.configdiff import apply_patch, load_patch
+from rnstools.reticulum import ReticulumConfigurator, interface_section
+from rnstools.schema import same_config_value
+
+
+FLEET_WORKERS = 16
+
+
+def expand_config_paths(patterns, list_file=None):
+    """Resolve globs, directories and list files into unique config file paths"""
+    import glob
+    entries = list(patterns)
+    if list_file:
+        with open(list_file, 'r') as f:
+            entries.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    
+    paths = []
+    seen = set()
+    for entry in entries:
+        matches = glob.glob(os.path.expanduser(entry), recursive=True) or [os.path.expanduser(entry)]
+        for match in sorted(matches):
+            path = Path(match)
+            if path.is_dir():
+                path = path / "config"
+            key = str(path.resolve())
+            if key not in seen:
+                seen.add(key)
+                paths.append(path)
+    return paths
+
+
+class FleetOperationAction(argparse.Action):
+    """Append (operation, *values) to one list shared by all operation options"""
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, getattr(namespace, self.dest) + [(self.const, *values)])
+
+
+def apply_operation(configurator, operation):
+    """Apply one fleet operation tuple to a configurator, return True if it changed the config"""
+    op = operation[0]
+    before = configurator.config_content
+    names = [iface["name"] for iface in configurator.parse_interfaces()]
+    if op == "add_tcp":
+        configurator.add_tcp_interface(*operation[1:])
+    elif op == "set":
+        section, key, value = operation[1:]
+        name = interface_section(section)
+        if name:
+            iface = next((i for i in configurator.parse_interfaces() if i["name"] == name), None)
+            if iface and not same_config_value(iface["properties"].get(key), value):
+                configurator.set_interface_property(name, key, value)
+        elif not same_config_value(configurator.get_setting(section, key, None), value):
+            configurator.set_setting(section, key, value)
+    elif op == "toggle":
+        name, state = operation[1:]
+        if name in names:
+            configurator.toggle_interface(name, state in ["on", "yes", "true", "enable"])
+    elif op == "remove":
+        if operation[1] in names:
+            configurator.remove_interface(operation[1])
+    elif op == "profile":
+        configurator.apply_profile(operation[1])
+    elif op == "patch":
+        configurator.config_content = apply_patch(configurator.config_content, operation[1])
+    else:
+        raise ValueError(f"Unknown operation: {op}")
+    return configurator.config_content != before
+
+
+def fleet_apply_one(path, operations, dry_run=False):
+    """Apply the operations to one config file, return a summary dict"""
+    result = {"path": str(path), "status": "unchanged", "applied": 0, "backup": None, "error": None}
+    configurator = ReticulumConfigurator(config_path=path)
+    if not configurator.read_config():
+        result["status"] = "error"
+        result["error"] = "cannot read config"
+        return result
+    
+    try:
+        for operation in operations:
+            if apply_operation(configurator, operation):
+                result["applied"] += 1
+        
+        if configurator.config_content != configurator.original_content:
+            result["status"] = "would change" if dry_run else "changed"
+            if not dry_run:
+                backup = configurator.create_backup(verbose=False)
+                result["backup"] = str(backup) if backup else None
+                configurator.write_config()
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    return result
+
+
+def fleet_apply(paths, operations, workers=FLEET_WORKERS, dry_run=False):
+    """Apply the same operations to many config files concurrently"""
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda path: fleet_apply_one(path, operations, dry_run), paths))
+
+
+def print_fleet_summary(results):
+    """Print one line per config file and the totals"""
+    icons = {"changed": "✅", "would change": "📝", "unchanged": "➖", "error": "❌"}
+    width = min(60, max((len(r["path"]) for r in results), default=10))
+    print(f"  {'Config':<{width}} {'Status':<13} {'Ops':>4}  Backup / error")
+    for r in results:
+        detail = r["error"] or (Path(r["backup"]).name[:12] if r["backup"] else "")
+        print(f"{icons[r['status']]} {r['path'][-width:]:<{width}} {r['status']:<13} {r['applied']:>4}  {detail}")
+    
+    counts = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    print(f"\n  {len(results)} configs: " + ", ".join(f"{n} {status}" for status, n in counts.items()))
+
+
+def run_fleet(args):
+    """Handle the fleet command"""
+    operations = []
+    for operation in args.operations:
+        if operation[0] == "patch":
+            try:
+                operation = ("patch", load_patch(operation[1]))
+            except (OSError, ValueError) as e:
+                print(f"❌ {e}", file=sys.stderr)
+                return 1
+        operations.append(operation)
+    if not operations:
+        print("❌ No operation given (--add-tcp, --set, --toggle, --remove, --profile, --patch)", file=sys.stderr)
+        return 1
+    
+    paths = expand_config_paths(args.paths, args.list_file)
+    if not paths:
+        print("❌ No config files matched", file=sys.stderr)
+        return 1
+    
+    results = fleet_apply(paths, operations, args.workers, args.dry_run)
+    print_fleet_summary(results)
+    return 1 if any(r["status"] == "error" for r in results) else 0
@@ -0,0 +1,509 @@
+"""Interactive installer for the Reticulum packages"""
+
+import os
+import sys
+import time
+import subprocess
+import platform
+from pathlib import Path
+
+from rnstools.core import TerminalTool
+from rnstools.tui import get_screen
+
+
+PACKAGES = {
+    "1": {
+        "name": "rns",
+        "pip_name": "rns",
+        "display_name": "RNS (Reticulum Network Stack)",
+        "dependencies": [],
+        "order": 1,
+    },
+    "2": {
+        "name": "lxmf",
+        "pip_name": "lxmf",
+        "display_name": "LXMF",
+        "dependencies": ["rns"],
+        "order": 2,
+    },
+    "3": {
+        "name": "nomadnet",
+        "pip_name": "nomadnet",
+        "display_name": "NomadNet",
+        "dependencies": ["rns", "lxmf"],
+        "order": 3,
+    },
+    "4": {
+        "name": "sideband",
+        "pip_name": "sbapp",
+        "display_name": "Sideband",
+        "dependencies": ["rns", "lxmf"],
+        "order": 4,
+    },
+    "5": {
+        "name": "rnodeconf",
+        "pip_name": "rnodeconf",
+        "display_name": "RNode Configuration Tool",
+        "dependencies": ["rns"],
+        "order": 5,
+    },
+    "6": {
+        "name": "lxmf-tools",
+        "pip_name": "lxmf",
+        "display_name": "LXMF Tools",
+        "dependencies": ["rns", "lxmf"],
+        "extra_packages": ["lxmf"],
+        "order": 6,
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# INSTALLER CLASS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class ReticulumInstaller(TerminalTool):
+    TRANSLATIONS_MODULE = "installer"
+    
+    def __init__(self):
+        super().__init__()
+        self.installed_packages = []
+        self.failed_packages = []
+        self.python_cmd = sys.executable
+        self.pip_cmd = None
+        self.use_break_system_packages = False
+        self.use_user_install = False
+        
+    def print_slow(self, text, delay=0.02):
+        """Print text with a slight delay for visual effect"""
+        for char in text:
+            print(char, end='', flush=True)
+            time.sleep(delay)
+        print()
+    
+    def run_command(self, cmd, capture=True, show_output=False):
+        """Run a shell command and return result"""
+        try:
+            if show_output:
+                # The command writes straight to the terminal, past the screen
+                get_screen().invalidate()
+                result = subprocess.run(
+                    cmd,
+                    shell=True,
+                    text=True,
+                    capture_output=False
+                )
+                return result.returncode == 0, "", ""
+            else:
+                result = subprocess.run(
+                    cmd,
+                    shell=True,
+                    capture_output=True,
+                    text=True
+                )
+                return result.returncode == 0, result.stdout, result.stderr
+        except Exception as e:
+            return False, "", str(e)
+    
+    def show_welcome(self):
+        """Display welcome message"""
+        self.clear_screen()
+        print(self.t("welcome"))
+        input(f"  {self.t('press_enter')}")
+    
+    def check_system(self):
+        """Check system requirements"""
+        self.clear_screen()
+        print(f"\n{self.t('checking_system')}\n")
+        time.sleep(0.5)
+        
+        # System info
+        print(self.t("system_info"))
+        print(f"{self.t('os_label')} {platform.system()} {platform.release()}")
+        print(f"{self.t('python_version')} {platform.python_version()}")
+        
+        # Check pip
+        success, stdout, _ = self.run_command(f"{self.python_cmd} -m pip --version")
+        if success:
+            pip_version = stdout.split()[1] if stdout else "Unknown"
+            print(f"{self.t('pip_version')} {pip_version}")
+            self.pip_cmd = f"{self.python_cmd} -m pip"
+        else:
+            print(f"\n{self.t('installing_pip')}")
+            self.run_command(f"{self.python_cmd} -m ensurepip --upgrade")
+            self.pip_cmd = f"{self.python_cmd} -m pip"
+        
+        print()
+        
+        # Check if running as root
+        if os.geteuid() == 0 if hasattr(os, 'geteuid') else False:
+            response = input(self.t("root_warning")).strip().lower()
+            if response != self.t("yes"):
+                print(f"\n{self.t('goodbye')}")
+                sys.exit(0)
+        
+        # Check for externally managed environment (PEP 668)
+        self._check_externally_managed()
+        
+        input(f"\n  {self.t('press_enter')}")
+    
+    def _check_externally_managed(self):
+        """Check if we're in an externally managed environment (PEP 668)"""
+        import sysconfig
+        externally_managed = False
+        detected_method = ""
+        
+        print(f"\n  🔍 Checking Python environment...")
+        
+        # Method 1: Check for EXTERNALLY-MANAGED marker file in stdlib
+        try:
+            stdlib_path = sysconfig.get_path('stdlib')
+            if stdlib_path:
+                # Check in stdlib directory
+                marker_file = Path(stdlib_path) / "EXTERNALLY-MANAGED"
+                if marker_file.exists():
+                    externally_managed = True
+                    detected_method = f"marker file: {marker_file}"
+                
+                # Also check parent directory
+                if not externally_managed:
+                    marker_file = Path(stdlib_path).parent / "EXTERNALLY-MANAGED"
+                    if marker_file.exists():
+                        externally_managed = True
+                        detected_method = f"marker file: {marker_file}"
+        except Exception:
+            pass
+        
+        # Method 2: Check common Linux distribution paths
+        if not externally_managed:
+            py_ver = f"{sys.version_info.major}.{sys.version_info.minor}"
+            common_paths = [
+                Path(f"/usr/lib/python{py_ver}/EXTERNALLY-MANAGED"),
+                Path(f"/usr/lib/python3/EXTERNALLY-MANAGED"),
+                Path(f"/usr/lib64/python{py_ver}/EXTERNALLY-MANAGED"),
+                Path("/usr/lib/python3/dist-packages/EXTERNALLY-MANAGED"),
+                Path(f"/usr/lib/python{py_ver}/dist-packages/EXTERNALLY-MANAGED"),
+            ]
+            for path in common_paths:
+                if path.exists():
+                    externally_managed = True
+                    detected_method = f"marker file: {path}"
+                    break
+        
+        # Method 3: Try actual pip command to detect the error
+        if not externally_managed:
+            # Run pip install with dry-run to see if it would fail
+            try:
+                result = subprocess.run(
+                    [sys.executable, "-m", "pip", "install", "--dry-run", "pip"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+                combined = (result.stdout + result.stderr).lower()
+                if "externally-managed-environment" in combined or "externally managed" in combined:
+                    externally_managed = True
+                    detected_method = "pip dry-run test"
+            except Exception:
+                pass
+        
+        # Method 4: Check for Debian/Ubuntu specific indicator
+        if not externally_managed:
+            try:
+                # On Debian/Ubuntu with PEP 668, pip shows this in config
+                result = subprocess.run(
+                    [sys.executable, "-m", "pip", "config", "list"],
+                    capture_output=True,
+                    text=True,
+                    timeout=10
+                )
+                # Also check if running on a system Python that's managed
+                if platform.system() == "Linux":
+                    # Check if we're using system Python (not venv/pyenv)
+                    if not hasattr(sys, 'real_prefix') and not (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
+                        # System Python - check for common managed distros
+                        distro_files = ["/etc/debian_version", "/etc/ubuntu_version", "/etc/fedora-release"]
+                        for df in distro_files:
+                            if Path(df).exists():
+                                # Likely a managed system, do a real test
+                                py_ver = f"{sys.version_info.major}.{sys.version_info.minor}"
+                                if Path(f"/usr/lib/python{py_ver}/EXTERNALLY-MANAGED").exists():
+                                    externally_managed = True
+                                    detected_method = "distribution check"
+                                    break
+            except Exception:
+                pass
+        
+        # Apply the detection result
+        if externally_managed:
+            print(f"\n  ⚠️  Detected externally managed environment (PEP 668)")
+            print(f"     Detection: {detected_method}")
+            print(f"  {self.t('attempting_break_packages')}")
+            self.use_break_system_packages = True
+        else:
+            print(f"  ✅ Standard Python environment detected")
+            
+            # Check for permission issues (non-root without externally managed)
+            if hasattr(os, 'geteuid') and os.geteuid() != 0:
+                try:
+                    site_packages = sysconfig.get_path('purelib')
+                    if site_packages and not os.access(site_packages, os.W_OK):
+                        print(f"\n  ℹ️  No write access to system packages")
+                        print(f"  {self.t('attempting_user_install')}")
+                        self.use_user_install = True
+                except Exception:
+                    pass
+    
+    def get_pip_install_cmd(self, package):
+        """Get the appropriate pip install command with all necessary flags"""
+        cmd = f"{self.pip_cmd} install --upgrade {package}"
+        
+        if self.use_break_system_packages:
+            cmd += " --break-system-packages"
+        
+        if self.use_user_install:
+            cmd += " --user"
+        
+        return cmd
+    
+    def check_package_installed(self, pip_name):
+        """Check if a package is already installed"""
+        success, stdout, _ = self.run_command(f"{self.pip_cmd} show {pip_name}")
+        if success:
+            # Extract version
+            for line in stdout.split('\n'):
+                if line.startswith('Version:'):
+                    return True, line.split(':')[1].strip()
+        return False, None
+    
+    def upgrade_pip(self):
+        """Upgrade pip to latest version"""
+        print(f"\n{self.t('upgrading_pip')}")
+        cmd = self.get_pip_install_cmd("pip")
+        success, _, stderr = self.run_command(cmd, show_output=True)
+        if success:
+            print(self.t("pip_upgraded"))
+        return success
+    
+    def select_packages(self):
+        """Display package selection menu and get user choices"""
+        while True:
+            self.clear_screen()
+            print(self.t("select_packages"))
+            
+            # Show currently installed packages
+            print(f"\n{self.t('checking_installed')}")
+            for key, pkg in PACKAGES.items():
+                installed, version = self.check_package_installed(pkg["pip_name"])
+                if installed:
+                    print(f"  {self.t('already_installed')} {pkg['display_name']} (v{version})")
+            
+            print()
+            choice = input(self.t("enter_choice")).strip().upper()
+            
+            if choice == 'Q':
+                print(f"\n{self.t('goodbye')}")
+                sys.exit(0)
+            elif choice == 'A':
+                return list(PACKAGES.keys())
+            elif choice in PACKAGES:
+                return [choice]
+            elif ',' in choice:
+                # Allow multiple selections like "1,2,3"
+                selections = [c.strip() for c in choice.split(',')]
+                if all(s in PACKAGES for s in selections):
+                    return selections
+            
+            print(f"\n{self.t('invalid_choice')}")
+            time.sleep(1)
+    
+    def resolve_dependencies(self, selected_keys):
+        """Resolve package dependencies and return installation order"""
+        packages_to_install = set()
+        
+        for key in selected_keys:
+            pkg = PACKAGES[key]
+            packages_to_install.add(key)
+            
+            # Add dependencies
+            for dep in pkg["dependencies"]:
+                for k, p in PACKAGES.items():
+                    if p["name"] == dep or p["pip_name"] == dep:
+                        packages_to_install.add(k)
+        
+        # Sort by installation order
+        sorted_packages = sorted(
+            packages_to_install,
+            key=lambda k: PACKAGES[k]["order"]
+        )
+        
+        return sorted_packages
+    
+    def install_package(self, package_key):
+        """Install a single package with error handling and retries"""
+        pkg = PACKAGES[package_key]
+        pip_name = pkg["pip_name"]
+        display_name = pkg["display_name"]
+        
+        print(f"\n{'─' * 60}")
+        print(f"{self.t('installing')} {display_name}...")
+        print(f"{'─' * 60}")
+        
+        # Check if already installed
+        installed, version = self.check_package_installed(pip_name)
+        if installed:
+            print(f"  {self.t('already_installed')} {display_name} (v{version})")
+        
+        # Install/upgrade the package
+        cmd = self.get_pip_install_cmd(pip_name)
+        
+        max_retries = 3
+        for attempt in range(max_retries):
+            print(f"\n  📥 {cmd}\n")
+            success, stdout, stderr = self.run_command(cmd, show_output=True)
+            
+            if success:
+                print(f"\n  {self.t('install_success')} {display_name}! ✅")
+                self.installed_packages.append(display_name)
+                return True
+            
+            # Handle errors
+            error_msg = stderr.lower() if stderr else ""
+            
+            if "externally-managed-environment" in error_msg:
+                print(f"\n  {self.t('attempting_break_packages')}")
+                self.use_break_system_packages = True
+                cmd = self.get_pip_install_cmd(pip_name)
+                continue
+            
+            if "permission" in error_msg:
+                print(f"\n  {self.t('attempting_user_install')}")
+                self.use_user_install = True
+                cmd = self.get_pip_install_cmd(pip_name)
+                continue
+            
+            if "network" in error_msg or "connection" in error_msg:
+                print(f"\n  {self.t('network_error')}")
+            
+            if attempt < max_retries - 1:
+                print(f"\n  {self.t('fix_attempting')}")
+                time.sleep(2)
+            else:
+                print(f"\n  {self.t('install_failed')} {display_name}")
+                print(f"  {self.t('error_details')}")
+                print(f"    {stderr[:200] if stderr else 'Unknown error'}")
+                self.failed_packages.append(display_name)
+                
+                retry = input(f"\n  {self.t('retry_prompt')}").strip().lower()
+                if retry == self.t("yes"):
+                    return self.install_package(package_key)
+                return False
+        
+        return False
+    
+    def install_packages(self, package_keys):
+        """Install all selected packages"""
+        self.clear_screen()
+        
+        # Resolve dependencies
+        install_order = self.resolve_dependencies(package_keys)
+        
+        print(f"\n{self.t('install_order')}")
+        for i, key in enumerate(install_order, 1):
+            pkg = PACKAGES[key]
+            print(f"  {i}. {pkg['display_name']}")
+        
+        print()
+        confirm = input(self.t("confirm_install")).strip().lower()
+        if confirm != self.t("yes"):
+            return
+        
+        # Upgrade pip first
+        self.upgrade_pip()
+        
+        # Install packages
+        start_time = time.time()
+        total = len(install_order)
+        
+        for i, key in enumerate(install_order, 1):
+            pkg = PACKAGES[key]
+            print(f"\n{'═' * 60}")
+            print(f"  {self.t('step')} {i} {self.t('of')} {total}: {pkg['display_name']}")
+            print(f"{'═' * 60}")
+            
+            self.install_package(key)
+        
+        # Calculate total time
+        elapsed = time.time() - start_time
+        if elapsed > 60:
+            time_str = f"{elapsed/60:.1f} {self.t('minutes')}"
+        else:
+            time_str = f"{elapsed:.0f} {self.t('seconds')}"
+        
+        # Show completion summary
+        self.show_completion_summary(time_str)
+    
+    def show_completion_summary(self, time_str):
+        """Show installation completion summary"""
+        self.clear_screen()
+        print(self.t("installation_complete"))
+        
+        if self.installed_packages:
+            print(f"{self.t('installed_packages')}")
+            for pkg in self.installed_packages:
+                print(f"  ✅ {pkg}")
+        
+        if self.failed_packages:
+            print(f"\n❌ Failed packages:")
+            for pkg in self.failed_packages:
+                print(f"  ❌ {pkg}")
+        
+        print(f"\n{self.t('total_time')} {time_str}")
+        print(self.t("getting_started"))
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def run(self):
+        """Main installer loop"""
+        try:
+            self.select_language()
+            self.show_welcome()
+            self.check_system()
+            
+            while True:
+                selected = self.select_packages()
+                if selected:
+                    self.install_packages(selected)
+                    
+                    # Ask if user wants to install more
+                    self.clear_screen()
+                    print(f"\n{self.t('main_menu')}")
+                    again = input(f"\n  Install more packages? ({self.t('yes')}/{self.t('no')}): ").strip().lower()
+                    if again != self.t("yes"):
+                        break
+            
+            print(f"\n{self.t('goodbye')}\n")
+            
+        except KeyboardInterrupt:
+            print(f"\n\n{self.t('goodbye')}\n")
+            sys.exit(0)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAIN ENTRY POINT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    # Check Python version
+    if sys.version_info < (3, 7):
+        print("❌ Error: Python 3.7 or higher is required.")
+        print(f"   Your version: Python {sys.version_info.major}.{sys.version_info.minor}")
+        sys.exit(1)
+    
+    installer = ReticulumInstaller()
+    installer.run()
+
+
+if __name__ == "__main__":
+    main()
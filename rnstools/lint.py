@@ -0,0 +1,470 @@
+"""Single-pass, rule-based config linter with machine-applicable fixes"""
+
+import re
+from pathlib import Path
+
+from rnstools.configdiff import format_section_path
+from rnstools.lora import interface_lora_report
+from rnstools.ports import check_port_conflicts, config_bindings
+from rnstools.schema import (
+    CONFIGOBJ_BOOL_VALUES,
+    INTERFACE_REQUIRED_KEYS,
+    RETICULUM_BOOL_KEYS,
+    RETICULUM_INT_KEYS,
+    check_interface_value,
+    config_value,
+)
+
+
+LINT_RULES = {}  # target ("reticulum", "nomadnet") -> {code: rule class}
+
+HEADER_LINE = re.compile(r'(\[+)\s*([^\[\]]*?)\s*(\]*)\s*(?:#.*)?$')
+
+REQUIRED_SECTIONS = {
+    "reticulum": ["enable_transport = No", "share_instance = Yes"],
+    "logging": ["loglevel = 4"],
+    "interfaces": ["", "  [[Default Interface]]", "    type = AutoInterface", "    enabled = yes"],
+}
+
+
+# Translation keys for diagnostics the menus have localized text for
+LINT_MESSAGE_KEYS = {
+    "missing-section": "issue_section_missing",
+    "interface-indent": "issue_bad_indentation",
+    "empty-interfaces": "issue_empty_section",
+    "duplicate-interface": "issue_duplicate_interface",
+    "invalid-value": "issue_invalid_value",
+    "interface-type": "issue_key_missing",
+    "interface-value": "issue_invalid_value",
+}
+
+# Rules whose errors make rnsd refuse to load the config. interface-value is
+# left out: the schema may lag behind what the installed RNS accepts.
+VALIDATION_LINT_CODES = ["syntax", "duplicate-interface", "duplicate-key", "invalid-value", "interface-type"]
+
+# What each fix action did, filled in from the diagnostic params and fix
+FIX_MESSAGES = {
+    "add_section": "Added [{section}] section",
+    "fix_indentation": "Fixed indentation for [[{name}]]",
+    "add_default_interface": "Added default AutoInterface",
+    "remove_duplicate": "Removed duplicate [[{name}]]",
+    "remove_duplicate_key": "Removed duplicate {key} in {section}",
+    "fix_setting": "Fixed {key}: set to {value}",
+}
+
+
+def register_lint_rule(rule_class):
+    """Add a rule class to the registry of its target config, used as a class decorator"""
+    LINT_RULES.setdefault(rule_class.target, {})[rule_class.code] = rule_class
+    return rule_class
+
+
+class LintRule:
+    """Base class for lint rules, subclasses override only the hooks they need"""
+    code = ""
+    severity = "warning"
+    target = "reticulum"
+    
+    def section(self, ctx, section):
+        """Called for every section header"""
+    
+    def key(self, ctx, section, entry):
+        """Called for every key = value line"""
+    
+    def other(self, ctx, number, line):
+        """Called for lines that are neither blank, comment, header nor key"""
+    
+    def section_end(self, ctx, section):
+        """Called when a section and its subsections are complete"""
+    
+    def finish(self, ctx):
+        """Called once after the last line"""
+
+
+class LintContext:
+    """State shared by the rules during one pass over a config"""
+    
+    def __init__(self, content, config_dir=None):
+        self.lines = content.split('\n')
+        self.config_dir = Path(config_dir) if config_dir else None
+        self.root = {
+            "path": (), "name": "", "depth": 0, "line": -1, "indent": "",
+            "keys": {}, "duplicate_keys": [], "children": {}, "end": len(self.lines), "duplicate": False,
+        }
+        self.diagnostics = []
+    
+    def report(self, rule, number, column, message, params=None, fix=None):
+        """Record a diagnostic for a 0-based line number and 1-based column"""
+        self.diagnostics.append({
+            "code": rule.code,
+            "severity": rule.severity,
+            "line": number + 1,
+            "column": column,
+            "message": message,
+            "params": params or {},
+            "fix": fix,
+        })
+
+
+def lint_config(content, target="reticulum", config_dir=None, codes=None):
+    """Run the registered rules over a config in one pass, return diagnostics sorted by position"""
+    rules = [cls() for code, cls in LINT_RULES.get(target, {}).items() if codes is None or code in codes]
+    hooks = {
+        name: [getattr(rule, name) for rule in rules if getattr(type(rule), name) is not getattr(LintRule, name)]
+        for name in ["section", "key", "other", "section_end", "finish"]
+    }
+    section_hooks, key_hooks, other_hooks, end_hooks = (hooks[name] for name in ["section", "key", "other", "section_end"])
+    ctx = LintContext(content, config_dir)
+    stack = [ctx.root]
+    section = ctx.root
+    
+    def close(depth, end):
+        while len(stack) > depth:
+            done = stack.pop()
+            done["end"] = end
+            for hook in end_hooks:
+                hook(ctx, done)
+    
+    for number, line in enumerate(ctx.lines):
+        stripped = line.lstrip()
+        if not stripped or stripped[0] == '#':
+            continue
+        indent = line[:len(line) - len(stripped)]
+        
+        if stripped[0] == '[':
+            match = HEADER_LINE.match(stripped)
+            depth = len(match.group(1)) if match else 0
+            if not match or not match.group(2) or len(match.group(3)) != depth or depth > len(stack):
+                for hook in other_hooks:
+                    hook(ctx, number, line)
+                continue
+            close(depth, number)
+            parent = stack[-1]
+            name = match.group(2)
+            section = {
+                "path": parent["path"] + (name,), "name": name, "depth": depth, "line": number,
+                "indent": indent, "keys": {}, "duplicate_keys": [], "children": {}, "end": len(ctx.lines),
+                "duplicate": name in parent["children"],
+            }
+            parent["children"].setdefault(name, section)
+            stack.append(section)
+            for hook in section_hooks:
+                hook(ctx, section)
+            continue
+        
+        key, sep, value = stripped.partition('=')
+        key = key.rstrip()
+        if not sep or not key:
+            for hook in other_hooks:
+                hook(ctx, number, line)
+            continue
+        
+        section = stack[-1]
+        keys = section["keys"]
+        # Rules see the value as ConfigObj hands it to rnsd, without inline comment or quotes
+        entry = {"key": key, "value": config_value(value), "line": number, "indent": indent}
+        if key in keys:
+            section["duplicate_keys"].append(entry)
+        else:
+            keys[key] = entry
+        for hook in key_hooks:
+            hook(ctx, section, entry)
+    
+    close(0, len(ctx.lines))
+    for hook in hooks["finish"]:
+        hook(ctx)
+    
+    ctx.diagnostics.sort(key=lambda d: (d["line"], d["column"]))
+    return ctx.diagnostics
+
+
+def apply_edits(content, edits):
+    """Apply line edits from lint fixes in one linear rewrite
+
+    Edits refer to line numbers of the original text, so any number of fixes
+    can be applied together. Where edits overlap, the one that deletes more
+    lines wins and the others are dropped; pure insertions are always kept.
+    """
+    lines = content.split('\n')
+    output = []
+    cursor = 0
+    for edit in sorted(edits, key=lambda e: (e["line"], e["delete"] > 0, -e["delete"], bool(e["insert"]))):
+        if edit["line"] < cursor:
+            if not edit["delete"]:
+                output.extend(edit["insert"])
+            continue
+        output.extend(lines[cursor:edit["line"]])
+        output.extend(edit["insert"])
+        cursor = edit["line"] + edit["delete"]
+    output.extend(lines[cursor:])
+    return '\n'.join(output)
+
+
+def last_content_line(lines, start, end):
+    """Index of the last non-blank line in lines[start:end], or start"""
+    number = end - 1
+    while number > start and not lines[number].strip():
+        number -= 1
+    return number
+
+
+@register_lint_rule
+class MissingSectionRule(LintRule):
+    """[reticulum], [logging] and [interfaces] must exist"""
+    code = "missing-section"
+    severity = "error"
+    
+    def finish(self, ctx):
+        end = last_content_line(ctx.lines, -1, len(ctx.lines)) + 1
+        for name, body in REQUIRED_SECTIONS.items():
+            if name not in ctx.root["children"]:
+                ctx.report(self, max(end - 1, 0), 1, f"Missing required section: [{name}]", {"section": name}, {
+                    "action": "add_section",
+                    "edits": [{"line": end, "delete": 0, "insert": ["", f"[{name}]"] + body}],
+                })
+
+
+@register_lint_rule
+class InterfaceIndentRule(LintRule):
+    """Interfaces use 2 spaces before [[name]] and 4 before their keys"""
+    code = "interface-indent"
+    
+    def __init__(self):
+        self.bad = {}
+    
+    def section(self, ctx, section):
+        if section["path"][0] != "interfaces" or section["depth"] < 2:
+            section["key_indent"] = None
+            return
+        section["key_indent"] = " " * (2 * section["depth"])
+        expected = " " * (2 * section["depth"] - 2)
+        if section["indent"] != expected:
+            self.bad.setdefault(section["path"][:2], []).append((section["line"], expected + ctx.lines[section["line"]].strip()))
+    
+    def key(self, ctx, section, entry):
+        expected = section.get("key_indent")
+        if expected is not None and entry["indent"] != expected:
+            self.bad.setdefault(section["path"][:2], []).append((entry["line"], expected + ctx.lines[entry["line"]].strip()))
+    
+    def section_end(self, ctx, section):
+        bad = self.bad.pop(section["path"], None) if section["depth"] == 2 else None
+        if bad:
+            ctx.report(self, bad[0][0], 1, f"Bad indentation in interface '{section['name']}'", {"name": section["name"]}, {
+                "action": "fix_indentation",
+                "edits": [{"line": number, "delete": 1, "insert": [text]} for number, text in bad],
+            })
+
+
+@register_lint_rule
+class EmptyInterfacesRule(LintRule):
+    """[interfaces] needs at least one interface"""
+    code = "empty-interfaces"
+    
+    def section_end(self, ctx, section):
+        if section["path"] == ("interfaces",) and not section["children"]:
+            ctx.report(self, section["line"], len(section["indent"]) + 1, "Empty [interfaces] section", fix={
+                "action": "add_default_interface",
+                "edits": [{"line": section["line"] + 1, "delete": 0, "insert": REQUIRED_SECTIONS["interfaces"][:]}],
+            })
+
+
+@register_lint_rule
+class DuplicateInterfaceRule(LintRule):
+    """Interface names must be unique, rnsd refuses duplicates"""
+    code = "duplicate-interface"
+    severity = "error"
+    
+    def section_end(self, ctx, section):
+        if section["duplicate"] and section["path"][:1] == ("interfaces",) and section["depth"] == 2:
+            ctx.report(self, section["line"], len(section["indent"]) + 1, f"Duplicate interface: {section['name']}", {"name": section["name"]}, {
+                "action": "remove_duplicate",
+                "edits": [{"line": section["line"], "delete": section["end"] - section["line"], "insert": []}],
+            })
+
+
+@register_lint_rule
+class DuplicateKeyRule(LintRule):
+    """A key may appear only once per section"""
+    code = "duplicate-key"
+    severity = "error"
+    
+    def section_end(self, ctx, section):
+        for entry in section["duplicate_keys"]:
+            where = format_section_path(section["path"])
+            ctx.report(self, entry["line"], len(entry["indent"]) + 1, f"Duplicate key '{entry['key']}' in {where}",
+                       {"key": entry["key"], "section": where}, {
+                           "action": "remove_duplicate_key",
+                           "edits": [{"line": entry["line"], "delete": 1, "insert": []}],
+                       })
+
+
+@register_lint_rule
+class SyntaxRule(LintRule):
+    """Lines must be a comment, a [section] header or key = value"""
+    code = "syntax"
+    severity = "error"
+    
+    def other(self, ctx, number, line):
+        stripped = line.strip()
+        if stripped.startswith('['):
+            message = f"Malformed or too deeply nested section header: {stripped}"
+        else:
+            message = f"Expected 'key = value': {stripped}"
+        ctx.report(self, number, len(line) - len(line.lstrip()) + 1, message)
+
+
+@register_lint_rule
+class SettingValueRule(LintRule):
+    """[reticulum] flags and ports and [logging] loglevel must parse as rnsd expects"""
+    code = "invalid-value"
+    severity = "error"
+    
+    def section_end(self, ctx, section):
+        if section["path"] == ("reticulum",):
+            checks = [(key, "bool") for key in RETICULUM_BOOL_KEYS] + [(key, "int") for key in RETICULUM_INT_KEYS]
+        elif section["path"] == ("logging",):
+            checks = [("loglevel", "int")]
+        else:
+            return
+        
+        for key, kind in checks:
+            entry = section["keys"].get(key)
+            if entry is None:
+                continue
+            value = entry["value"]
+            valid = value.lower() in CONFIGOBJ_BOOL_VALUES if kind == "bool" else value.lstrip("-").isdigit()
+            if not valid:
+                line = ctx.lines[entry["line"]]
+                after = line[line.index("=") + 1:]
+                column = len(line) - len(after.lstrip()) + 1
+                ctx.report(self, entry["line"], column, f"Invalid value for '{key}': {value}", {"key": key, "value": value})
+
+
+@register_lint_rule
+class InterfaceTypeRule(LintRule):
+    """Every interface needs a known type and, when enabled, that type's required keys"""
+    code = "interface-type"
+    severity = "error"
+    
+    def section_end(self, ctx, section):
+        if section["path"][:1] != ("interfaces",) or section["depth"] != 2:
+            return
+        keys = section["keys"]
+        name = section["name"]
+        column = len(section["indent"]) + 1
+        if "type" not in keys:
+            ctx.report(self, section["line"], column, f"Interface '{name}' has no type", {"key": "type", "section": name})
+            return
+        
+        iface_type = keys["type"]["value"]
+        if iface_type not in INTERFACE_REQUIRED_KEYS:
+            # rnsd also loads custom interface types from <configdir>/interfaces
+            if not ctx.config_dir or not (ctx.config_dir / "interfaces" / f"{iface_type}.py").exists():
+                ctx.report(self, keys["type"]["line"], len(keys["type"]["indent"]) + 1,
+                           f"Unknown interface type '{iface_type}' in '{name}'")
+            return
+        
+        enabled = keys.get("enabled", keys.get("interface_enabled"))
+        if not enabled or enabled["value"].lower() not in ["yes", "true"]:
+            return
+        for alternatives in INTERFACE_REQUIRED_KEYS[iface_type]:
+            if not any(key in keys for key in alternatives):
+                ctx.report(self, section["line"], column, f"Interface '{name}' ({iface_type}) is missing '{alternatives[0]}'",
+                           {"key": alternatives[0], "section": name})
+
+
+@register_lint_rule
+class InterfaceValueRule(LintRule):
+    """Interface keys must have the type and range the interface type's schema gives them"""
+    code = "interface-value"
+    
+    def section_end(self, ctx, section):
+        if section["path"][:1] != ("interfaces",) or section["depth"] != 2:
+            return
+        keys = section["keys"]
+        if "type" not in keys:
+            return
+        iface_type = keys["type"]["value"]
+        for key, entry in keys.items():
+            problem = check_interface_value(iface_type, key, entry["value"])
+            if problem:
+                value = entry["value"]
+                line = ctx.lines[entry["line"]]
+                after = line[line.index("=") + 1:]
+                ctx.report(self, entry["line"], len(line) - len(after.lstrip()) + 1,
+                           f"Interface '{section['name']}': {key} {problem}, got '{value}'", {"key": key, "value": value})
+
+
+@register_lint_rule
+class LoraAirtimeRule(LintRule):
+    """RNode radio settings must leave a usable link: short enough packets and duty cycle headroom"""
+    code = "lora-airtime"
+    
+    def section_end(self, ctx, section):
+        if section["path"][:1] != ("interfaces",) or section["depth"] != 2:
+            return
+        keys = section["keys"]
+        if "type" not in keys or keys["type"]["value"] != "RNodeInterface":
+            return
+        report = interface_lora_report({key: entry["value"] for key, entry in keys.items()})
+        if report is None:
+            return
+        for issue in report["issues"]:
+            if issue["severity"] == "warning":
+                ctx.report(self, section["line"], len(section["indent"]) + 1,
+                           f"Interface '{section['name']}': {issue['message']}", {"name": section["name"]})
+
+
+class PortRule(LintRule):
+    """Shared part of the port rules: collects the sections, checks the ports once per pass"""
+    
+    def __init__(self):
+        self.sections = {}
+    
+    def section_end(self, ctx, section):
+        if section["path"] == ("reticulum",) or (section["path"][:1] == ("interfaces",) and section["depth"] == 2):
+            self.sections.setdefault(section["path"], section)
+    
+    def port_issues(self, ctx):
+        if not hasattr(ctx, "port_issues"):
+            reticulum = self.sections.get(("reticulum",))
+            interfaces = {path[1]: section for path, section in self.sections.items() if path[0] == "interfaces"}
+            bindings = config_bindings(
+                {key: entry["value"] for key, entry in reticulum["keys"].items()} if reticulum else {},
+                {name: {key: entry["value"] for key, entry in section["keys"].items()} for name, section in interfaces.items()},
+            )
+            ctx.port_issues = check_port_conflicts(bindings, config_dir=ctx.config_dir)
+        return ctx.port_issues
+    
+    def finish(self, ctx):
+        for issue in self.port_issues(ctx):
+            if issue["code"] != self.code:
+                continue
+            binding = issue["binding"]
+            section = self.sections.get(binding["section"])
+            if section is None:
+                continue
+            entry = section["keys"].get(binding["key"])
+            line, column = (entry["line"], len(entry["indent"]) + 1) if entry else (section["line"], len(section["indent"]) + 1)
+            suggestion = issue["suggestion"]
+            message = issue["message"] if suggestion is None else f"{issue['message']}, {suggestion} is free"
+            fix = None
+            if suggestion is not None and issue["fixable"]:
+                if entry:
+                    edit = {"line": entry["line"], "delete": 1, "insert": [f"{entry['indent']}{entry['key']} = {suggestion}"]}
+                else:
+                    edit = {"line": section["line"] + 1, "delete": 0, "insert": [f"{binding['key']} = {suggestion}"]}
+                fix = {"action": "fix_setting", "value": suggestion, "edits": [edit]}
+            ctx.report(self, line, column, message, {"key": binding["key"], "port": binding["port"]}, fix)
+
+
+@register_lint_rule
+class PortClashRule(PortRule):
+    """A port the config listens on must not be used twice in the config"""
+    code = "port-clash"
+
+
+@register_lint_rule
+class PortInUseRule(PortRule):
+    """Ports the config listens on must be free on this host, unless its own rnsd holds them"""
+    code = "port-in-use"
@@ -0,0 +1,158 @@
+"""LoRa time on air, throughput and duty cycle for RNode radio settings"""
+
+import math
+
+from rnstools.dashboard import format_bytes
+from rnstools.planner import ANNOUNCE_BYTES, lora_bitrate
+
+
+# Ranges RNodeInterface accepts for each radio setting
+LORA_LIMITS = {
+    "frequency": (137_000_000, 3_000_000_000),
+    "bandwidth": (7_800, 1_625_000),
+    "txpower": (0, 37),
+    "spreadingfactor": (5, 12),
+    "codingrate": (5, 8),
+}
+
+# RNode firmware framing: a preamble of about 24 ms but at least 18 symbols,
+# and a 1-byte header per frame; packets longer than one frame are split in two
+RNODE_PREAMBLE_TARGET_MS = 24
+RNODE_PREAMBLE_MIN_SYMBOLS = 18
+RNODE_PREAMBLE_HW_SYMBOLS = 4
+RNODE_HEADER_BYTES = 1
+RNODE_FRAME_BYTES = 255
+
+# Reticulum packets the report times
+LINK_REQUEST_BYTES = 86     # header + two public keys + link MTU signalling
+RETICULUM_MTU = 500
+LORA_REPORT_PACKETS = [
+    ("announce", ANNOUNCE_BYTES),
+    ("link request", LINK_REQUEST_BYTES),
+    ("full packet", RETICULUM_MTU),
+]
+
+# ETSI EN 300 220 sub-bands with a duty cycle limit: (from Hz, to Hz, percent)
+DUTY_CYCLE_BANDS = [
+    (433_050_000, 434_790_000, 10),
+    (863_000_000, 868_600_000, 1),
+    (868_700_000, 869_200_000, 0.1),
+    (869_400_000, 869_650_000, 10),
+    (869_700_000, 870_000_000, 1),
+]
+
+LORA_SLOW_PACKET_SECONDS = 6.0      # Reticulum's default per-hop timeout
+LORA_MIN_PACKETS_PER_HOUR = 60      # full packets the duty cycle must allow
+
+
+def symbol_time(spreadingfactor, bandwidth):
+    """Duration of one LoRa symbol in seconds"""
+    return 2 ** spreadingfactor / bandwidth
+
+
+def preamble_symbols(spreadingfactor, bandwidth):
+    """Preamble length RNode firmware uses for these settings"""
+    target = math.ceil(RNODE_PREAMBLE_TARGET_MS / 1000 / symbol_time(spreadingfactor, bandwidth))
+    return max(target - RNODE_PREAMBLE_HW_SYMBOLS, RNODE_PREAMBLE_MIN_SYMBOLS)
+
+
+def frame_airtime(payload_bytes, spreadingfactor, bandwidth, codingrate):
+    """Time on air of one frame with explicit header and CRC, per the Semtech formula"""
+    t_symbol = symbol_time(spreadingfactor, bandwidth)
+    # Low data rate optimization is switched on for symbols over 16 ms
+    low_data_rate = 1 if t_symbol > 0.016 else 0
+    bits = 8 * payload_bytes - 4 * spreadingfactor + 28 + 16
+    payload_symbols = 8 + max(math.ceil(bits / (4 * (spreadingfactor - 2 * low_data_rate))) * codingrate, 0)
+    return (preamble_symbols(spreadingfactor, bandwidth) + 4.25 + payload_symbols) * t_symbol
+
+
+def packet_airtime(packet_bytes, spreadingfactor, bandwidth, codingrate):
+    """Time on air of a Reticulum packet sent through an RNode, in seconds"""
+    per_frame = RNODE_FRAME_BYTES - RNODE_HEADER_BYTES
+    sizes = [min(per_frame, packet_bytes - offset) for offset in range(0, packet_bytes, per_frame)] or [0]
+    return sum(frame_airtime(size + RNODE_HEADER_BYTES, spreadingfactor, bandwidth, codingrate) for size in sizes)
+
+
+def duty_cycle_limit(frequency):
+    """Duty cycle limit in percent of the EU sub-band a frequency is in, or None"""
+    for low, high, percent in DUTY_CYCLE_BANDS:
+        if low <= frequency <= high:
+            return percent
+    return None
+
+
+def lora_link_report(spreadingfactor, bandwidth, codingrate, frequency=None, duty_cycle=None):
+    """Bitrate, time on air, throughput and usability issues of RNode radio settings
+
+    duty_cycle is the airtime limit in percent; without one, the limit of the
+    frequency's EU sub-band applies, if any. Issues are dicts with a severity,
+    a code and a message. Settings out of range give only an error issue.
+    """
+    settings = {"spreadingfactor": spreadingfactor, "bandwidth": bandwidth, "codingrate": codingrate}
+    if frequency is not None:
+        settings["frequency"] = frequency
+    report = dict(settings, bitrate=None, airtime={}, throughput=None, duty_cycle=None,
+                  duty_throughput=None, packets_per_hour=None, issues=[])
+    
+    for key, value in settings.items():
+        low, high = LORA_LIMITS[key]
+        if not low <= value <= high:
+            report["issues"].append({"severity": "error", "code": "out-of-range",
+                                     "message": f"{key} {value} is outside {low}-{high}"})
+    if report["issues"]:
+        return report
+    
+    report["bitrate"] = lora_bitrate(spreadingfactor, bandwidth, codingrate)
+    for label, size in LORA_REPORT_PACKETS:
+        report["airtime"][label] = packet_airtime(size, spreadingfactor, bandwidth, codingrate)
+    mtu_airtime = report["airtime"]["full packet"]
+    report["throughput"] = RETICULUM_MTU / mtu_airtime
+    
+    if duty_cycle is None and frequency is not None:
+        duty_cycle = duty_cycle_limit(frequency)
+    if duty_cycle is not None:
+        report["duty_cycle"] = duty_cycle
+        report["duty_throughput"] = report["throughput"] * duty_cycle / 100
+        report["packets_per_hour"] = 3600 * duty_cycle / 100 / mtu_airtime
+    
+    if mtu_airtime > LORA_SLOW_PACKET_SECONDS:
+        report["issues"].append({"severity": "warning", "code": "slow-packets",
+                                 "message": f"a full packet takes {mtu_airtime:.1f} s on air, "
+                                            f"links and transfers will stall or time out"})
+    if report["packets_per_hour"] is not None and report["packets_per_hour"] < LORA_MIN_PACKETS_PER_HOUR:
+        report["issues"].append({"severity": "warning", "code": "duty-cycle",
+                                 "message": f"the {duty_cycle:g}% duty cycle allows only "
+                                            f"{report['packets_per_hour']:.0f} full packets per hour"})
+    return report
+
+
+def format_lora_report(report):
+    """Render a lora_link_report() as text lines"""
+    lines = []
+    if report["bitrate"] is not None:
+        lines.append(f"Raw bitrate: {format_bytes(report['bitrate'], 'bps')} "
+                     f"(SF{report['spreadingfactor']}, {report['bandwidth'] / 1000:g} kHz, CR 4/{report['codingrate']})")
+        lines.append("Time on air:")
+        sizes = dict(LORA_REPORT_PACKETS)
+        for label, seconds in report["airtime"].items():
+            lines.append(f"  {label + f' ({sizes[label]} B)':<24} {seconds * 1000:>8.0f} ms")
+        throughput = f"Throughput: {format_bytes(report['throughput'] * 8, 'bps')}"
+        if report["duty_cycle"] is not None:
+            throughput += (f", {format_bytes(report['duty_throughput'] * 8, 'bps')} under a {report['duty_cycle']:g}% "
+                           f"duty cycle ({report['packets_per_hour']:.0f} full packets per hour)")
+        lines.append(throughput)
+    for issue in report["issues"]:
+        icon = "❌" if issue["severity"] == "error" else "⚠️ "
+        lines.append(f"{icon} {issue['message'][0].upper()}{issue['message'][1:]}")
+    return lines
+
+
+def interface_lora_report(properties):
+    """lora_link_report() for the properties of an RNodeInterface, None if they are incomplete"""
+    try:
+        values = [int(properties[key]) for key in ("spreadingfactor", "bandwidth", "codingrate")]
+        frequency = int(properties["frequency"]) if "frequency" in properties else None
+        duty_cycle = float(properties["airtime_limit_long"]) if "airtime_limit_long" in properties else None
+    except (KeyError, ValueError):
+        return None
+    return lora_link_report(*values, frequency=frequency, duty_cycle=duty_cycle)
@@ -0,0 +1,363 @@
+"""Public TCP nodes: the built-in list, the node directory, latency probes and health history"""
+
+import os
+import time
+import re
+import json
+import math
+import statistics
+import threading
+from array import array
+from pathlib import Path
+
+from rnstools.store import atomic_write
+
+
+TCP_INTERFACES = {
+    "rmap": {
+        "name": "RMAP.world",
+        "host": "rmap.world",
+        "port": "4242",
+        "description": "Reticulum Network Map - Community Hub"
+    },
+    "dublin": {
+        "name": "RNS Testnet Dublin",
+        "host": "dublin.connect.reticulum.network",
+        "port": "4965",
+        "description": "Official Dublin Testnet Hub"
+    },
+    "btb": {
+        "name": "RNS Testnet BetweenTheBorders",
+        "host": "reticulum.betweentheborders.com",
+        "port": "4242",
+        "description": "Community Hub - BetweenTheBorders"
+    },
+    "sydney": {
+        "name": "Sydney RNS",
+        "host": "sydney.reticulum.au",
+        "port": "4242",
+        "description": "Community Hub - Sydney Australia"
+    },
+    "germany": {
+        "name": "RNS TCP Node Germany",
+        "host": "202.61.243.41",
+        "port": "4965",
+        "description": "Community Hub - Germany"
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# TCP NODE LATENCY PROBE
+# ══════════════════════════════════════════════════════════════════════════════
+
+QUICK_CONNECT_COUNT = 3
+PROBE_SAMPLES = 4
+PROBE_TIMEOUT = 3.0
+PROBE_CONCURRENCY = 32      # nodes probed at the same time
+
+
+async def _resolve(host, port, timeout):
+    """First address of a host, so name lookups stay out of the connect timings"""
+    import asyncio
+    import socket
+    infos = await asyncio.wait_for(
+        asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM), timeout
+    )
+    return infos[0][4][0]
+
+
+async def _probe_connect(address, port, timeout):
+    """Open one TCP connection, return the connect time in ms or None if refused
+
+    A connection that does not complete in time raises asyncio.TimeoutError.
+    """
+    import asyncio
+    start = time.perf_counter()
+    try:
+        _, writer = await asyncio.wait_for(asyncio.open_connection(address, port), timeout)
+    except OSError:
+        return None
+    latency = (time.perf_counter() - start) * 1000
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+    return latency
+
+
+async def _probe_node(key, node, samples, timeout):
+    """Take several connect samples of one node and summarize them"""
+    import asyncio
+    latencies = []
+    try:
+        address = await _resolve(node["host"], int(node["port"]), timeout)
+        for _ in range(samples):
+            latency = await _probe_connect(address, int(node["port"]), timeout)
+            if latency is not None:
+                latencies.append(latency)
+    except (OSError, asyncio.TimeoutError):
+        pass  # a host that times out once would only do so again; the rest count as lost
+    
+    return {
+        "key": key,
+        "name": node["name"],
+        "host": node["host"],
+        "port": node["port"],
+        "reachable": bool(latencies),
+        "latency": statistics.median(latencies) if latencies else None,
+        "jitter": statistics.pstdev(latencies) if len(latencies) > 1 else 0.0,
+        "loss": 1 - len(latencies) / samples,
+    }
+
+
+def rank_probe_results(results):
+    """Order probe results: reachable first, then by loss, latency and jitter"""
+    def score(result):
+        if not result["reachable"]:
+            return (1, 1.0, 0.0)
+        return (0, result["loss"], result["latency"] + result["jitter"])
+    return sorted(results, key=score)
+
+
+def probe_tcp_nodes(nodes, samples=PROBE_SAMPLES, timeout=PROBE_TIMEOUT):
+    """Probe all nodes concurrently and return the results ranked fastest first
+    
+    nodes is a dict shaped like TCP_INTERFACES: key -> {"name", "host", "port"}.
+    """
+    # Imported here so the command line stays fast for everything else
+    import asyncio
+    
+    async def probe_all():
+        # A large directory would otherwise open hundreds of connections at once
+        limit = asyncio.Semaphore(PROBE_CONCURRENCY)
+        
+        async def probe(key, node):
+            async with limit:
+                return await _probe_node(key, node, samples, timeout)
+        
+        return await asyncio.gather(*(probe(key, node) for key, node in nodes.items()))
+    
+    return rank_probe_results(asyncio.run(probe_all()))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# TCP INTERFACE HEALTH MONITOR
+# ══════════════════════════════════════════════════════════════════════════════
+
+MONITOR_INTERVAL = 30       # seconds between probe rounds
+MONITOR_HISTORY = 20        # probe results kept per interface
+MONITOR_MIN_SAMPLES = 5     # results needed before an interface is flagged
+MONITOR_DOWN_RATIO = 0.8    # share of failed probes that counts as down
+MONITOR_SLOW_MS = 500       # median connect latency that counts as slow
+
+
+class LatencyHistory:
+    """Fixed-size ring buffer of probe latencies in ms, NaN marks a failed probe"""
+    
+    def __init__(self, size=MONITOR_HISTORY):
+        self.samples = array("f", [math.nan]) * size
+        self.size = size
+        self.count = 0
+        self.index = 0
+    
+    def add(self, latency):
+        """Record one probe result, None for unreachable"""
+        self.samples[self.index] = math.nan if latency is None else latency
+        self.index = (self.index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+    
+    def failure_ratio(self):
+        """Share of recorded probes that failed"""
+        if not self.count:
+            return 0.0
+        failed = sum(1 for v in self.samples[:self.count] if math.isnan(v))
+        return failed / self.count
+    
+    def median_latency(self):
+        """Median latency of the successful probes, or None"""
+        values = [v for v in self.samples[:self.count] if not math.isnan(v)]
+        return statistics.median(values) if values else None
+    
+    def status(self):
+        """Classify the interface as 'ok', 'slow', 'down' or 'unknown'"""
+        if self.count < MONITOR_MIN_SAMPLES:
+            return "unknown"
+        if self.failure_ratio() >= MONITOR_DOWN_RATIO:
+            return "down"
+        median = self.median_latency()
+        if median is not None and median >= MONITOR_SLOW_MS:
+            return "slow"
+        return "ok"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PUBLIC NODE DIRECTORY
+# ══════════════════════════════════════════════════════════════════════════════
+
+NODE_DIRECTORY_ENV = "RNSTOOLS_NODE_DIRECTORY"
+NODE_DIRECTORY_TTL = 24 * 60 * 60
+NODE_DIRECTORY_TIMEOUT = 10
+NODE_DIRECTORY_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "reticulumtools" / "node_directory.json"
+)
+
+
+class NodeDirectory:
+    """Disk-cached list of public TCP nodes from a local file or HTTP(S) URL
+    
+    The source is a JSON list of {"name", "host", "port", "description"}
+    objects, or an object with such a list under "nodes". Reading the
+    directory only ever touches the cache; refreshing uses conditional
+    requests (ETag / Last-Modified) and can run in a background thread.
+    """
+    
+    def __init__(self, source=None, cache_path=NODE_DIRECTORY_CACHE, ttl=NODE_DIRECTORY_TTL):
+        self.cache_path = Path(cache_path)
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.cache = self.load_cache()
+        self.source = source or os.environ.get(NODE_DIRECTORY_ENV) or self.cache.get("source")
+        self.last_error = None
+        self._refresh_thread = None
+    
+    def load_cache(self):
+        """Read the cache file, returning an empty cache if it is missing or broken"""
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and isinstance(cache.get("nodes"), list):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {"nodes": []}
+    
+    def save_cache(self):
+        """Write the cache file"""
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.cache_path, json.dumps(self.cache, indent=2))
+    
+    def set_source(self, source):
+        """Point the directory at a new source, dropping nodes cached from the old one"""
+        with self.lock:
+            self.source = source
+            self.cache = {"source": source, "nodes": []}
+    
+    def is_stale(self):
+        """True if the cache is older than the TTL or belongs to another source"""
+        if not self.source:
+            return False
+        if self.cache.get("source") != self.source:
+            return True
+        return time.time() - self.cache.get("fetched_at", 0) > self.ttl
+    
+    def nodes(self):
+        """Return the cached nodes as a TCP_INTERFACES-shaped dict"""
+        with self.lock:
+            entries = list(self.cache.get("nodes", []))
+        nodes = {}
+        for entry in entries:
+            try:
+                name = str(entry["name"]).strip()
+                host = str(entry["host"]).strip()
+                port = str(entry["port"]).strip()
+            except (KeyError, TypeError):
+                continue
+            if not name or not host or not port.isdigit():
+                continue
+            nodes[f"dir:{host}:{port}"] = {
+                "name": name,
+                "host": host,
+                "port": port,
+                "description": str(entry.get("description", "")),
+            }
+        return nodes
+    
+    def refresh(self, force=False):
+        """Fetch the source if the cache is stale, return True if the node list changed"""
+        if not self.source or (not force and not self.is_stale()):
+            return False
+        
+        try:
+            if re.match(r'^https?://', self.source):
+                changed, payload, headers = self._fetch_url()
+            else:
+                changed, payload, headers = self._read_file()
+            
+            # Parse before touching the cache, so a bad payload does not count as fresh
+            if changed:
+                data = json.loads(payload)
+                if isinstance(data, dict):
+                    data = data.get("nodes", [])
+                if not isinstance(data, list):
+                    raise ValueError("node directory must be a list of nodes")
+            
+            with self.lock:
+                self.cache["source"] = self.source
+                self.cache["fetched_at"] = time.time()
+                if changed:
+                    self.cache["nodes"] = data
+                    self.cache.update(headers)
+                self.save_cache()
+            self.last_error = None
+            return changed
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+    
+    def refresh_in_background(self):
+        """Start a refresh thread if the cache is stale, never blocking the caller"""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+        if self.is_stale():
+            self._refresh_thread = threading.Thread(target=self.refresh, daemon=True)
+            self._refresh_thread.start()
+    
+    def _fetch_url(self):
+        """Conditional GET of the source URL, return (changed, payload, validators)"""
+        import urllib.error
+        import urllib.request
+        request = urllib.request.Request(self.source, headers={"Accept": "application/json"})
+        if self.cache.get("source") == self.source:
+            if self.cache.get("etag"):
+                request.add_header("If-None-Match", self.cache["etag"])
+            if self.cache.get("last_modified"):
+                request.add_header("If-Modified-Since", self.cache["last_modified"])
+        
+        try:
+            with urllib.request.urlopen(request, timeout=NODE_DIRECTORY_TIMEOUT) as response:
+                payload = response.read().decode("utf-8")
+                validators = {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+                return True, payload, validators
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return False, None, {}
+            raise
+    
+    def _read_file(self):
+        """Read a local source file, skipping it if its mtime has not changed"""
+        path = Path(self.source).expanduser()
+        mtime = path.stat().st_mtime
+        if self.cache.get("source") == self.source and self.cache.get("mtime") == mtime:
+            return False, None, {}
+        with open(path, 'r') as f:
+            return True, f.read(), {"mtime": mtime}
+
+
+def merge_node_directory(directory):
+    """Return TCP_INTERFACES plus the directory nodes whose address and name are not already listed"""
+    merged = dict(TCP_INTERFACES)
+    known = {(node["host"], node["port"]) for node in TCP_INTERFACES.values()}
+    names = {node["name"] for node in TCP_INTERFACES.values()}
+    if directory is not None:
+        for key, node in directory.nodes().items():
+            if (node["host"], node["port"]) not in known and node["name"] not in names:
+                merged[key] = node
+                known.add((node["host"], node["port"]))
+                names.add(node["name"])
+    return merged
@@ -0,0 +1,722 @@
+"""Interactive and command line editor for the NomadNet config"""
+
+import sys
+import shutil
+import argparse
+import time
+import subprocess
+from pathlib import Path
+
+from rnstools.core import (
+    BaseConfigurator,
+    cli_fix,
+    cli_lint,
+    save_cli_changes,
+)
+from rnstools.lint import (
+    LintRule,
+    last_content_line,
+    lint_config,
+    register_lint_rule,
+)
+
+
+# Default NomadNet config template
+# Based on actual NomadNet configuration format
+DEFAULT_CONFIG = """[logging]
+loglevel = 4
+
+[client]
+enable_client = yes
+user_interface = text
+downloads_path = ~/Downloads
+announce_at_start = yes
+try_propagation_on_send_fail = yes
+
+[textui]
+intro_time = 1
+theme = dark
+colormode = 256
+glyphs = unicode
+mouse_enabled = True
+editor = nano
+
+[node]
+enable_node = no
+node_name = My NomadNet Node
+announce_interval = 360
+announce_at_start = yes
+
+"""
+
+# Example Micron page
+EXAMPLE_PAGE = """`c`!Welcome to my NomadNet Node`!
+
+`a
+
+`b>center>This node is running on the Reticulum Network`b
+
+`a
+
+Here you can find information and resources.
+
+`F222
+`*Menu`*
+`[About`:/page/about.mu]
+`[Files`:/file/]
+`f
+
+`a
+
+`B333`=`cHosted with NomadNet`=`b
+"""
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONFIG LINT RULES
+# ══════════════════════════════════════════════════════════════════════════════
+
+NOMADNET_REQUIRED_SECTIONS = {
+    "client": ["enable_client = yes", "user_interface = text"],
+    "textui": ["intro_time = 1", "theme = dark", "colormode = 256", "glyphs = unicode", "mouse_enabled = True"],
+    "node": ["enable_node = no", "announce_at_start = yes"],
+}
+
+# (section, key) -> (accepted values, lowercase; function giving the replacement for a bad value)
+NOMADNET_VALUE_CHECKS = {
+    ("textui", "colormode"): (["monochrome", "16", "88", "256", "24bit"], lambda value: "256"),
+    ("textui", "theme"): (["dark", "light"], lambda value: "dark"),
+    ("textui", "glyphs"): (["plain", "unicode", "nerdfont"], lambda value: "unicode"),
+    ("textui", "mouse_enabled"): (["true", "false"], lambda value: "False" if value.lower() == "no" else "True"),
+    ("client", "enable_client"): (["yes", "no"], lambda value: "yes" if value.lower() in ["true", "1"] else "no"),
+    ("node", "enable_node"): (["yes", "no"], lambda value: "yes" if value.lower() in ["true", "1"] else "no"),
+}
+
+# Values from old broken configs that deserve a more specific explanation
+NOMADNET_VALUE_HINTS = {
+    ("textui", "colormode"): (["dark", "light", "mono", "0", "1"], "this is a theme value, not a color depth"),
+    ("textui", "glyphs"): (["yes", "no", "true", "false"], "glyphs is no longer a yes/no setting"),
+    ("textui", "mouse_enabled"): (["yes", "no"], "NomadNet expects True or False, not yes/no"),
+}
+
+
+@register_lint_rule
+class NomadNetMissingSectionRule(LintRule):
+    """[client], [textui] and [node] must exist"""
+    code = "missing-section"
+    severity = "error"
+    target = "nomadnet"
+    
+    def finish(self, ctx):
+        end = last_content_line(ctx.lines, -1, len(ctx.lines)) + 1
+        for name, body in NOMADNET_REQUIRED_SECTIONS.items():
+            if name not in ctx.root["children"]:
+                ctx.report(self, max(end - 1, 0), 1, f"Missing required section: [{name}]", {"section": name}, {
+                    "action": "add_section",
+                    "edits": [{"line": end, "delete": 0, "insert": ["", f"[{name}]"] + body}],
+                })
+
+
+@register_lint_rule
+class NomadNetValueRule(LintRule):
+    """Settings NomadNet only accepts from a fixed set of values"""
+    code = "invalid-value"
+    severity = "error"
+    target = "nomadnet"
+    
+    def key(self, ctx, section, entry):
+        check = NOMADNET_VALUE_CHECKS.get((section["name"], entry["key"])) if section["depth"] == 1 else None
+        if check is None:
+            return
+        valid, replacement = check
+        value = entry["value"]
+        if value.lower() in valid:
+            return
+        
+        message = f"Invalid {entry['key']} '{value}' - must be one of: {', '.join(valid)}"
+        hint_values, hint = NOMADNET_VALUE_HINTS.get((section["name"], entry["key"]), ([], ""))
+        if value.lower() in hint_values:
+            message += f" ({hint})"
+        new_value = replacement(value)
+        ctx.report(self, entry["line"], len(entry["indent"]) + 1, message, {"key": entry["key"], "value": value}, {
+            "action": "fix_setting",
+            "value": new_value,
+            "edits": [{"line": entry["line"], "delete": 1, "insert": [f"{entry['indent']}{entry['key']} = {new_value}"]}],
+        })
+
+
+@register_lint_rule
+class NomadNetThemeRule(LintRule):
+    """[textui] needs a theme for dark/light mode"""
+    code = "missing-theme"
+    target = "nomadnet"
+    
+    def section_end(self, ctx, section):
+        if section["path"] == ("textui",) and "theme" not in section["keys"]:
+            after = max((entry["line"] for entry in section["keys"].values()), default=section["line"]) + 1
+            ctx.report(self, section["line"], 1, "Missing 'theme' setting in [textui] - needed for dark/light mode",
+                       {"key": "theme", "section": "textui"}, {
+                           "action": "fix_setting",
+                           "value": "dark",
+                           "edits": [{"line": after, "delete": 0, "insert": ["theme = dark"]}],
+                       })
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATOR CLASS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class NomadNetConfigurator(BaseConfigurator):
+    DEFAULT_CONFIG = DEFAULT_CONFIG
+    CREATE_HINT = "run_nomadnet_first"
+    TRANSLATIONS_MODULE = "nomadnet"
+    
+    @property
+    def nomadnet_dir(self):
+        return self.config_path.parent
+    
+    def config_locations(self):
+        """Where the NomadNet config is looked for, in order; the first one is the default"""
+        return [
+            Path.home() / ".nomadnetwork" / "config",
+            Path("/etc/nomadnetwork/config"),
+            Path.home() / ".config" / "nomadnetwork" / "config",
+        ]
+    
+    def create_default_config(self):
+        """Create a default configuration file and the page hosting folders"""
+        if not super().create_default_config():
+            return False
+        self.create_hosting_folders()
+        return True
+    
+    def view_config(self):
+        """Display current configuration"""
+        self.clear_screen()
+        print(f"\n{self.t('view_config')}")
+        print(f"{self.t('config_location')} {self.config_path}\n")
+        print("─" * 78)
+        print(self.config_content)
+        print("─" * 78)
+        input(f"\n{self.t('press_enter')}")
+    
+    def edit_client_settings(self):
+        """Edit client settings"""
+        while True:
+            self.clear_screen()
+            
+            # Get current values
+            display_name = self.get_setting("client", "user_name", "Anonymous Peer")
+            propagation = self.get_setting("propagation", "enable_propagation_node", "no")
+            announce_startup = self.get_setting("node", "announce_at_start", "yes")
+            announce_interval = self.get_setting("client", "announce_interval", "360")
+            
+            prop_str = self.t("enabled") if propagation.lower() in ["yes", "true"] else self.t("disabled")
+            ann_str = self.t("enabled") if announce_startup.lower() in ["yes", "true"] else self.t("disabled")
+            
+            print(self.t("client_settings").format(
+                display_name=display_name,
+                propagation=prop_str,
+                announce_startup=ann_str,
+                announce_interval=announce_interval
+            ))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                new_name = input(self.t("enter_display_name")).strip()
+                if new_name:
+                    self.set_setting("client", "user_name", new_name)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "2":
+                response = input(self.t("enable_propagation")).strip().lower()
+                new_value = "yes" if response == self.t("yes") else "no"
+                self.set_setting("propagation", "enable_propagation_node", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "3":
+                response = input(self.t("enable_announce_startup")).strip().lower()
+                new_value = "yes" if response == self.t("yes") else "no"
+                self.set_setting("node", "announce_at_start", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "4":
+                new_interval = input(self.t("enter_announce_interval")).strip()
+                if new_interval.isdigit():
+                    self.set_setting("client", "announce_interval", new_interval)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "5":
+                break
+    
+    def edit_textui_settings(self):
+        """Edit text UI settings"""
+        while True:
+            self.clear_screen()
+            
+            # Get current values
+            intro_time = self.get_setting("textui", "intro_time", "1")
+            editor = self.get_setting("textui", "editor", "nano")
+            theme = self.get_setting("textui", "theme", "dark")
+            colormode = self.get_setting("textui", "colormode", "256")
+            glyphs = self.get_setting("textui", "glyphs", "unicode")
+            mouse = self.get_setting("textui", "mouse_enabled", "True")
+            
+            # Display mouse status
+            mouse_str = self.t("enabled") if mouse.lower() == "true" else self.t("disabled")
+            
+            print(self.t("textui_settings").format(
+                intro_time=intro_time,
+                editor=editor,
+                theme=theme,
+                colormode=colormode,
+                glyphs=glyphs,
+                mouse=mouse_str
+            ))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                new_time = input(self.t("enter_intro_time")).strip()
+                if new_time.isdigit():
+                    self.set_setting("textui", "intro_time", new_time)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "2":
+                new_editor = input(self.t("enter_editor")).strip()
+                if new_editor:
+                    self.set_setting("textui", "editor", new_editor)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "3":
+                # Theme selection (dark/light)
+                theme_choice = input(self.t("select_theme")).strip()
+                theme_map = {"1": "dark", "2": "light"}
+                if theme_choice in theme_map:
+                    self.set_setting("textui", "theme", theme_map[theme_choice])
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "4":
+                # Colormode selection
+                colormode_choice = input(self.t("select_colormode")).strip()
+                colormode_map = {"1": "monochrome", "2": "16", "3": "88", "4": "256", "5": "24bit"}
+                if colormode_choice in colormode_map:
+                    self.set_setting("textui", "colormode", colormode_map[colormode_choice])
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "5":
+                # Glyphs selection
+                glyphs_choice = input(self.t("select_glyphs")).strip()
+                glyphs_map = {"1": "plain", "2": "unicode", "3": "nerdfont"}
+                if glyphs_choice in glyphs_map:
+                    self.set_setting("textui", "glyphs", glyphs_map[glyphs_choice])
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "6":
+                response = input(self.t("enable_mouse")).strip().lower()
+                new_value = "True" if response == self.t("yes") else "False"
+                self.set_setting("textui", "mouse_enabled", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "7":
+                break
+    
+    def edit_node_settings(self):
+        """Edit node hosting settings"""
+        while True:
+            self.clear_screen()
+            
+            # Get current values
+            enabled = self.get_setting("node", "enable_node", "no")
+            name = self.get_setting("node", "node_name", "None")
+            interval = self.get_setting("node", "announce_interval", "360")
+            homepage = self.get_setting("node", "pages_path", "index.mu")
+            
+            enabled_str = self.t("enabled") if enabled.lower() in ["yes", "true"] else self.t("disabled")
+            
+            print(self.t("node_settings").format(
+                enabled=enabled_str,
+                name=name,
+                interval=interval,
+                homepage=homepage
+            ))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                response = input(self.t("enable_node")).strip().lower()
+                new_value = "yes" if response == self.t("yes") else "no"
+                self.set_setting("node", "enable_node", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "2":
+                new_name = input(self.t("enter_node_name")).strip()
+                if new_name:
+                    self.set_setting("node", "node_name", new_name)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "3":
+                new_interval = input(self.t("enter_announce_interval")).strip()
+                if new_interval.isdigit():
+                    self.set_setting("node", "announce_interval", new_interval)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "4":
+                new_homepage = input(self.t("enter_homepage")).strip()
+                if new_homepage:
+                    self.set_setting("node", "pages_path", new_homepage)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "5":
+                break
+    
+    def show_page_hosting_info(self):
+        """Show page hosting information"""
+        self.clear_screen()
+        
+        pages_path = self.nomadnet_dir / "storage" / "pages"
+        files_path = self.nomadnet_dir / "storage" / "files"
+        
+        print(self.t("page_hosting_info").format(
+            pages_path=pages_path,
+            files_path=files_path
+        ))
+        
+        # Check if folders exist
+        print(f"\n{self.t('pages_folder')} {pages_path}")
+        if pages_path.exists():
+            print(f"  {self.t('folder_exists')}")
+        else:
+            print(f"  {self.t('folder_missing')}")
+        
+        print(f"\n{self.t('files_folder')} {files_path}")
+        if files_path.exists():
+            print(f"  {self.t('folder_exists')}")
+        else:
+            print(f"  {self.t('folder_missing')}")
+        
+        # Offer to create folders
+        if not pages_path.exists() or not files_path.exists():
+            response = input(f"\n{self.t('create_folders')}").strip().lower()
+            if response == self.t("yes"):
+                self.create_hosting_folders()
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def create_hosting_folders(self):
+        """Create the hosting folder structure"""
+        pages_path = self.nomadnet_dir / "storage" / "pages"
+        files_path = self.nomadnet_dir / "storage" / "files"
+        
+        try:
+            pages_path.mkdir(parents=True, exist_ok=True)
+            files_path.mkdir(parents=True, exist_ok=True)
+            print(f"\n{self.t('folders_created')}")
+            
+            # Create example homepage if doesn't exist
+            index_path = pages_path / "index.mu"
+            if not index_path.exists():
+                with open(index_path, 'w') as f:
+                    f.write(EXAMPLE_PAGE)
+                print(f"{self.t('example_page_created')} {index_path}")
+                
+        except Exception as e:
+            print(f"\n❌ Error creating folders: {e}")
+    
+    def check_and_fix_config(self):
+        """Check configuration for issues and optionally fix them"""
+        self.clear_screen()
+        print(self.t("check_fix_title"))
+        print(f"{self.t('checking_config')}\n")
+        
+        # First, test with nomadnet if available
+        nomadnet_ok, nomadnet_error = self.test_with_nomadnet_silent()
+        
+        if nomadnet_ok:
+            print(f"  ✅ nomadnet validation passed!")
+            print(f"\n{self.t('config_valid')}")
+            input(f"\n{self.t('press_enter')}")
+            return
+        elif nomadnet_error:
+            print(f"  ❌ nomadnet validation failed:")
+            print(f"    {nomadnet_error}\n")
+        
+        diagnostics = lint_config(self.config_content, target="nomadnet")
+        issues = [f"line {d['line']}:{d['column']}  {d['message']}" for d in diagnostics]
+        fixes = [d for d in diagnostics if d["fix"]]
+        
+        # Display results
+        if not issues:
+            if nomadnet_error:
+                print(f"\n  ⚠️  Could not automatically detect the issue.")
+                print(f"  Please check the config file manually for syntax errors.")
+                print(f"\n  Common NomadNet config issues:")
+                print(f"    • colormode must be: monochrome, 16, 88, 256, or 24bit")
+                print(f"    • theme must be: dark or light")
+                print(f"    • glyphs must be: plain, unicode, or nerdfont")
+                print(f"    • mouse_enabled must be: True or False")
+                print(f"    • enable_client/enable_node must be: yes or no")
+                
+                # Offer to rebuild
+                print(f"\n  Would you like to reset to default configuration?")
+                response = input(f"  This will preserve your basic settings (y/n): ").strip().lower()
+                if response == self.t("yes"):
+                    self.rebuild_config()
+            else:
+                print(f"\n{self.t('config_valid')}")
+        else:
+            print(f"\n{self.t('config_issues').format(count=len(issues))}\n")
+            for i, issue in enumerate(issues, 1):
+                print(f"  {i}. {issue}")
+            
+            print()
+            response = input(self.t("fix_issues")).strip().lower() if fixes else ""
+            
+            if response == self.t("yes"):
+                print(f"\n{self.t('fixing_issues')}\n")
+                self.apply_fixes(fixes)
+                print(f"\n{self.t('issues_fixed')}")
+                
+                # Test again
+                nomadnet_ok, nomadnet_error = self.test_with_nomadnet_silent()
+                if nomadnet_ok:
+                    print(f"\n  ✅ nomadnet validation passed!")
+                elif nomadnet_error:
+                    print(f"\n  ❌ nomadnet validation still fails:")
+                    print(f"    {nomadnet_error}")
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def test_with_nomadnet_silent(self):
+        """Test config with nomadnet silently, return (success, error_message)"""
+        # Check if nomadnet is available
+        if shutil.which("nomadnet") is None:
+            return None, None  # nomadnet not available
+        return self.test_pending_config(self._run_nomadnet)
+    
+    def _run_nomadnet(self):
+        """Run nomadnet briefly and look for config errors in its output"""
+        try:
+            result = subprocess.run(
+                ["nomadnet", "--version"],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            
+            # Check for config errors
+            combined = result.stdout + result.stderr
+            if "Error" in combined or "invalid" in combined.lower():
+                error_lines = [l for l in combined.split('\n') if 'Error' in l or 'invalid' in l.lower()]
+                return False, error_lines[0].strip() if error_lines else "Unknown error"
+            
+            return True, None
+            
+        except subprocess.TimeoutExpired:
+            return True, None  # If it runs without quick error, config is probably fine
+        except Exception as e:
+            return None, f"Test error: {e}"
+    
+    def rebuild_config(self):
+        """Rebuild config from scratch with defaults"""
+        print(f"\n  🔧 Rebuilding configuration...")
+        
+        # Try to preserve some settings
+        old_node_name = self.get_setting("node", "node_name", "My NomadNet Node")
+        old_downloads = self.get_setting("client", "downloads_path", "~/Downloads")
+        old_editor = self.get_setting("textui", "editor", "nano")
+        
+        self.config_content = f"""[logging]
+loglevel = 4
+
+[client]
+enable_client = yes
+user_interface = text
+downloads_path = {old_downloads}
+announce_at_start = yes
+
+[textui]
+intro_time = 1
+theme = dark
+colormode = 256
+glyphs = unicode
+mouse_enabled = True
+editor = {old_editor}
+
+[node]
+enable_node = no
+node_name = {old_node_name}
+announce_at_start = yes
+announce_interval = 360
+
+"""
+        self.has_changes = True
+        print(f"  ✅ Configuration rebuilt with defaults!")
+        print(f"  Please save and test with nomadnet.")
+    
+    def main_menu(self):
+        """Main menu loop"""
+        while True:
+            self.clear_screen()
+            print(self.t("main_menu"))
+            
+            # Show if there are unsaved changes
+            if self.config_content != self.original_content:
+                print("  ⚠️  You have unsaved changes!\n")
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                self.view_config()
+            elif choice == "2":
+                self.edit_client_settings()
+            elif choice == "3":
+                self.edit_textui_settings()
+            elif choice == "4":
+                self.edit_node_settings()
+            elif choice == "5":
+                self.show_page_hosting_info()
+            elif choice == "6":
+                self.check_and_fix_config()
+            elif choice == "7":
+                self.save_config()
+                print(f"\n{self.t('goodbye')}")
+                break
+            elif choice == "8":
+                if self.config_content != self.original_content:
+                    confirm = input(self.t("exit_without_save")).strip().lower()
+                    if confirm != self.t("yes"):
+                        continue
+                print(f"\n{self.t('goodbye')}")
+                break
+            else:
+                print(f"\n{self.t('invalid_choice')}")
+                time.sleep(1)
+    
+    def run(self):
+        """Main entry point"""
+        try:
+            self.select_language()
+            
+            self.clear_screen()
+            print(self.t("welcome"))
+            
+            if not self.load_config():
+                input(f"\n{self.t('press_enter')}")
+                print(f"\n{self.t('goodbye')}")
+                return
+            
+            input(f"\n{self.t('press_enter')}")
+            
+            self.main_menu()
+            
+        except KeyboardInterrupt:
+            print(f"\n\n{self.t('goodbye')}")
+            sys.exit(0)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# COMMAND LINE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def build_cli_parser():
+    """Argument parser for the non-interactive commands"""
+    parser = argparse.ArgumentParser(
+        prog="nomadnet_configurator.py",
+        description="NomadNet configurator. Run without arguments for the interactive menu."
+    )
+    parser.add_argument("--config", default=None, help="path to the NomadNet config file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    # Options shared by every command that changes the config
+    changing = argparse.ArgumentParser(add_help=False)
+    changing.add_argument("--dry-run", action="store_true", help="show the changes without writing them")
+    
+    get = commands.add_parser("get", help="print a setting")
+    get.add_argument("section")
+    get.add_argument("key")
+    
+    set_ = commands.add_parser("set", parents=[changing], help="change a setting")
+    set_.add_argument("section")
+    set_.add_argument("key")
+    set_.add_argument("value")
+    
+    lint = commands.add_parser("lint", help="check the config; exits 1 if there are errors")
+    lint.add_argument("--json", action="store_true", help="print the diagnostics as JSON")
+    
+    commands.add_parser("fix", parents=[changing], help="apply every automatic lint fix")
+    return parser
+
+
+def cli_get(configurator, args):
+    """Print one setting"""
+    value = configurator.get_setting(args.section, args.key, None)
+    if value is None:
+        print(f"❌ {args.section} {args.key} is not set", file=sys.stderr)
+        return 1
+    print(value)
+    return 0
+
+
+def cli_set(configurator, args):
+    """Change one setting"""
+    configurator.set_setting(args.section, args.key, args.value)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+# Commands that work on the loaded config: name -> handler(configurator, args)
+CLI_COMMANDS = {
+    "get": cli_get,
+    "set": cli_set,
+    "lint": lambda configurator, args: cli_lint(configurator, args, target="nomadnet"),
+    "fix": lambda configurator, args: cli_fix(configurator, args, target="nomadnet"),
+}
+
+
+def run_cli(argv):
+    """Run one non-interactive command, return the process exit code"""
+    args = build_cli_parser().parse_args(argv)
+    
+    configurator = NomadNetConfigurator(config_path=args.config)
+    if not configurator.read_config():
+        print(f"❌ Could not read config: {configurator.config_path}", file=sys.stderr)
+        return 1
+    
+    return CLI_COMMANDS[args.command](configurator, args)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAIN ENTRY POINT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    if sys.version_info < (3, 7):
+        print("❌ Error: Python 3.7 or higher is required.")
+        sys.exit(1)
+    
+    if argv:
+        sys.exit(run_cli(argv))
+    
+    configurator = NomadNetConfigurator()
+    configurator.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Announce bandwidth planning against each interface's announce cap"""
+
+from rnstools.dashboard import format_bytes
+
+
+ANNOUNCE_BYTES = 167        # header + public key + name hash + random hash + signature
+DEFAULT_ANNOUNCE_CAP = 2.0  # percent, Reticulum default
+CAP_WARNING = 0.8           # share of the announce cap that triggers a warning
+
+# Bitrates (bits/s) Reticulum assumes for interfaces that do not report one
+DEFAULT_BITRATES = {
+    "AutoInterface": 10_000_000,
+    "BackboneInterface": 1_000_000_000,
+    "TCPClientInterface": 10_000_000,
+    "TCPServerInterface": 10_000_000,
+    "UDPInterface": 10_000_000,
+    "I2PInterface": 256_000,
+    "PipeInterface": 1_000_000,
+}
+SERIAL_TYPES = ["SerialInterface", "KISSInterface", "AX25KISSInterface"]
+LORA_TYPES = ["RNodeInterface", "RNodeMultiInterface"]
+
+
+def lora_bitrate(spreadingfactor, bandwidth, codingrate):
+    """Raw LoRa bitrate in bits/s, computed the same way RNodeInterface does"""
+    return spreadingfactor * ((4.0 / codingrate) / (2 ** spreadingfactor / (bandwidth / 1000))) * 1000
+
+
+def interface_bitrate(properties):
+    """Best estimate of an interface's bitrate from its config, or None"""
+    iface_type = properties.get("type", "")
+    try:
+        if "bitrate" in properties:
+            return float(properties["bitrate"])
+        if iface_type in LORA_TYPES:
+            return lora_bitrate(
+                int(properties["spreadingfactor"]),
+                int(properties["bandwidth"]),
+                int(properties.get("codingrate", 5))
+            )
+        if iface_type in SERIAL_TYPES:
+            return float(properties.get("speed", 9600))
+    except (KeyError, ValueError, ZeroDivisionError):
+        return None
+    return DEFAULT_BITRATES.get(iface_type)
+
+
+def plan_announce_capacity(interfaces, destinations, interval_minutes, app_data_bytes=0):
+    """Project the airtime announces take on each enabled interface
+    
+    interfaces is the output of parse_interfaces(). Every destination is
+    assumed to announce once per interval and to be forwarded on every
+    interface, which is the worst case for a transport node.
+    """
+    announce_bits = (ANNOUNCE_BYTES + app_data_bytes) * 8
+    load = destinations / (interval_minutes * 60) * announce_bits
+    
+    rows = []
+    for iface in interfaces:
+        props = iface["properties"]
+        enabled = props.get("enabled", props.get("interface_enabled", "no"))
+        if enabled.lower() not in ["yes", "true"]:
+            continue
+        
+        bitrate = interface_bitrate(props)
+        try:
+            cap = float(props.get("announce_cap", DEFAULT_ANNOUNCE_CAP))
+        except ValueError:
+            cap = DEFAULT_ANNOUNCE_CAP
+        
+        row = {
+            "name": iface["name"],
+            "type": props.get("type", "Unknown"),
+            "bitrate": bitrate,
+            "announce_cap": cap,
+            "load_bps": load,
+            "airtime_share": None,
+            "cap_usage": None,
+            "max_destinations": None,
+            "status": "unknown",
+        }
+        if bitrate:
+            budget = bitrate * cap / 100
+            row["airtime_share"] = load / bitrate
+            row["cap_usage"] = load / budget if budget else None
+            row["max_destinations"] = int(budget * interval_minutes * 60 / announce_bits)
+            if row["airtime_share"] >= 1:
+                row["status"] = "saturated"
+            elif row["cap_usage"] is None or row["cap_usage"] > 1:
+                row["status"] = "over_cap"
+            elif row["cap_usage"] > CAP_WARNING:
+                row["status"] = "near_cap"
+            else:
+                row["status"] = "ok"
+        row["lora"] = row["type"] in LORA_TYPES
+        rows.append(row)
+    
+    return rows
+
+
+def format_capacity_report(rows, destinations, interval_minutes):
+    """Render planner rows as text lines"""
+    icons = {"ok": "✅", "near_cap": "🟡", "over_cap": "🟠", "saturated": "🔴", "unknown": "❔"}
+    lines = [
+        f"Announce load: {destinations} destinations every {interval_minutes:g} min "
+        f"= {rows[0]['load_bps'] if rows else 0:.1f} bits/s per interface",
+        "",
+        f"  {'Interface':<28} {'Type':<20} {'Bitrate':>12} {'Cap':>5} {'Airtime':>8} {'Of cap':>7} {'Max dest':>9}",
+    ]
+    for row in rows:
+        bitrate = format_bytes(row["bitrate"], "bps") if row["bitrate"] else "?"
+        share = f"{row['airtime_share']:.2%}" if row["airtime_share"] is not None else "?"
+        usage = f"{row['cap_usage']:.0%}" if row["cap_usage"] is not None else "?"
+        max_dest = str(row["max_destinations"]) if row["max_destinations"] is not None else "?"
+        lines.append(
+            f"{icons[row['status']]} {row['name'][:28]:<28} {row['type'][:20]:<20} {bitrate:>12} "
+            f"{row['announce_cap']:>4g}% {share:>8} {usage:>7} {max_dest:>9}"
+        )
+    
+    for row in rows:
+        if row["lora"] and row["status"] in ["over_cap", "saturated"]:
+            lines.append("")
+            lines.append(f"⚠️  LoRa interface '{row['name']}' cannot carry this announce load: "
+                         f"announces will queue and paths will go stale.")
+            lines.append(f"   Keep it under {row['max_destinations']} destinations at this interval, "
+                         f"lengthen the interval, or use a wider bandwidth or lower spreading factor.")
+    return lines
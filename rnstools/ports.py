@@ -0,0 +1,277 @@
+"""Listening ports a config binds, checked against the sockets open on this host"""
+
+import os
+import sys
+import ipaddress
+from pathlib import Path
+
+from rnstools.schema import config_value
+
+
+# The socket tables are read straight from procfs instead of probing each
+# port with bind(), so every port is checked in one pass over four small
+# files. Point this at a fake tree to test it.
+PROC_ROOT_ENV = "RNSTOOLS_PROC_ROOT"
+PROC_ROOT = "/proc"
+SOCKET_TABLES = {
+    "tcp": ["net/tcp", "net/tcp6"],
+    "udp": ["net/udp", "net/udp6"],
+}
+TCP_LISTEN_STATE = "0A"
+
+# Ports rnsd binds on 127.0.0.1 for the shared instance unless configured otherwise
+DEFAULT_SHARED_INSTANCE_PORT = 37428
+DEFAULT_INSTANCE_CONTROL_PORT = 37429
+WILDCARD_ADDRESSES = ["0.0.0.0", "::", ""]
+
+FREE_PORT_SEARCH = 200      # ports tried after a busy one for a free alternative
+
+# Programs that run a Reticulum instance, and their options naming its config directory
+RETICULUM_PROGRAMS = ["rnsd", "nomadnet", "sideband", "meshchat", "reticulum-meshchat"]
+RETICULUM_CONFIG_OPTIONS = ["--config", "--rnsconfig"]
+RETICULUM_CONFIG_DIRS = ["/etc/reticulum", "~/.config/reticulum", "~/.reticulum"]
+
+
+def _enabled(properties):
+    value = config_value(properties.get("enabled", properties.get("interface_enabled", "no")))
+    return value.lower() in ["yes", "true", "on", "1"]
+
+
+def _port(value):
+    try:
+        return int(config_value(value))
+    except ValueError:
+        return None
+
+
+def config_bindings(reticulum, interfaces):
+    """Ports the config makes rnsd listen on
+
+    reticulum holds the raw [reticulum] values and interfaces maps each
+    interface name to its raw values. Each binding is a dict with the
+    protocol, address, port, the config section, the key that sets the port
+    and whether the port is a default the config leaves out.
+    """
+    bindings = []
+    shares = config_value(reticulum.get("share_instance", "yes")).lower() in ["yes", "true", "on", "1"]
+    if shares and config_value(reticulum.get("shared_instance_type", "tcp")).lower() != "unix":
+        for key, default in [("shared_instance_port", DEFAULT_SHARED_INSTANCE_PORT),
+                             ("instance_control_port", DEFAULT_INSTANCE_CONTROL_PORT)]:
+            port = _port(reticulum[key]) if key in reticulum else default
+            if port is not None:
+                bindings.append({"protocol": "tcp", "address": "127.0.0.1", "port": port,
+                                 "section": ("reticulum",), "key": key, "default": key not in reticulum,
+                                 "label": key})
+    
+    for name, properties in interfaces.items():
+        iface_type = properties.get("type")
+        if not _enabled(properties):
+            continue
+        if iface_type in ["TCPServerInterface", "UDPInterface"]:
+            protocol = "tcp" if iface_type == "TCPServerInterface" else "udp"
+            key = next((k for k in ["listen_port", "port"] if k in properties), None)
+            address = properties.get("listen_ip", "0.0.0.0")
+        elif iface_type == "BackboneInterface" and not any(k in properties for k in ["remote", "target_host"]):
+            protocol = "tcp"
+            key = "port" if "port" in properties else None
+            address = properties.get("listen_on", "0.0.0.0")
+        else:
+            continue
+        port = _port(properties[key]) if key else None
+        if port is not None:
+            bindings.append({"protocol": protocol, "address": config_value(address), "port": port,
+                             "section": ("interfaces", name), "key": key, "default": False,
+                             "label": f"interface '{name}'"})
+    return bindings
+
+
+def _decode_address(hex_address):
+    """Text form of an address as procfs prints it, in 32-bit words of host byte order"""
+    raw = bytes.fromhex(hex_address)
+    if sys.byteorder == "little":
+        raw = b"".join(raw[i:i + 4][::-1] for i in range(0, len(raw), 4))
+    address = ipaddress.ip_address(raw)
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    return str(address)
+
+
+def open_sockets(proc_root=None):
+    """Bound ports on this host: protocol -> port -> [(address, uid, inode)]
+
+    TCP counts only listening sockets, UDP every bound one. Protocols whose
+    tables cannot be read, as on macOS and Windows, are left out.
+    """
+    root = Path(proc_root or os.environ.get(PROC_ROOT_ENV) or PROC_ROOT)
+    sockets = {}
+    for protocol, tables in SOCKET_TABLES.items():
+        for table in tables:
+            try:
+                with open(root / table) as f:
+                    next(f, None)  # column header
+                    lines = f.readlines()
+            except OSError:
+                continue
+            ports = sockets.setdefault(protocol, {})
+            for line in lines:
+                fields = line.split()
+                if len(fields) < 10 or (protocol == "tcp" and fields[3] != TCP_LISTEN_STATE):
+                    continue
+                hex_address, _, hex_port = fields[1].partition(":")
+                try:
+                    port = int(hex_port, 16)
+                    entry = (_decode_address(hex_address), int(fields[7]), fields[9])
+                except ValueError:
+                    continue
+                if port:
+                    ports.setdefault(port, []).append(entry)
+    return sockets
+
+
+def addresses_overlap(first, second):
+    """Whether two sockets bound to these addresses on one port would collide"""
+    return first in WILDCARD_ADDRESSES or second in WILDCARD_ADDRESSES or first == second
+
+
+def reticulum_instance_dir(pid, proc_root):
+    """Config directory of the Reticulum program running as pid, None for other programs"""
+    process = Path(proc_root) / str(pid)
+    try:
+        args = (process / "cmdline").read_bytes().decode(errors="replace").split("\0")
+    except OSError:
+        return None
+    if not any(Path(arg).name in RETICULUM_PROGRAMS or arg.startswith("RNS.") for arg in args[:3]):
+        return None
+    
+    for index, arg in enumerate(args):
+        option, _, value = arg.partition("=")
+        if option in RETICULUM_CONFIG_OPTIONS:
+            value = value or (args[index + 1] if index + 1 < len(args) else "")
+            try:
+                return Path(os.readlink(process / "cwd")) / os.path.expanduser(value)
+            except OSError:
+                return Path(os.path.expanduser(value))
+    
+    # Without an option RNS takes the first of its default directories holding a config
+    try:
+        import pwd
+        home = pwd.getpwuid(process.stat().st_uid).pw_dir
+    except (ImportError, KeyError, OSError):
+        return None
+    for directory in RETICULUM_CONFIG_DIRS:
+        path = Path(directory.replace("~", home, 1))
+        if (path / "config").is_file():
+            return path
+    return Path(RETICULUM_CONFIG_DIRS[-1].replace("~", home, 1))
+
+
+def socket_owners(inodes, uids, proc_root=None):
+    """Processes holding some socket inodes: inode -> dict with the pid, program and config_dir
+
+    config_dir is set for Reticulum programs only. Only processes of the
+    sockets' users are looked at, so this stays fast on busy hosts; sockets
+    of processes whose descriptors cannot be read are left out.
+    """
+    root = Path(proc_root or os.environ.get(PROC_ROOT_ENV) or PROC_ROOT)
+    wanted = {f"socket:[{inode}]": inode for inode in inodes}
+    owners = {}
+    try:
+        processes = [entry for entry in os.scandir(root) if entry.name.isdigit()]
+    except OSError:
+        return owners
+    for entry in processes:
+        try:
+            if entry.stat().st_uid not in uids:
+                continue
+            links = [os.readlink(fd.path) for fd in os.scandir(os.path.join(entry.path, "fd"))]
+        except OSError:
+            continue
+        held = [wanted[link] for link in links if link in wanted]
+        if not held:
+            continue
+        try:
+            program = (Path(entry.path) / "comm").read_text().strip()
+        except OSError:
+            program = "another program"
+        owner = {"pid": int(entry.name), "program": program, "config_dir": reticulum_instance_dir(entry.name, root)}
+        for inode in held:
+            owners[inode] = owner
+        if len(owners) == len(wanted):
+            break
+    return owners
+
+
+def free_port(protocol, port, sockets, taken):
+    """First port after a busy one that nothing on the host or in the config uses, or None"""
+    in_use = sockets.get(protocol, {})
+    for candidate in range(port + 1, min(port + FREE_PORT_SEARCH, 65535) + 1):
+        if candidate not in in_use and (protocol, candidate) not in taken:
+            return candidate
+    return None
+
+
+def check_port_conflicts(bindings, config_dir=None, proc_root=None):
+    """Bindings that collide with each other or with sockets open on this host
+
+    Issues are dicts with a severity, a code, a message, the binding, a
+    suggested free port and whether moving to it is safe: a port-in-use
+    issue is only fixable when every holder is known not to be this config's
+    own rnsd. Sockets held by a Reticulum program using the same config
+    directory are that own running instance, not conflicts.
+    """
+    sockets = open_sockets(proc_root)
+    issues = []
+    clashes = []
+    seen = {}
+    for binding in bindings:
+        same_port = seen.setdefault((binding["protocol"], binding["port"]), [])
+        earlier = next((b for b in same_port if addresses_overlap(b["address"], binding["address"])), None)
+        if earlier:
+            clashes.append((binding, f"{binding['protocol'].upper()} port {binding['port']} of {binding['label']} "
+                                     f"is also used by {earlier['label']}", True))
+        same_port.append(binding)
+    
+    holders = {}
+    for binding in bindings:
+        entries = sockets.get(binding["protocol"], {}).get(binding["port"], [])
+        entries = [entry for entry in entries if addresses_overlap(entry[0], binding["address"])]
+        if entries:
+            holders[id(binding)] = entries
+    owners = {}
+    if holders:
+        inodes = {entry[2] for entries in holders.values() for entry in entries}
+        uids = {entry[1] for entries in holders.values() for entry in entries}
+        owners = socket_owners(inodes, uids, proc_root)
+    
+    own_dir = Path(config_dir).resolve() if config_dir else None
+    busy = []
+    for binding in bindings:
+        entries = holders.get(id(binding))
+        if not entries:
+            continue
+        holding = [owners.get(entry[2]) for entry in entries]
+        mine = [owner is not None and owner["config_dir"] is not None and own_dir is not None
+                and owner["config_dir"].resolve() == own_dir for owner in holding]
+        if all(mine):
+            continue  # this config's own rnsd is running
+        # Moving the port is only safe when the holder is known not to be this config's rnsd
+        others = [owner for owner, own in zip(holding, mine) if owner is not None and not own]
+        known = None not in holding and (own_dir is not None or all(o["config_dir"] is None for o in others))
+        if others and others[0]["config_dir"] is not None:
+            where = f"another Reticulum instance ({others[0]['config_dir']})"
+        elif others:
+            where = f"{others[0]['program']} (pid {others[0]['pid']})"
+        else:
+            where = "a process this user cannot inspect, possibly this config's own rnsd"
+        busy.append((binding, f"{binding['protocol'].upper()} port {binding['port']} of {binding['label']} "
+                              f"is already in use by {where}", known))
+    
+    taken = {(b["protocol"], b["port"]) for b in bindings}
+    for code, found in [("port-clash", clashes), ("port-in-use", busy)]:
+        for binding, message, fixable in found:
+            suggestion = free_port(binding["protocol"], binding["port"], sockets, taken)
+            if suggestion is not None:
+                taken.add((binding["protocol"], suggestion))
+            issues.append({"severity": "warning", "code": code, "message": message,
+                           "binding": binding, "suggestion": suggestion, "fixable": fixable})
+    return issues
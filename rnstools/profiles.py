@@ -0,0 +1,60 @@
+"""Performance presets for common node roles"""
+
+# Each profile sets [reticulum] keys and per-interface-type keys in one go.
+# Interface keys are only applied to interfaces of the listed type.
+PERFORMANCE_PROFILES = {
+    "leaf": {
+        "name": "Leaf client",
+        "description": "End-user node that does not route traffic for others",
+        "settings": {
+            "enable_transport": "No",
+            "share_instance": "Yes",
+        },
+        "interfaces": {
+            "AutoInterface": {"mode": "full"},
+            "TCPClientInterface": {"mode": "full", "announce_cap": "2"},
+        },
+    },
+    "tcp_hub": {
+        "name": "Busy TCP transport hub",
+        "description": "Internet-facing transport node with many TCP clients",
+        "settings": {
+            "enable_transport": "Yes",
+            "share_instance": "Yes",
+            "panic_on_interface_error": "No",
+        },
+        "interfaces": {
+            "TCPServerInterface": {
+                "mode": "gateway",
+                "bitrate": "10000000",
+                "announce_cap": "5",
+                "ingress_control": "Yes",
+                "ic_max_held_announces": "512",
+            },
+            "TCPClientInterface": {
+                "mode": "full",
+                "bitrate": "10000000",
+                "announce_cap": "5",
+                "ingress_control": "Yes",
+            },
+            "AutoInterface": {"mode": "full"},
+        },
+    },
+    "lora_gateway": {
+        "name": "LoRa gateway",
+        "description": "Bridges a LoRa radio segment to TCP uplinks, conserving airtime",
+        "settings": {
+            "enable_transport": "Yes",
+            "share_instance": "Yes",
+        },
+        "interfaces": {
+            "RNodeInterface": {
+                "mode": "gateway",
+                "announce_cap": "1",
+                "ingress_control": "Yes",
+            },
+            "TCPClientInterface": {"mode": "boundary", "announce_cap": "2"},
+            "AutoInterface": {"mode": "full"},
+        },
+    },
+}
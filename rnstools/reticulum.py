@@ -0,0 +1,1329 @@
+"""Interactive editor for the Reticulum config"""
+
+import os
+import sys
+import shutil
+import time
+import re
+import queue
+import difflib
+import threading
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+from rnstools.configdiff import ConfigIndex, format_section_path, three_way_merge
+from rnstools.core import BaseConfigurator
+from rnstools.dashboard import (
+    DASHBOARD_INTERVAL,
+    InterfaceStatsSource,
+    format_bytes,
+    interface_rates,
+)
+from rnstools.lint import LINT_MESSAGE_KEYS, VALIDATION_LINT_CODES, lint_config
+from rnstools.lora import format_lora_report, lora_link_report
+from rnstools.nodes import (
+    LatencyHistory,
+    MONITOR_INTERVAL,
+    NodeDirectory,
+    QUICK_CONNECT_COUNT,
+    TCP_INTERFACES,
+    merge_node_directory,
+    probe_tcp_nodes,
+)
+from rnstools.planner import format_capacity_report, plan_announce_capacity
+from rnstools.profiles import PERFORMANCE_PROFILES
+from rnstools.rnode import (
+    DEFAULT_RNODE_PRESET,
+    RNODE_PRESETS,
+    RNODE_SETTINGS,
+    describe_port,
+    find_serial_ports,
+    rnode_settings,
+)
+from rnstools.schema import (
+    INTERFACE_SCHEMAS,
+    check_interface_value,
+    config_value,
+    interface_template,
+    load_rns_configobj,
+    same_config_value,
+)
+from rnstools.watcher import ConfigWatcher
+
+
+# Default config template - matches rnsd expected format
+DEFAULT_CONFIG = """[reticulum]
+enable_transport = False
+share_instance = Yes
+shared_instance_port = 37428
+instance_control_port = 37429
+panic_on_interface_error = No
+
+[logging]
+loglevel = 4
+
+[interfaces]
+
+  [[Default Interface]]
+    type = AutoInterface
+    enabled = yes
+
+"""
+
+# rnsd validation - the log is streamed and the test ends as soon as rnsd
+# reports that it is up, or that it could not load the config
+RNSD_TEST_TIMEOUT = 15
+RNSD_READY_MARKERS = (
+    "Started rnsd version",
+    "System interfaces are ready",
+    "connected to another shared local instance",
+)
+RNSD_ERROR_MARKERS = (
+    "Could not parse",
+    "[Error]",
+    "[Critical]",
+    "Traceback",
+)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONFIGURATOR CLASS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class ReticulumConfigurator(BaseConfigurator):
+    DEFAULT_CONFIG = DEFAULT_CONFIG
+    CREATE_HINT = "run_rnsd_first"
+    TRANSLATIONS_MODULE = "reticulum"
+    
+    def __init__(self, config_path=None):
+        super().__init__(config_path)
+        self.rnsd_timeout = RNSD_TEST_TIMEOUT
+        self.node_directory = NodeDirectory()
+        self.watcher = ConfigWatcher(self.config_path)
+        self.original_index = None
+    
+    def config_locations(self):
+        """Where the Reticulum config is looked for, in order; the first one is the default"""
+        return [
+            Path.home() / ".reticulum" / "config",
+            Path("/etc/reticulum/config"),
+            Path.home() / ".config" / "reticulum" / "config",
+        ]
+    
+    def sync_external_changes(self):
+        """Pick up edits made on disk by other programs, merging them with unsaved ones"""
+        self.watcher.acknowledge()
+        try:
+            with open(self.config_path, 'r') as f:
+                on_disk = f.read()
+        except OSError:
+            return
+        if on_disk == self.original_content:
+            return
+        
+        print(f"\n{self.t('external_change')}")
+        # The last loaded text stays indexed, so each event only re-parses the sections it changed
+        if self.original_index is None or '\n'.join(self.original_index.lines) != self.original_content:
+            self.original_index = ConfigIndex(self.original_content)
+        if self.config_content == self.original_content:
+            self.original_index = self.original_index.updated(on_disk)
+            self.config_content = self.original_content = on_disk
+            print(self.t("external_reloaded"))
+            return
+        
+        def resolve(conflict):
+            where = format_section_path(conflict["section"])
+            if conflict["key"] is None:
+                ours, theirs = (self.t("merge_present" if conflict[side] else "merge_removed") for side in ["ours", "theirs"])
+            else:
+                where = f"{where} {conflict['key']}"
+                ours, theirs = conflict["ours"], conflict["theirs"]
+            print(f"\n  {self.t('merge_conflict').format(where=where, ours=ours, theirs=theirs)}")
+            choice = input(self.t("merge_conflict_choice")).strip().lower()
+            return "ours" if choice == "m" else "theirs"
+        
+        self.config_content, _ = three_way_merge(self.original_content, on_disk, self.config_content, resolve,
+                                                 self.original_index)
+        self.original_index = self.original_index.updated(on_disk)
+        self.original_content = on_disk
+        self.has_changes = self.config_content != on_disk
+        print(f"\n{self.t('external_merged')}")
+    
+    def save_config(self):
+        """Save the configuration file, first picking up edits made on disk meanwhile"""
+        if self.watcher.changed.is_set():
+            self.sync_external_changes()
+        return super().save_config()
+    
+    def parse_interfaces(self):
+        """Parse interfaces from config content"""
+        interfaces = []
+        
+        # Find all interface blocks [[name]]
+        pattern = r'\[\[([^\]]+)\]\](.*?)(?=\[\[|\[(?!\[)|$)'
+        matches = re.findall(pattern, self.config_content, re.DOTALL)
+        
+        for name, content in matches:
+            # Parse interface properties
+            iface = {"name": name.strip(), "content": content, "properties": {}}
+            
+            for line in content.split('\n'):
+                line = line.strip()
+                if '=' in line and not line.startswith('#'):
+                    key, value = line.split('=', 1)
+                    iface["properties"][key.strip()] = value.strip()
+            
+            interfaces.append(iface)
+        
+        return interfaces
+    
+    def add_tcp_interface(self, name, host, port):
+        """Add a TCP Client Interface to the config, return the name it got or False if it exists"""
+        # Check if an interface to the same host and port already exists
+        interfaces = self.parse_interfaces()
+        for iface in interfaces:
+            props = iface["properties"]
+            if props.get("target_host") == host and props.get("target_port") == str(port):
+                return False
+        
+        # A node listed under a name already in use elsewhere gets a numbered one
+        names = {iface["name"] for iface in interfaces}
+        base, number = name, 2
+        while name in names:
+            name = f"{base} ({number})"
+            number += 1
+        
+        # Create interface block with proper indentation (2 spaces for [[]], 4 for properties)
+        # Using explicit spacing to ensure correct format
+        interface_block = "\n  [[" + name + "]]\n"
+        interface_block += "    type = TCPClientInterface\n"
+        interface_block += "    enabled = yes\n"
+        interface_block += "    target_host = " + host + "\n"
+        interface_block += "    target_port = " + str(port) + "\n"
+        
+        self.append_interface_block(interface_block)
+        return name
+    
+    def add_tcp_server_interface(self, name, listen_ip, listen_port):
+        """Add a TCP Server Interface to the config"""
+        for iface in self.parse_interfaces():
+            props = iface["properties"]
+            if props.get("type") == "TCPServerInterface" and props.get("listen_port") == str(listen_port):
+                return False
+        
+        interface_block = "\n  [[" + name + "]]\n"
+        interface_block += "    type = TCPServerInterface\n"
+        interface_block += "    enabled = yes\n"
+        interface_block += "    listen_ip = " + listen_ip + "\n"
+        interface_block += "    listen_port = " + str(listen_port) + "\n"
+        
+        self.append_interface_block(interface_block)
+        return True
+    
+    def add_rnode_interface(self, name, port, settings):
+        """Add an RNode LoRa interface with the given radio settings"""
+        for iface in self.parse_interfaces():
+            props = iface["properties"]
+            if props.get("type") == "RNodeInterface" and props.get("port") == port:
+                return False
+        
+        interface_block = "\n  [[" + name + "]]\n"
+        interface_block += "    type = RNodeInterface\n"
+        interface_block += "    enabled = yes\n"
+        interface_block += "    port = " + port + "\n"
+        for key in RNODE_SETTINGS:
+            interface_block += f"    {key} = {settings[key]}\n"
+        
+        self.append_interface_block(interface_block)
+        return True
+    
+    def add_interface(self, name, iface_type, values=None):
+        """Add an interface of any known type from its template, return False if the name is taken"""
+        if any(iface["name"] == name for iface in self.parse_interfaces()):
+            return False
+        
+        interface_block = "\n  [[" + name + "]]\n"
+        for key, value in interface_template(iface_type, values).items():
+            if value is not None and value != "":
+                interface_block += f"    {key} = {value}\n"
+        
+        self.append_interface_block(interface_block)
+        return True
+    
+    def append_interface_block(self, interface_block):
+        """Append an interface block at the end of the [interfaces] section"""
+        # Find [interfaces] section and append properly
+        if "[interfaces]" in self.config_content:
+            # Find the position after [interfaces] section to insert
+            # We need to find where the interfaces section content ends
+            interfaces_match = re.search(r'(\[interfaces\].*?)(?=\n\[[^\[]|\Z)', 
+                                         self.config_content, re.DOTALL)
+            if interfaces_match:
+                # Insert at the end of the interfaces section
+                insert_pos = interfaces_match.end()
+                self.config_content = (
+                    self.config_content[:insert_pos].rstrip() + 
+                    interface_block + 
+                    self.config_content[insert_pos:]
+                )
+            else:
+                # Fallback: append to end
+                self.config_content = self.config_content.rstrip() + interface_block
+        else:
+            # Add interfaces section
+            self.config_content = self.config_content.rstrip() + "\n\n[interfaces]" + interface_block
+        
+        self.has_changes = True
+    
+    def set_interface_property(self, name, key, value):
+        """Set a key inside an interface block, adding it if missing"""
+        lines = self.config_content.split('\n')
+        header_pattern = re.compile(rf'^\s*\[\[{re.escape(name)}\]\]\s*$')
+        start = next((i for i, line in enumerate(lines) if header_pattern.match(line)), None)
+        if start is None:
+            return False
+        
+        # The block ends at the next [[interface]] or [section] header
+        end = start + 1
+        while end < len(lines) and not lines[end].lstrip().startswith('['):
+            end += 1
+        
+        key_pattern = re.compile(rf'^(\s*){re.escape(key)}\s*=\s*(.*)$')
+        last_property = start
+        for i in range(start + 1, end):
+            match = key_pattern.match(lines[i])
+            if match:
+                if match.group(2).strip() == str(value):
+                    return True
+                lines[i] = f"{match.group(1)}{key} = {value}"
+                break
+            if '=' in lines[i] and not lines[i].strip().startswith('#'):
+                last_property = i
+        else:
+            lines.insert(last_property + 1, f"    {key} = {value}")
+        
+        self.config_content = '\n'.join(lines)
+        self.has_changes = True
+        return True
+    
+    def apply_profile(self, profile_key):
+        """Apply a performance profile to the in-memory config"""
+        profile = PERFORMANCE_PROFILES[profile_key]
+        # Only keys whose meaning changes are written, so False is not rewritten to No
+        for key, value in profile["settings"].items():
+            if not same_config_value(self.get_setting("reticulum", key, None), value):
+                self.set_setting("reticulum", key, value)
+        
+        for iface in self.parse_interfaces():
+            iface_settings = profile["interfaces"].get(config_value(iface["properties"].get("type", "")), {})
+            for key, value in iface_settings.items():
+                if not same_config_value(iface["properties"].get(key), value):
+                    self.set_interface_property(iface["name"], key, value)
+    
+    def remove_interface(self, name):
+        """Remove an interface from config"""
+        # Pattern to match the entire interface block
+        pattern = rf'\s*\[\[{re.escape(name)}\]\].*?(?=\[\[|\[(?!\[)|$)'
+        self.config_content = re.sub(pattern, '', self.config_content, flags=re.DOTALL)
+        self.has_changes = True
+    
+    def toggle_interface(self, name, enable):
+        """Enable or disable an interface"""
+        # Find the interface block and toggle enabled
+        pattern = rf'(\[\[{re.escape(name)}\]\].*?)((?:enabled|interface_enabled)\s*=\s*)(yes|no|true|false)'
+        
+        new_value = "yes" if enable else "no"
+        self.config_content = re.sub(
+            pattern,
+            rf'\g<1>\g<2>{new_value}',
+            self.config_content,
+            flags=re.DOTALL | re.IGNORECASE
+        )
+        self.has_changes = True
+    
+    def view_config(self):
+        """Display current configuration"""
+        self.clear_screen()
+        print(f"\n{self.t('view_config')}")
+        print(f"{self.t('config_location')} {self.config_path}\n")
+        print("─" * 78)
+        print(self.config_content)
+        print("─" * 78)
+        input(f"\n{self.t('press_enter')}")
+    
+    def edit_general_settings(self):
+        """Edit general Reticulum settings"""
+        while True:
+            self.clear_screen()
+            
+            # Get current values
+            loglevel = self.get_setting("logging", "loglevel", "4")
+            transport = self.get_setting("reticulum", "enable_transport", "False")
+            panic = self.get_setting("reticulum", "panic_on_interface_error", "No")
+            
+            transport_str = self.t("enabled") if transport.lower() in ["true", "yes"] else self.t("disabled")
+            panic_str = self.t("enabled") if panic.lower() in ["true", "yes"] else self.t("disabled")
+            
+            print(self.t("general_settings").format(
+                loglevel=loglevel,
+                transport=transport_str,
+                panic=panic_str
+            ))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                print(self.t("loglevel_help"))
+                new_level = input(self.t("enter_loglevel")).strip()
+                if new_level.isdigit() and 0 <= int(new_level) <= 7:
+                    self.set_setting("logging", "loglevel", new_level)
+                    print(f"\n{self.t('setting_updated')}")
+                    time.sleep(1)
+            
+            elif choice == "2":
+                print(self.t("transport_help"))
+                response = input(self.t("enable_transport")).strip().lower()
+                new_value = "True" if response == self.t("yes") else "False"
+                self.set_setting("reticulum", "enable_transport", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "3":
+                current = panic.lower() in ["true", "yes"]
+                new_value = "No" if current else "Yes"
+                self.set_setting("reticulum", "panic_on_interface_error", new_value)
+                print(f"\n{self.t('setting_updated')}")
+                time.sleep(1)
+            
+            elif choice == "4":
+                self.apply_profile_menu()
+            
+            elif choice == "5":
+                break
+    
+    def apply_profile_menu(self):
+        """Choose a performance profile, show the resulting diff and apply it"""
+        self.clear_screen()
+        profiles = list(PERFORMANCE_PROFILES.items())
+        
+        print(f"\n{self.t('profiles_title')}\n")
+        for i, (key, profile) in enumerate(profiles, 1):
+            print(f"  [{i}] {profile['name']}")
+            print(f"      {profile['description']}")
+        
+        choice = input(f"\n{self.t('select_profile')}").strip()
+        if not choice.isdigit() or not 1 <= int(choice) <= len(profiles):
+            return
+        key, profile = profiles[int(choice) - 1]
+        
+        before = self.config_content
+        had_changes = self.has_changes
+        self.apply_profile(key)
+        
+        if self.config_content == before:
+            print(f"\n{self.t('profile_no_changes')}")
+            self.has_changes = had_changes
+            time.sleep(2)
+            return
+        
+        print()
+        for line in difflib.unified_diff(before.splitlines(), self.config_content.splitlines(),
+                                         "current", profile["name"], lineterm="", n=1):
+            print(f"  {line}")
+        
+        confirm = input(f"\n{self.t('apply_profile_confirm')}").strip().lower()
+        if confirm == self.t("yes"):
+            print(f"\n{self.t('profile_applied')} {profile['name']}")
+            time.sleep(1)
+        else:
+            self.config_content = before
+            self.has_changes = had_changes
+    
+    def manage_interfaces(self):
+        """Interface management menu"""
+        while True:
+            self.clear_screen()
+            print(self.t("interface_menu"))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                self.list_interfaces()
+            elif choice == "2":
+                self.toggle_interface_menu()
+            elif choice == "3":
+                self.remove_interface_menu()
+            elif choice == "4":
+                self.add_custom_interface()
+            elif choice == "5":
+                self.add_rnode_interface_menu()
+            elif choice == "6":
+                break
+    
+    def list_interfaces(self):
+        """List all interfaces"""
+        self.clear_screen()
+        interfaces = self.parse_interfaces()
+        
+        if not interfaces:
+            print(f"\n{self.t('no_interfaces')}")
+        else:
+            print(f"\n{self.t('interface_list')}\n")
+            for i, iface in enumerate(interfaces, 1):
+                enabled = iface["properties"].get("enabled", 
+                          iface["properties"].get("interface_enabled", "no"))
+                status = "✅" if enabled.lower() in ["yes", "true"] else "🔴"
+                iface_type = iface["properties"].get("type", "Unknown")
+                
+                print(f"  {i}. {status} [{iface['name']}]")
+                print(f"      Type: {iface_type}")
+                
+                if iface_type == "TCPClientInterface":
+                    host = iface["properties"].get("target_host", "")
+                    port = iface["properties"].get("target_port", "")
+                    print(f"      Host: {host}:{port}")
+                print()
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def toggle_interface_menu(self):
+        """Toggle interface enabled/disabled"""
+        self.clear_screen()
+        interfaces = self.parse_interfaces()
+        
+        if not interfaces:
+            print(f"\n{self.t('no_interfaces')}")
+            input(f"\n{self.t('press_enter')}")
+            return
+        
+        print(f"\n{self.t('interface_list')}\n")
+        for i, iface in enumerate(interfaces, 1):
+            enabled = iface["properties"].get("enabled",
+                      iface["properties"].get("interface_enabled", "no"))
+            status = "✅" if enabled.lower() in ["yes", "true"] else "🔴"
+            print(f"  {i}. {status} {iface['name']}")
+        
+        try:
+            choice = input(f"\n{self.t('select_interface')}").strip()
+            idx = int(choice) - 1
+            if 0 <= idx < len(interfaces):
+                iface = interfaces[idx]
+                enabled = iface["properties"].get("enabled",
+                          iface["properties"].get("interface_enabled", "no"))
+                is_enabled = enabled.lower() in ["yes", "true"]
+                
+                self.toggle_interface(iface["name"], not is_enabled)
+                
+                if is_enabled:
+                    print(f"\n{self.t('interface_disabled')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('interface_enabled')} {iface['name']}")
+                time.sleep(1)
+        except (ValueError, IndexError):
+            print(f"\n{self.t('invalid_choice')}")
+            time.sleep(1)
+    
+    def remove_interface_menu(self):
+        """Remove an interface"""
+        self.clear_screen()
+        interfaces = self.parse_interfaces()
+        
+        if not interfaces:
+            print(f"\n{self.t('no_interfaces')}")
+            input(f"\n{self.t('press_enter')}")
+            return
+        
+        print(f"\n{self.t('interface_list')}\n")
+        for i, iface in enumerate(interfaces, 1):
+            print(f"  {i}. {iface['name']}")
+        
+        try:
+            choice = input(f"\n{self.t('select_interface')}").strip()
+            idx = int(choice) - 1
+            if 0 <= idx < len(interfaces):
+                iface = interfaces[idx]
+                confirm = input(f"\n{self.t('confirm_remove')}").strip().lower()
+                if confirm == self.t("yes"):
+                    self.remove_interface(iface["name"])
+                    print(f"\n{self.t('interface_removed')} {iface['name']}")
+                    time.sleep(1)
+        except (ValueError, IndexError):
+            print(f"\n{self.t('invalid_choice')}")
+            time.sleep(1)
+    
+    def add_custom_interface(self, iface_type=None):
+        """Add an interface of a chosen type, asking for each key of its template"""
+        self.clear_screen()
+        print(f"\n{self.t('add_interface_title')}\n")
+        
+        if iface_type is None:
+            types = list(INTERFACE_SCHEMAS)
+            print(f"{self.t('interface_types')}\n")
+            for i, name in enumerate(types, 1):
+                print(f"  {i:2}. {name:<22} {INTERFACE_SCHEMAS[name]['description']}")
+            choice = input(f"\n{self.t('select_interface_type')}").strip()
+            if not (choice.isdigit() and 1 <= int(choice) <= len(types)):
+                return
+            iface_type = types[int(choice) - 1]
+            print()
+        
+        name = input(self.t("interface_name")).strip()
+        if not name:
+            return
+        
+        # Each value is checked against the schema as it is typed
+        values = {}
+        print(f"\n{self.t('interface_settings')}\n")
+        for key, default in INTERFACE_SCHEMAS[iface_type]["template"].items():
+            if self.t(key) != key:
+                prompt = self.t(key)
+            else:
+                prompt = f"{key} [{default}]: " if default not in (None, "") else f"{key}: "
+            while True:
+                value = input(f"  {prompt}").strip()
+                if not value:
+                    if default is None:
+                        print(f"\n{self.t('value_required').format(key=key)}")
+                        time.sleep(1)
+                        return
+                    value = default
+                problem = check_interface_value(iface_type, key, str(value)) if value != "" else None
+                if not problem:
+                    break
+                print(f"  ❌ {key} {problem}")
+            values[key] = value
+        
+        if self.add_interface(name, iface_type, values):
+            print(f"\n{self.t('interface_added')} {name}")
+        else:
+            print(f"\n{self.t('already_exists')}")
+        
+        time.sleep(1)
+    
+    def add_rnode_interface_menu(self):
+        """Pick a detected serial device and a radio preset for a new RNode interface"""
+        self.clear_screen()
+        print(f"\n{self.t('rnode_title')}\n")
+        
+        ports = find_serial_ports()
+        if ports:
+            print(f"{self.t('rnode_ports')}\n")
+            for i, port in enumerate(ports, 1):
+                marker = "📻" if port["likely_rnode"] else "  "
+                print(f"  {i}. {marker} {describe_port(port)}")
+        else:
+            print(self.t("rnode_no_ports"))
+        
+        choice = input(f"\n{self.t('rnode_select_port')}").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(ports):
+            port = ports[int(choice) - 1]["port"]
+        elif choice.startswith("/") or choice.upper().startswith("COM"):
+            port = choice
+        else:
+            return
+        
+        presets = list(RNODE_PRESETS)
+        print(f"\n{self.t('rnode_presets')}\n")
+        for i, key in enumerate(presets, 1):
+            print(f"  {i}. {RNODE_PRESETS[key]['name']:<28} {RNODE_PRESETS[key]['description']}")
+        choice = input(f"\n{self.t('rnode_select_preset')}").strip()
+        preset = presets[int(choice) - 1] if choice.isdigit() and 1 <= int(choice) <= len(presets) else DEFAULT_RNODE_PRESET
+        
+        # Every value can still be adjusted, Enter keeps the preset
+        settings = rnode_settings(preset)
+        print()
+        for key in RNODE_SETTINGS:
+            value = input(f"  {key} [{settings[key]}]: ").strip()
+            if value:
+                try:
+                    settings[key] = int(value)
+                except ValueError:
+                    print(f"\n{self.t('invalid_choice')}")
+                    time.sleep(1)
+                    return
+        
+        report = lora_link_report(settings["spreadingfactor"], settings["bandwidth"], settings["codingrate"],
+                                  frequency=settings["frequency"])
+        print()
+        for line in format_lora_report(report):
+            print(line)
+        if any(issue["severity"] == "error" for issue in report["issues"]):
+            input(f"\n{self.t('press_enter')}")
+            return
+        
+        name = input(f"\n{self.t('interface_name')}").strip() or "RNode LoRa Interface"
+        if self.add_rnode_interface(name, port, settings):
+            print(f"\n{self.t('interface_added')} {name}")
+        else:
+            print(f"\n{self.t('already_exists')}")
+        
+        time.sleep(1)
+    
+    def add_tcp_interface_menu(self):
+        """Add TCP Client interfaces menu"""
+        while True:
+            self.clear_screen()
+            print(self.t("tcp_menu"))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                iface = TCP_INTERFACES["rmap"]
+                if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                    print(f"\n{self.t('interface_added')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "2":
+                iface = TCP_INTERFACES["dublin"]
+                if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                    print(f"\n{self.t('interface_added')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "3":
+                iface = TCP_INTERFACES["btb"]
+                if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                    print(f"\n{self.t('interface_added')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "4":
+                iface = TCP_INTERFACES["sydney"]
+                if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                    print(f"\n{self.t('interface_added')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "5":
+                iface = TCP_INTERFACES["germany"]
+                if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                    print(f"\n{self.t('interface_added')} {iface['name']}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "6":
+                self.add_custom_interface("TCPClientInterface")
+            
+            elif choice == "7":
+                # Add all recommended interfaces
+                added = 0
+                for key in ["rmap", "dublin", "btb"]:
+                    iface = TCP_INTERFACES[key]
+                    if self.add_tcp_interface(iface["name"], iface["host"], iface["port"]):
+                        added += 1
+                
+                if added > 0:
+                    print(f"\n{self.t('nodes_added')} ({added} nodes)")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            
+            elif choice == "8":
+                self.browse_node_directory()
+            
+            elif choice == "9":
+                break
+    
+    def tcp_nodes(self):
+        """Built-in public nodes merged with the cached node directory"""
+        return merge_node_directory(self.node_directory)
+    
+    def browse_node_directory(self):
+        """List every known public node and add the selected ones"""
+        while True:
+            self.clear_screen()
+            nodes = list(self.tcp_nodes().values())
+            
+            print(f"\n{self.t('directory_title')}")
+            source = self.node_directory.source or self.t("directory_builtin_only")
+            fetched = self.node_directory.cache.get("fetched_at")
+            fetched_str = datetime.fromtimestamp(fetched).strftime("%Y-%m-%d %H:%M") if fetched else self.t("directory_never")
+            print(f"  {self.t('directory_source').format(source=source, updated=fetched_str)}")
+            if self.node_directory.last_error:
+                print(f"  {self.t('directory_refresh_failed')} {self.node_directory.last_error}")
+            print()
+            
+            for i, node in enumerate(nodes, 1):
+                print(f"  {i:3}. {node['name']:<32} {node['host']}:{node['port']}")
+                if node.get("description"):
+                    print(f"       {node['description']}")
+            
+            choice = input(f"\n{self.t('directory_select')}").strip().lower()
+            
+            if not choice:
+                break
+            elif choice == "r":
+                print(f"\n  {self.t('directory_refreshing')}")
+                self.node_directory.refresh(force=True)
+            elif choice == "s":
+                source = input(f"\n  {self.t('directory_enter_source')}").strip()
+                if source:
+                    self.node_directory.set_source(source)
+                    print(f"\n  {self.t('directory_refreshing')}")
+                    self.node_directory.refresh(force=True)
+            elif choice.isdigit() and 1 <= int(choice) <= len(nodes):
+                node = nodes[int(choice) - 1]
+                added = self.add_tcp_interface(node["name"], node["host"], node["port"])
+                if added:
+                    print(f"\n{self.t('interface_added')} {added}")
+                else:
+                    print(f"\n{self.t('already_exists')}")
+                time.sleep(1)
+            else:
+                print(f"\n{self.t('invalid_choice')}")
+                time.sleep(1)
+    
+    def quick_connect(self, count=QUICK_CONNECT_COUNT):
+        """Quick connect - probe public nodes and add the fastest ones"""
+        self.clear_screen()
+        print(self.t("quick_connect"))
+        
+        nodes = self.tcp_nodes()
+        print(f"{self.t('probing_nodes').format(count=len(nodes))}\n")
+        results = probe_tcp_nodes(nodes)
+        self.print_probe_results(results)
+        
+        fastest = [r for r in results if r["reachable"]][:count]
+        if not fastest:
+            print(f"\n{self.t('no_nodes_reachable')}")
+            time.sleep(2)
+            return
+        
+        confirm = input(f"\n{self.t('add_fastest_confirm').format(count=len(fastest))}").strip().lower()
+        if confirm == self.t("yes"):
+            added = 0
+            for result in fastest:
+                name = self.add_tcp_interface(result["name"], result["host"], result["port"])
+                if name:
+                    print(f"  {self.t('node_added')} {name}")
+                    added += 1
+                else:
+                    print(f"  {self.t('node_skipped')} {result['name']}")
+            
+            if added > 0:
+                print(f"\n{self.t('nodes_added')}")
+            time.sleep(2)
+    
+    def print_probe_results(self, results):
+        """Print a ranked table of probe results"""
+        for i, result in enumerate(results, 1):
+            if result["reachable"]:
+                stats = f"{result['latency']:7.1f} ms  ±{result['jitter']:5.1f} ms"
+                if result["loss"] > 0:
+                    stats += "  " + self.t("node_loss").format(loss=f"{result['loss']:.0%}")
+                print(f"  {i}. ✅ {result['name']:<32} {stats}")
+            else:
+                print(f"  {i}. 🔴 {result['name']:<32} {self.t('node_unreachable')}")
+    
+    def check_and_fix_config(self):
+        """Check configuration for issues and optionally fix them"""
+        self.clear_screen()
+        print(self.t("check_fix_title"))
+        print(f"{self.t('checking_config')}\n")
+        
+        # FIRST: Check what would stop rnsd from loading the config
+        rnsd_ok, rnsd_error = self.validate_config()
+        
+        # A config rnsd loads can still have warnings worth fixing, so lint runs either way
+        if rnsd_ok:
+            print(f"  {self.t('rnsd_test_passed')}")
+        elif rnsd_error:
+            print(f"  {self.t('rnsd_test_failed')}")
+            print(f"    {rnsd_error}\n")
+        
+        diagnostics = lint_config(self.config_content, config_dir=self.config_path.parent)
+        issues = [f"line {d['line']}:{d['column']}  {self.describe_diagnostic(d)}" for d in diagnostics]
+        fixes = [d for d in diagnostics if d["fix"]]
+        
+        # Display results
+        if not issues:
+            if rnsd_error:
+                # rnsd failed but we couldn't detect the issue
+                print(f"\n  ⚠️  Could not automatically detect the issue.")
+                print(f"  Please check the config file manually for syntax errors.")
+                print(f"\n  Common issues:")
+                print(f"    • Incorrect indentation (use 2 spaces for [[Interface]], 4 for properties)")
+                print(f"    • Missing or extra brackets")
+                print(f"    • Invalid parameter names or values")
+                print(f"    • Tabs instead of spaces")
+                
+                # Offer to rebuild config
+                print(f"\n  Would you like to rebuild the config from scratch?")
+                response = input(f"  This will reset to defaults but preserve interfaces (y/n): ").strip().lower()
+                if response == self.t("yes"):
+                    self.rebuild_config()
+            else:
+                print(f"\n{self.t('config_valid')}")
+        else:
+            print(f"\n{self.t('config_issues').format(count=len(issues))}\n")
+            for i, issue in enumerate(issues, 1):
+                print(f"  {i}. {issue}")
+            
+            # Ask if user wants to fix
+            print()
+            response = input(self.t("fix_issues")).strip().lower() if fixes else ""
+            
+            if response == self.t("yes"):
+                print(f"\n{self.t('fixing_issues')}\n")
+                self.apply_fixes(fixes)
+                print(f"\n{self.t('issues_fixed')}")
+                
+                # Test again
+                rnsd_ok, rnsd_error = self.validate_config()
+                if rnsd_ok:
+                    print(f"\n  {self.t('rnsd_test_passed')}")
+                elif rnsd_error:
+                    print(f"\n  {self.t('rnsd_test_failed')}")
+                    print(f"    {rnsd_error}")
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def describe_diagnostic(self, diagnostic):
+        """Translated text for a lint diagnostic, falling back to its English message"""
+        key = LINT_MESSAGE_KEYS.get(diagnostic["code"])
+        try:
+            return self.t(key).format(**diagnostic["params"]) if key else diagnostic["message"]
+        except KeyError:
+            return diagnostic["message"]
+    
+    def rebuild_config(self):
+        """Rebuild config from scratch, preserving interface definitions"""
+        print(f"\n  🔧 Rebuilding configuration...")
+        
+        # Extract existing interfaces
+        interfaces_section = re.search(r'\[interfaces\]\s*\n(.*?)(?=\n\[[a-z]|\Z)', 
+                                       self.config_content, re.DOTALL | re.IGNORECASE)
+        
+        interfaces_content = ""
+        if interfaces_section:
+            # Parse and rebuild interfaces with correct indentation
+            section = interfaces_section.group(1)
+            current_iface = None
+            current_props = []
+            interfaces = []
+            
+            for line in section.split('\n'):
+                stripped = line.strip()
+                
+                # Skip empty lines and comments
+                if not stripped or stripped.startswith('#'):
+                    continue
+                
+                # Interface header
+                iface_match = re.match(r'\[\[([^\]]+)\]\]', stripped)
+                if iface_match:
+                    # Save previous interface
+                    if current_iface:
+                        interfaces.append((current_iface, current_props))
+                    current_iface = iface_match.group(1)
+                    current_props = []
+                    continue
+                
+                # Property
+                prop_match = re.match(r'(\w+)\s*=\s*(.+)', stripped)
+                if prop_match and current_iface:
+                    current_props.append((prop_match.group(1), prop_match.group(2)))
+            
+            # Don't forget last interface
+            if current_iface:
+                interfaces.append((current_iface, current_props))
+            
+            # Rebuild with correct indentation
+            for iface_name, props in interfaces:
+                interfaces_content += f"\n  [[{iface_name}]]\n"
+                for key, value in props:
+                    interfaces_content += f"    {key} = {value}\n"
+        
+        # If no interfaces found, add default
+        if not interfaces_content.strip():
+            interfaces_content = """
+  [[Default Interface]]
+    type = AutoInterface
+    enabled = yes
+"""
+
+        # Build new config
+        self.config_content = f"""[reticulum]
+enable_transport = No
+share_instance = Yes
+
+[logging]
+loglevel = 4
+
+[interfaces]
+{interfaces_content}"""
+
+        self.has_changes = True
+        print(f"  ✅ Configuration rebuilt successfully!")
+        print(f"  Please save and test with rnsd.")
+    
+    def validate_config(self, with_rnsd=False):
+        """Validate the config in-process, return (success, error_message)
+
+        The in-process check takes milliseconds and is what the menus use.
+        with_rnsd also starts rnsd on a config that passed it, which catches
+        what only loading the interfaces shows, such as a missing serial
+        port; without rnsd installed the in-process result stands.
+        """
+        ok, error = self.validate_config_inprocess()
+        if ok and with_rnsd:
+            rnsd_ok, rnsd_error = self.test_with_rnsd_silent()
+            if rnsd_ok is not None or rnsd_error is not None:
+                return rnsd_ok, rnsd_error
+        return ok, error
+    
+    def validate_config_inprocess(self):
+        """Check the config as rnsd would load it without starting rnsd, return (success, error_message)"""
+        ConfigObj = load_rns_configobj()
+        if ConfigObj is not None:
+            # The loader RNS itself uses settles what counts as valid syntax
+            try:
+                config = ConfigObj(self.config_content.splitlines())
+            except Exception as e:
+                return False, f"Could not parse the configuration: {e}"
+            for name, iface in config.get("interfaces", {}).items():
+                if not isinstance(iface, dict):
+                    return False, f"'{name}' in [interfaces] is not an [[interface]] section"
+        
+        diagnostics = lint_config(self.config_content, config_dir=self.config_path.parent, codes=VALIDATION_LINT_CODES)
+        errors = [d for d in diagnostics if d["severity"] == "error"]
+        if errors:
+            return False, f"line {errors[0]['line']}: {errors[0]['message']}"
+        return True, None
+    
+    def test_with_rnsd_silent(self, timeout=None):
+        """Test the config with rnsd silently, return (success, error_message)"""
+        # Check if rnsd is available
+        if shutil.which("rnsd") is None:
+            return None, None  # rnsd not available
+        
+        if timeout is None:
+            timeout = self.rnsd_timeout
+        return self.test_pending_config(lambda: self._run_rnsd(timeout))
+    
+    def _run_rnsd(self, timeout):
+        """Run rnsd and watch its log until it reports being up or failing"""
+        process = None
+        try:
+            env = dict(os.environ, PYTHONUNBUFFERED="1")
+            process = subprocess.Popen(
+                ["rnsd", "--config", str(self.config_path.parent)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                env=env
+            )
+            return self._watch_rnsd_log(process, timeout)
+        except Exception as e:
+            return None, f"Test error: {e}"
+        finally:
+            if process is not None and process.poll() is None:
+                process.terminate()
+                try:
+                    process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+    
+    def _watch_rnsd_log(self, process, timeout):
+        """Read rnsd output until a readiness or error marker, return (success, error_message)"""
+        lines = queue.Queue()
+        
+        def reader():
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+        
+        threading.Thread(target=reader, daemon=True).start()
+        
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None, f"rnsd did not report startup within {timeout} seconds"
+            
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            
+            if line is None:
+                # rnsd exited before reporting that it was up
+                returncode = process.wait()
+                error_lines = [l.strip() for l in output if l.strip()]
+                if returncode != 0:
+                    return False, error_lines[-1] if error_lines else f"rnsd exited with code {returncode}"
+                return None, "rnsd exited without reporting startup"
+            
+            output.append(line)
+            if any(marker in line for marker in RNSD_ERROR_MARKERS):
+                return False, line.strip()
+            if any(marker in line for marker in RNSD_READY_MARKERS):
+                return True, None
+    
+    def tools_menu(self):
+        """Network tools menu"""
+        while True:
+            self.clear_screen()
+            print(self.t("tools_menu"))
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                self.monitor_interfaces()
+            elif choice == "2":
+                self.traffic_dashboard()
+            elif choice == "3":
+                self.capacity_planner()
+            elif choice == "4":
+                break
+    
+    def get_tcp_targets(self):
+        """Return enabled TCPClientInterface targets keyed by interface name"""
+        targets = {}
+        for iface in self.parse_interfaces():
+            props = iface["properties"]
+            enabled = props.get("enabled", props.get("interface_enabled", "no"))
+            if props.get("type") != "TCPClientInterface" or enabled.lower() not in ["yes", "true"]:
+                continue
+            if not props.get("target_host") or not props.get("target_port", "").isdigit():
+                continue
+            targets[iface["name"]] = {
+                "name": iface["name"],
+                "host": props["target_host"],
+                "port": props["target_port"],
+            }
+        return targets
+    
+    def monitor_interfaces(self, interval=MONITOR_INTERVAL):
+        """Periodically probe enabled TCP client targets and flag unhealthy ones"""
+        self.clear_screen()
+        targets = self.get_tcp_targets()
+        if not targets:
+            print(f"\n{self.t('no_tcp_targets')}")
+            input(f"\n{self.t('press_enter')}")
+            return
+        
+        response = input(f"\n{self.t('monitor_auto_disable')}").strip().lower()
+        auto_disable = response == self.t("yes")
+        
+        history = {name: LatencyHistory() for name in targets}
+        disabled = []
+        rounds = 0
+        
+        try:
+            while targets:
+                results = probe_tcp_nodes(targets, samples=1)
+                rounds += 1
+                for result in results:
+                    history[result["key"]].add(result["latency"])
+                
+                if auto_disable:
+                    for name in list(targets):
+                        if history[name].status() == "down":
+                            self.toggle_interface(name, False)
+                            disabled.append(name)
+                            del targets[name]
+                
+                self.clear_screen()
+                print(f"\n{self.t('monitor_title').format(round=rounds, interval=interval)}\n")
+                for name, hist in history.items():
+                    status = hist.status()
+                    if name in disabled:
+                        status = "disabled"
+                    icon = {"ok": "✅", "slow": "🐢", "down": "🔴", "disabled": "⛔"}.get(status, "⏳")
+                    median = hist.median_latency()
+                    median_str = f"{median:7.1f} ms" if median is not None else "      - ms"
+                    row = self.t("monitor_row").format(median=median_str, lost=f"{hist.failure_ratio():4.0%}")
+                    print(f"  {icon} {name:<32} {self.t('health_' + status):<10} {row}")
+                
+                if disabled:
+                    print(f"\n  {self.t('monitor_disabled').format(names=', '.join(disabled))}")
+                if not targets:
+                    break
+                print(f"\n{self.t('monitor_stop_hint')}")
+                sys.stdout.flush()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+        
+        input(f"\n{self.t('press_enter')}")
+    
+    def capacity_planner(self):
+        """Ask for the expected announce load and show the per-interface projection"""
+        self.clear_screen()
+        print(f"\n{self.t('planner_title')}\n")
+        
+        destinations = input(self.t("enter_destinations")).strip() or "100"
+        interval = input(self.t("enter_announce_interval")).strip() or "30"
+        try:
+            destinations = int(destinations)
+            interval = float(interval)
+            if destinations < 0 or interval <= 0:
+                raise ValueError
+        except ValueError:
+            print(f"\n{self.t('invalid_choice')}")
+            time.sleep(1)
+            return
+        
+        rows = plan_announce_capacity(self.parse_interfaces(), destinations, interval)
+        print()
+        if not rows:
+            print(self.t("no_interfaces"))
+        for line in format_capacity_report(rows, destinations, interval):
+            print(line)
+        input(f"\n{self.t('press_enter')}")
+    
+    def traffic_dashboard(self, interval=DASHBOARD_INTERVAL):
+        """Show live per-interface traffic, redrawing only the lines that change"""
+        self.clear_screen()
+        source = InterfaceStatsSource(self.config_path.parent)
+        previous = None
+        previous_time = None
+        
+        try:
+            while True:
+                stats = source.fetch()
+                now = time.monotonic()
+                if stats is None:
+                    if previous is None:
+                        print(f"\n{self.t('stats_unavailable')}")
+                        input(f"\n{self.t('press_enter')}")
+                        return
+                    time.sleep(interval)
+                    continue
+                
+                elapsed = now - previous_time if previous_time else 0
+                rows = interface_rates(previous, stats, elapsed)
+                previous, previous_time = stats, now
+                
+                lines = [
+                    "",
+                    self.t("dashboard_title").format(time=datetime.now().strftime("%H:%M:%S"), interval=interval),
+                    "",
+                    f"  {self.t('dashboard_interface'):<30} {'RX/s':>10} {'TX/s':>10} {'RX total':>10} "
+                    f"{'TX total':>10} {'Ann/min':>11} {'Peers':>5}",
+                    "  " + "─" * 92,
+                ]
+                for row in rows:
+                    status = "✅" if row["up"] else "🔴"
+                    rx_rate = format_bytes(row["rx_rate"]) if row["rx_rate"] is not None else "-"
+                    tx_rate = format_bytes(row["tx_rate"]) if row["tx_rate"] is not None else "-"
+                    announces = f"{row['announces_in']:.1f}↓{row['announces_out']:.1f}↑"
+                    peers = str(row["peers"]) if row["peers"] is not None else ""
+                    lines.append(
+                        f"{status} {row['name'][:30]:<30} {rx_rate:>10} {tx_rate:>10} "
+                        f"{format_bytes(row['rxb']):>10} {format_bytes(row['txb']):>10} "
+                        f"{announces:>11} {peers:>5}"
+                    )
+                lines.append("")
+                lines.append(self.t("dashboard_stop_hint"))
+                
+                self.clear_screen()
+                print("\n".join(lines))
+                sys.stdout.flush()
+                
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print()
+    
+    def main_menu(self):
+        """Main menu loop"""
+        while True:
+            if self.watcher.changed.is_set():
+                self.sync_external_changes()
+                input(f"\n{self.t('press_enter')}")
+            
+            self.clear_screen()
+            print(self.t("main_menu"))
+            
+            # Show if there are unsaved changes
+            if self.config_content != self.original_content:
+                print("  ⚠️  You have unsaved changes!\n")
+            
+            choice = input(self.t("enter_choice")).strip()
+            
+            if choice == "1":
+                self.view_config()
+            elif choice == "2":
+                self.edit_general_settings()
+            elif choice == "3":
+                self.manage_interfaces()
+            elif choice == "4":
+                self.add_tcp_interface_menu()
+            elif choice == "5":
+                self.quick_connect()
+            elif choice == "6":
+                self.check_and_fix_config()
+            elif choice == "7":
+                self.tools_menu()
+            elif choice == "8":
+                self.save_config()
+                print(f"\n{self.t('goodbye')}")
+                break
+            elif choice == "9":
+                if self.config_content != self.original_content:
+                    confirm = input(self.t("exit_without_save")).strip().lower()
+                    if confirm != self.t("yes"):
+                        continue
+                print(f"\n{self.t('goodbye')}")
+                break
+            else:
+                print(f"\n{self.t('invalid_choice')}")
+                time.sleep(1)
+    
+    def run(self):
+        """Main entry point"""
+        try:
+            self.select_language()
+            
+            self.clear_screen()
+            print(self.t("welcome"))
+            
+            if not self.load_config():
+                input(f"\n{self.t('press_enter')}")
+                print(f"\n{self.t('goodbye')}")
+                return
+            
+            input(f"\n{self.t('press_enter')}")
+            
+            # Refresh the public node directory while the user works
+            self.node_directory.refresh_in_background()
+            self.watcher.start()
+            
+            self.main_menu()
+        
+        except KeyboardInterrupt:
+            print(f"\n\n{self.t('goodbye')}")
+            sys.exit(0)
+
+
+def interface_summary(iface):
+    """Plain dict describing an interface for list output"""
+    props = iface["properties"]
+    enabled = props.get("enabled", props.get("interface_enabled", "no"))
+    target = props.get("target_host") or props.get("listen_ip") or props.get("port") or ""
+    if props.get("target_port") or props.get("listen_port"):
+        target += f":{props.get('target_port') or props.get('listen_port')}"
+    return {
+        "name": iface["name"],
+        "type": props.get("type", ""),
+        "enabled": enabled.lower() in ["yes", "true"],
+        "target": target,
+        "properties": props,
+    }
+
+
+def interface_section(section):
+    """Interface name for a section written as interfaces/NAME, else None"""
+    prefix, _, name = section.partition("/")
+    return name if prefix == "interfaces" and name else None
@@ -0,0 +1,472 @@
+"""Command line of the Reticulum configurator"""
+
+import sys
+import argparse
+import json
+
+from rnstools.api_defaults import API_HOST, API_PORT
+from rnstools.configdiff import (
+    apply_patch,
+    diff_configs,
+    format_diff,
+    load_patch,
+    make_patch,
+)
+from rnstools.core import cli_fix, cli_lint, save_cli_changes
+from rnstools.fleet import FLEET_WORKERS, FleetOperationAction, run_fleet
+from rnstools.lora import format_lora_report, interface_lora_report, lora_link_report
+from rnstools.nodes import PROBE_TIMEOUT, QUICK_CONNECT_COUNT, probe_tcp_nodes
+from rnstools.planner import format_capacity_report, plan_announce_capacity
+from rnstools.profiles import PERFORMANCE_PROFILES
+from rnstools.reticulum import ReticulumConfigurator, interface_section, interface_summary
+from rnstools.rnode import (
+    DEFAULT_RNODE_PRESET,
+    RNODE_PRESETS,
+    RNODE_SETTINGS,
+    describe_port,
+    find_serial_ports,
+    rnode_settings,
+)
+from rnstools.schema import INTERFACE_SCHEMAS, validate_template
+from rnstools.store import BackupStore, atomic_write
+
+
+def build_cli_parser():
+    """Argument parser for the non-interactive commands"""
+    parser = argparse.ArgumentParser(
+        prog="reticulum_configurator.py",
+        description="Reticulum configurator. Run without arguments for the interactive menu."
+    )
+    parser.add_argument("--config", default=None, help="path to the Reticulum config file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    # Options shared by every command that changes the config
+    changing = argparse.ArgumentParser(add_help=False)
+    changing.add_argument("--dry-run", action="store_true", help="show the changes without writing them")
+    
+    get = commands.add_parser("get", help="print a setting; use interfaces/NAME as section for interface keys")
+    get.add_argument("section")
+    get.add_argument("key")
+    
+    set_ = commands.add_parser("set", parents=[changing], help="change a setting; interfaces/NAME for interface keys")
+    set_.add_argument("section")
+    set_.add_argument("key")
+    set_.add_argument("value")
+    
+    add = commands.add_parser("add", parents=[changing], help="add an interface of any type from its template")
+    add.add_argument("name")
+    add.add_argument("type", choices=list(INTERFACE_SCHEMAS))
+    add.add_argument("settings", nargs="*", metavar="KEY=VALUE", help="values replacing or adding to the template")
+    
+    add_tcp = commands.add_parser("add-tcp", parents=[changing], help="add a TCP client interface")
+    add_tcp.add_argument("name")
+    add_tcp.add_argument("host")
+    add_tcp.add_argument("port", type=int)
+    
+    add_rnode = commands.add_parser("add-rnode", parents=[changing], help="add an RNode LoRa interface from a radio preset")
+    add_rnode.add_argument("name")
+    add_rnode.add_argument("--port", help="serial port (default: the only detected RNode)")
+    add_rnode.add_argument("--preset", choices=list(RNODE_PRESETS), default=DEFAULT_RNODE_PRESET)
+    for key in RNODE_SETTINGS:
+        add_rnode.add_argument(f"--{key}", type=int, help=f"override the preset {key}")
+    
+    airtime = commands.add_parser("airtime", help="time on air and throughput of the RNode interfaces or of a preset")
+    airtime.add_argument("--preset", choices=list(RNODE_PRESETS), help="report on a preset instead of the config")
+    for key in ["frequency", "bandwidth", "spreadingfactor", "codingrate"]:
+        airtime.add_argument(f"--{key}", type=int, help=f"override the preset {key}")
+    airtime.add_argument("--duty-cycle", type=float, help="airtime limit in percent (default: the EU sub-band limit)")
+    airtime.add_argument("--json", action="store_true", help="print the reports as JSON")
+    
+    ports = commands.add_parser("ports", help="list USB serial devices that may be RNodes")
+    ports.add_argument("--json", action="store_true", help="print the devices as JSON")
+    
+    remove = commands.add_parser("remove", parents=[changing], help="remove an interface")
+    remove.add_argument("name")
+    
+    toggle = commands.add_parser("toggle", parents=[changing], help="enable or disable an interface")
+    toggle.add_argument("name")
+    toggle.add_argument("state", choices=["on", "off"])
+    
+    lint = commands.add_parser("lint", help="check the config; exits 1 if there are errors")
+    lint.add_argument("--json", action="store_true", help="print the diagnostics as JSON")
+    
+    commands.add_parser("fix", parents=[changing], help="apply every automatic lint fix")
+    
+    validate = commands.add_parser("validate", help="check that rnsd would load the config; exits 1 if not")
+    validate.add_argument("--rnsd", action="store_true", help="also start rnsd on the config, if installed")
+    validate.add_argument("--timeout", type=float, help="seconds to wait for rnsd to report startup")
+    
+    list_ = commands.add_parser("list", help="list the configured interfaces")
+    list_.add_argument("--json", action="store_true", help="print the interfaces as JSON")
+    
+    quick = commands.add_parser("quick-connect", parents=[changing], help="probe public nodes and add the fastest")
+    quick.add_argument("-n", "--count", type=int, default=QUICK_CONNECT_COUNT, help="number of nodes to add")
+    quick.add_argument("--timeout", type=float, default=PROBE_TIMEOUT, help="connect timeout per probe in seconds")
+    
+    plan = commands.add_parser("plan", help="announce capacity report for the configured interfaces")
+    plan.add_argument("-d", "--destinations", type=int, default=100, help="expected number of destinations")
+    plan.add_argument("-i", "--interval", type=float, default=30, help="announce interval in minutes")
+    plan.add_argument("--app-data", type=int, default=0, help="bytes of app data per announce")
+    plan.add_argument("--json", action="store_true", help="print the report as JSON")
+    
+    fleet = commands.add_parser("fleet", help="apply the same changes to many config files in parallel")
+    fleet.add_argument("paths", nargs="*", help="config files, directories or glob patterns")
+    fleet.add_argument("--list", dest="list_file", help="file with one config path or glob per line")
+    fleet.add_argument("--workers", type=int, default=FLEET_WORKERS)
+    fleet.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    # Every operation lands in one list, so they run in the order given
+    fleet.set_defaults(operations=[])
+    fleet.add_argument("--add-tcp", nargs=3, action=FleetOperationAction, const="add_tcp", dest="operations",
+                       metavar=("NAME", "HOST", "PORT"))
+    fleet.add_argument("--set", nargs=3, action=FleetOperationAction, const="set", dest="operations",
+                       metavar=("SECTION", "KEY", "VALUE"), help="interfaces/NAME as SECTION for interface keys")
+    fleet.add_argument("--toggle", nargs=2, action=FleetOperationAction, const="toggle", dest="operations",
+                       metavar=("NAME", "on|off"))
+    fleet.add_argument("--remove", nargs=1, action=FleetOperationAction, const="remove", dest="operations",
+                       metavar="NAME")
+    fleet.add_argument("--profile", nargs=1, action=FleetOperationAction, const="profile", dest="operations",
+                       choices=list(PERFORMANCE_PROFILES))
+    fleet.add_argument("--patch", nargs=1, action=FleetOperationAction, const="patch", dest="operations",
+                       metavar="FILE", help="apply a patch written by the diff command")
+    
+    diff = commands.add_parser("diff", help="semantic diff between two configs, optionally saved as a patch")
+    diff.add_argument("old", help="original config file")
+    diff.add_argument("new", nargs="?", help="changed config file (default: --config)")
+    diff.add_argument("-o", "--output", help="write the changes as a patch file")
+    diff.add_argument("--json", action="store_true", help="print the changes as JSON")
+    
+    patch = commands.add_parser("patch", parents=[changing], help="apply a patch file to the config")
+    patch.add_argument("patch", help="patch file written by the diff command")
+    
+    backups = commands.add_parser("backups", help="list stored config backups or restore one")
+    backups.add_argument("--restore", metavar="HASH", help="restore the backup with this (abbreviated) hash")
+    
+    serve = commands.add_parser("serve", help="serve the configurator as a local JSON-RPC API over HTTP")
+    serve.add_argument("--host", default=API_HOST, help=f"address to listen on (default {API_HOST})")
+    serve.add_argument("--port", type=int, default=API_PORT, help=f"port to listen on (default {API_PORT})")
+    serve.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of a TCP port")
+    serve.add_argument("--token", help="require 'Authorization: Bearer TOKEN' (default $RNSTOOLS_API_TOKEN); "
+                       "needed unless --socket is used")
+    
+    return parser
+
+
+def run_backups(configurator, restore=None):
+    """Handle the backups command"""
+    store = BackupStore(configurator.config_path)
+    if restore:
+        try:
+            content = store.read(restore)
+        except KeyError as e:
+            print(f"❌ {e.args[0]}", file=sys.stderr)
+            return 1
+        configurator.create_backup(verbose=False)
+        configurator.config_content = content
+        configurator.write_config()
+        print(f"✅ Restored {restore} to {configurator.config_path}")
+        return 0
+    
+    entries = store.entries()
+    if not entries:
+        print(f"No backups in {store.directory}")
+    for entry in reversed(entries):
+        print(f"  {entry['hash'][:12]}  {entry['time']}  {entry['size']:>7} bytes")
+    return 0
+
+
+def run_diff(old_path, new_path, output=None, as_json=False):
+    """Handle the diff command"""
+    try:
+        with open(old_path, 'r') as f:
+            old_content = f.read()
+        with open(new_path, 'r') as f:
+            new_content = f.read()
+    except OSError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    
+    changes = diff_configs(old_content, new_content)
+    if output:
+        atomic_write(output, json.dumps(make_patch(changes), indent=2))
+    if as_json:
+        print(json.dumps(changes, indent=2))
+    elif not output:
+        for line in format_diff(changes) or ["No differences"]:
+            print(line)
+    return 0
+
+
+def run_ports(as_json=False):
+    """Handle the ports command"""
+    ports = find_serial_ports()
+    if as_json:
+        print(json.dumps(ports, indent=2))
+        return 0
+    if not ports:
+        print("No USB serial devices found")
+    for port in ports:
+        print(f"{'📻' if port['likely_rnode'] else '  '} {describe_port(port)}")
+    return 0
+
+
+def cli_get(configurator, args):
+    """Print one setting"""
+    name = interface_section(args.section)
+    if name:
+        iface = next((i for i in configurator.parse_interfaces() if i["name"] == name), None)
+        value = iface["properties"].get(args.key) if iface else None
+    else:
+        value = configurator.get_setting(args.section, args.key, None)
+    if value is None:
+        print(f"❌ {args.section} {args.key} is not set", file=sys.stderr)
+        return 1
+    print(value)
+    return 0
+
+
+def cli_set(configurator, args):
+    """Change one setting"""
+    name = interface_section(args.section)
+    if name:
+        if not configurator.set_interface_property(name, args.key, args.value):
+            print(f"❌ No interface named '{name}'", file=sys.stderr)
+            return 1
+    else:
+        configurator.set_setting(args.section, args.key, args.value)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_add(configurator, args):
+    """Add an interface of any type, checking its settings against the schema first"""
+    if any(i["name"] == args.name for i in configurator.parse_interfaces()):
+        print(f"❌ An interface named '{args.name}' already exists", file=sys.stderr)
+        return 1
+    values = {}
+    for setting in args.settings:
+        key, sep, value = setting.partition("=")
+        if not sep or not key.strip():
+            print(f"❌ Expected KEY=VALUE: {setting}", file=sys.stderr)
+            return 1
+        values[key.strip()] = value.strip()
+    problems = validate_template(args.type, values)
+    for key, message in problems:
+        print(f"❌ {message}", file=sys.stderr)
+    if problems:
+        return 1
+    configurator.add_interface(args.name, args.type, values)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_add_tcp(configurator, args):
+    """Add a TCP client interface, doing nothing if one already points at the same host and port"""
+    if any(i["name"] == args.name for i in configurator.parse_interfaces()):
+        print(f"❌ An interface named '{args.name}' already exists", file=sys.stderr)
+        return 1
+    configurator.add_tcp_interface(args.name, args.host, args.port)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_add_rnode(configurator, args):
+    """Add an RNode interface on the given or the detected port"""
+    if any(i["name"] == args.name for i in configurator.parse_interfaces()):
+        print(f"❌ An interface named '{args.name}' already exists", file=sys.stderr)
+        return 1
+    port = args.port
+    if port is None:
+        likely = [p["port"] for p in find_serial_ports() if p["likely_rnode"]]
+        if len(likely) != 1:
+            found = f"Several RNodes found ({', '.join(likely)})" if likely else "No RNode found"
+            print(f"❌ {found}, choose the port with --port", file=sys.stderr)
+            return 1
+        port = likely[0]
+    settings = rnode_settings(args.preset, **{key: getattr(args, key) for key in RNODE_SETTINGS})
+    report = lora_link_report(settings["spreadingfactor"], settings["bandwidth"], settings["codingrate"],
+                              frequency=settings["frequency"])
+    for issue in report["issues"]:
+        print(f"{'❌' if issue['severity'] == 'error' else '⚠️ '} {issue['message']}", file=sys.stderr)
+    if any(issue["severity"] == "error" for issue in report["issues"]):
+        return 1
+    if not configurator.add_rnode_interface(args.name, port, settings):
+        print(f"❌ An RNode interface on {port} already exists", file=sys.stderr)
+        return 1
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_remove(configurator, args):
+    """Remove an interface"""
+    if not any(i["name"] == args.name for i in configurator.parse_interfaces()):
+        print(f"❌ No interface named '{args.name}'", file=sys.stderr)
+        return 1
+    configurator.remove_interface(args.name)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_toggle(configurator, args):
+    """Enable or disable an interface"""
+    if not any(i["name"] == args.name for i in configurator.parse_interfaces()):
+        print(f"❌ No interface named '{args.name}'", file=sys.stderr)
+        return 1
+    configurator.toggle_interface(args.name, args.state == "on")
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_validate(configurator, args):
+    """Check the config in-process, and with rnsd if asked"""
+    if args.timeout is not None:
+        configurator.rnsd_timeout = args.timeout
+    ok, error = configurator.validate_config(with_rnsd=args.rnsd)
+    if ok:
+        print("✅ Configuration is valid")
+        return 0
+    print(f"❌ {error}", file=sys.stderr)
+    return 1
+
+
+def cli_list(configurator, args):
+    """List the configured interfaces"""
+    interfaces = [interface_summary(iface) for iface in configurator.parse_interfaces()]
+    if args.json:
+        print(json.dumps(interfaces, indent=2))
+        return 0
+    for iface in interfaces:
+        state = "✅" if iface["enabled"] else "⭕"
+        print(f"{state} {iface['name']:<32} {iface['type']:<24} {iface['target']}")
+    return 0
+
+
+def cli_quick_connect(configurator, args):
+    """Probe the known public nodes and add the fastest reachable ones"""
+    results = probe_tcp_nodes(configurator.tcp_nodes(), timeout=args.timeout)
+    fastest = [r for r in results if r["reachable"]][:args.count]
+    if not fastest:
+        print("❌ No public node answered", file=sys.stderr)
+        return 1
+    for result in fastest:
+        added = configurator.add_tcp_interface(result["name"], result["host"], result["port"])
+        print(f"{'+' if added else '='} {added or result['name']} {result['host']}:{result['port']} {result['latency']:.0f} ms")
+    return save_cli_changes(configurator, args.dry_run)
+
+
+def cli_plan(configurator, args):
+    """Print the announce capacity report"""
+    rows = plan_announce_capacity(
+        configurator.parse_interfaces(), args.destinations, args.interval, args.app_data
+    )
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        for line in format_capacity_report(rows, args.destinations, args.interval):
+            print(line)
+    # Non-zero exit lets provisioning scripts catch saturated LoRa links
+    return 2 if any(r["lora"] and r["status"] in ["over_cap", "saturated"] for r in rows) else 0
+
+
+def cli_airtime(configurator, args):
+    """Print the LoRa airtime report of a preset or of every RNode interface"""
+    overrides = {key: getattr(args, key) for key in ["frequency", "bandwidth", "spreadingfactor", "codingrate"]}
+    if args.preset or any(value is not None for value in overrides.values()):
+        settings = rnode_settings(args.preset or DEFAULT_RNODE_PRESET, **overrides)
+        reports = {args.preset or "custom": lora_link_report(
+            settings["spreadingfactor"], settings["bandwidth"], settings["codingrate"],
+            frequency=settings["frequency"], duty_cycle=args.duty_cycle
+        )}
+    else:
+        reports = {}
+        for iface in configurator.parse_interfaces():
+            if iface["properties"].get("type") == "RNodeInterface":
+                properties = dict(iface["properties"])
+                if args.duty_cycle is not None:
+                    properties["airtime_limit_long"] = args.duty_cycle
+                reports[iface["name"]] = interface_lora_report(properties)
+    
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        if not reports:
+            print("No RNode interfaces configured, use --preset to check radio settings")
+        for name, report in reports.items():
+            print(f"📻 {name}")
+            for line in format_lora_report(report) if report else ["❔ Incomplete radio settings"]:
+                print(f"  {line}")
+            print()
+    # Like plan, a non-zero exit flags settings that make the link unusable
+    issues = [issue for report in reports.values() if report for issue in report["issues"]]
+    return 1 if any(i["severity"] == "error" for i in issues) else 2 if issues else 0
+
+
+def cli_patch(configurator, args):
+    """Apply a patch file"""
+    try:
+        changes = load_patch(args.patch)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    configurator.config_content = apply_patch(configurator.config_content, changes)
+    return save_cli_changes(configurator, args.dry_run)
+
+
+# Commands that work on the loaded config: name -> handler(configurator, args)
+CLI_COMMANDS = {
+    "get": cli_get,
+    "set": cli_set,
+    "add": cli_add,
+    "add-tcp": cli_add_tcp,
+    "add-rnode": cli_add_rnode,
+    "remove": cli_remove,
+    "toggle": cli_toggle,
+    "lint": cli_lint,
+    "fix": cli_fix,
+    "validate": cli_validate,
+    "list": cli_list,
+    "quick-connect": cli_quick_connect,
+    "plan": cli_plan,
+    "airtime": cli_airtime,
+    "patch": cli_patch,
+    "backups": lambda configurator, args: run_backups(configurator, args.restore),
+}
+
+
+def run_cli(argv):
+    """Run one non-interactive command, return the process exit code"""
+    args = build_cli_parser().parse_args(argv)
+    
+    if args.command == "fleet":
+        return run_fleet(args)
+    if args.command == "serve":
+        # The API pulls in the HTTP server, which no other command needs
+        from rnstools.api import run_serve
+        return run_serve(args)
+    if args.command == "ports":
+        return run_ports(args.json)
+    
+    configurator = ReticulumConfigurator(config_path=args.config)
+    if args.command == "diff":
+        return run_diff(args.old, args.new or configurator.config_path, args.output, args.json)
+    
+    if not configurator.read_config():
+        print(f"❌ Could not read config: {configurator.config_path}", file=sys.stderr)
+        return 1
+    
+    return CLI_COMMANDS[args.command](configurator, args)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAIN ENTRY POINT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    argv = sys.argv[1:] if argv is None else argv
+    if sys.version_info < (3, 7):
+        print("❌ Error: Python 3.7 or higher is required.")
+        sys.exit(1)
+    
+    if argv:
+        sys.exit(run_cli(argv))
+    
+    configurator = ReticulumConfigurator()
+    configurator.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""RNode serial port discovery through sysfs and LoRa radio presets"""
+
+import os
+from pathlib import Path
+
+
+# Discovery reads sysfs directly instead of opening ports, so it is instant
+# and never disturbs a device another program has open. Point this at a
+# fake tree to test it.
+SYSFS_ROOT_ENV = "RNSTOOLS_SYSFS_ROOT"
+SYSFS_ROOT = "/sys"
+USB_PARENT_DEPTH = 4        # levels from a tty up to its USB device
+
+# USB IDs of the serial bridges and native USB found on RNode boards
+RNODE_USB_IDS = {
+    ("10c4", "ea60"): "Silicon Labs CP210x",         # TTGO LoRa32, Heltec, T-Beam v1.0
+    ("1a86", "55d4"): "WCH CH9102",                  # T-Beam v1.1 and later
+    ("1a86", "7523"): "WCH CH340",
+    ("0403", "6001"): "FTDI FT232R",
+    ("0403", "6015"): "FTDI FT231X",
+    ("303a", "1001"): "Espressif USB serial",        # ESP32-S3 boards
+    ("239a", "8029"): "Adafruit nRF52 bootloader",   # RAK4631
+}
+
+# RNodeInterface keys the presets fill in, in the order they are written
+RNODE_SETTINGS = ["frequency", "bandwidth", "txpower", "spreadingfactor", "codingrate"]
+
+# Radio settings; frequency and bandwidth in Hz, txpower in dBm
+RNODE_PRESETS = {
+    "eu868": {
+        "name": "Europe 868 MHz",
+        "description": "869.525 MHz, 125 kHz, SF8 - balanced range and speed",
+        "frequency": 869525000,
+        "bandwidth": 125000,
+        "txpower": 14,
+        "spreadingfactor": 8,
+        "codingrate": 5,
+    },
+    "eu868_long": {
+        "name": "Europe 868 MHz long range",
+        "description": "869.525 MHz, 125 kHz, SF10 - more range, a quarter of the speed",
+        "frequency": 869525000,
+        "bandwidth": 125000,
+        "txpower": 14,
+        "spreadingfactor": 10,
+        "codingrate": 5,
+    },
+    "eu433": {
+        "name": "Europe 433 MHz",
+        "description": "433.575 MHz, 125 kHz, SF8 - low power ISM band",
+        "frequency": 433575000,
+        "bandwidth": 125000,
+        "txpower": 10,
+        "spreadingfactor": 8,
+        "codingrate": 5,
+    },
+    "us915": {
+        "name": "Americas 915 MHz",
+        "description": "914.875 MHz, 125 kHz, SF8 - balanced range and speed",
+        "frequency": 914875000,
+        "bandwidth": 125000,
+        "txpower": 17,
+        "spreadingfactor": 8,
+        "codingrate": 5,
+    },
+}
+DEFAULT_RNODE_PRESET = "eu868"
+
+
+def _read_attribute(directory, name):
+    """Contents of a sysfs attribute file, or an empty string"""
+    try:
+        return (directory / name).read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return ""
+
+
+def _usb_device(tty_dir):
+    """sysfs directory of the USB device behind a tty, or None if it is not on USB"""
+    try:
+        device = (tty_dir / "device").resolve(strict=True)
+    except (OSError, RuntimeError):
+        return None  # virtual console or pseudo terminal
+    # usb-serial ttys sit under the USB interface, ACM ttys are the interface itself
+    for directory in [device, *device.parents][:USB_PARENT_DEPTH]:
+        if (directory / "idVendor").exists():
+            return directory
+    return None
+
+
+def find_serial_ports(sysfs_root=None):
+    """USB serial devices from /sys/class/tty, the likely RNodes first
+
+    Each entry is a dict with the /dev port, the USB vendor and product IDs
+    and strings, the known chip and whether the device is likely an RNode.
+    Returns an empty list where there is no sysfs, as on macOS and Windows.
+    """
+    root = Path(sysfs_root or os.environ.get(SYSFS_ROOT_ENV) or SYSFS_ROOT)
+    try:
+        entries = list(os.scandir(root / "class" / "tty"))
+    except OSError:
+        return []
+    
+    ports = []
+    for entry in entries:
+        usb = _usb_device(Path(entry.path))
+        if usb is None:
+            continue
+        vid = _read_attribute(usb, "idVendor").lower()
+        pid = _read_attribute(usb, "idProduct").lower()
+        product = _read_attribute(usb, "product")
+        chip = RNODE_USB_IDS.get((vid, pid))
+        ports.append({
+            "port": f"/dev/{entry.name}",
+            "vid": vid,
+            "pid": pid,
+            "manufacturer": _read_attribute(usb, "manufacturer"),
+            "product": product,
+            "serial": _read_attribute(usb, "serial"),
+            "chip": chip,
+            "likely_rnode": chip is not None or "rnode" in product.lower(),
+        })
+    ports.sort(key=lambda p: (not p["likely_rnode"], p["port"]))
+    return ports
+
+
+def describe_port(port):
+    """One-line description of a find_serial_ports() entry"""
+    label = " ".join(part for part in (port["manufacturer"], port["product"]) if part) or port["chip"] or "USB serial"
+    return f"{port['port']}  {label} [{port['vid']}:{port['pid']}]"
+
+
+def rnode_settings(preset=DEFAULT_RNODE_PRESET, **overrides):
+    """Radio settings of a preset with some values replaced; None overrides are ignored"""
+    settings = {key: RNODE_PRESETS[preset][key] for key in RNODE_SETTINGS}
+    settings.update({key: value for key, value in overrides.items() if value is not None})
+    return settings
@@ -0,0 +1,339 @@
+"""What rnsd accepts in a config: interface types, their keys, value types and ranges"""
+
+import re
+
+from rnstools.lora import LORA_LIMITS
+from rnstools.rnode import DEFAULT_RNODE_PRESET, RNODE_PRESETS, RNODE_SETTINGS
+
+
+# Words ConfigObj's as_bool() accepts, in any case
+CONFIGOBJ_BOOL_VALUES = ["yes", "no", "true", "false", "on", "off", "1", "0"]
+CONFIGOBJ_TRUE_VALUES = ["yes", "true", "on", "1"]
+
+# Value specs: (kind, limits). kind is "bool", "int", "float", "str" or a list
+# of accepted words; limits is an inclusive (low, high) pair, None for no bound
+BOOL = ("bool", None)
+STR = ("str", None)
+PORT = ("int", (1, 65535))
+POSITIVE_INT = ("int", (1, None))
+PERCENT = ("float", (0, 100))
+INTERFACE_MODES = ["full", "gateway", "gw", "access_point", "accesspoint", "ap",
+                   "pointtopoint", "ptp", "roaming", "boundary"]
+
+# Keys rnsd reads for every interface type
+COMMON_INTERFACE_KEYS = {
+    "type": STR,
+    "enabled": BOOL,
+    "interface_enabled": BOOL,
+    "outgoing": BOOL,
+    "mode": (INTERFACE_MODES, None),
+    "interface_mode": (INTERFACE_MODES, None),
+    "bitrate": POSITIVE_INT,
+    "announce_cap": PERCENT,
+    "network_name": STR,
+    "networkname": STR,
+    "passphrase": STR,
+    "pass_phrase": STR,
+    "ifac_size": ("int", (8, 512)),
+    "announce_rate_target": POSITIVE_INT,
+    "announce_rate_grace": ("int", (0, None)),
+    "announce_rate_penalty": ("int", (0, None)),
+    "ingress_control": BOOL,
+}
+
+SERIAL_KEYS = {
+    "port": STR,
+    "speed": POSITIVE_INT,
+    "databits": ("int", (5, 8)),
+    "parity": (["none", "even", "odd", "n", "e", "o"], None),
+    "stopbits": ("int", (1, 2)),
+}
+KISS_KEYS = dict(SERIAL_KEYS, **{
+    "preamble": ("int", (0, None)),     # ms
+    "txtail": ("int", (0, None)),       # ms
+    "persistence": ("int", (0, 255)),
+    "slottime": ("int", (0, None)),     # ms
+    "flow_control": BOOL,
+    "id_interval": POSITIVE_INT,        # seconds
+    "id_callsign": STR,
+})
+SERIAL_TEMPLATE = {"port": "/dev/ttyUSB0", "speed": 115200, "databits": 8, "parity": "none", "stopbits": 1}
+KISS_TEMPLATE = dict(SERIAL_TEMPLATE, speed=9600, preamble=150, txtail=10, persistence=200, slottime=20)
+
+# Per interface type: what it is for, the keys it needs when enabled (each a
+# tuple of accepted alternatives), the keys it reads besides the common ones,
+# and the template new interfaces start from. A None template value has no
+# default and must be given.
+INTERFACE_SCHEMAS = {
+    "AutoInterface": {
+        "description": "Zero-configuration peers on the local network",
+        "required": [],
+        "keys": {
+            "group_id": STR,
+            "discovery_scope": (["link", "admin", "site", "organisation", "global"], None),
+            "discovery_port": PORT,
+            "data_port": PORT,
+            "devices": STR,
+            "ignored_devices": STR,
+            "multicast_address_type": (["temporary", "permanent"], None),
+        },
+        "template": {"group_id": "reticulum", "discovery_scope": "link"},
+    },
+    "BackboneInterface": {
+        "description": "High-throughput TCP links between transport nodes",
+        "required": [],
+        "keys": {
+            "listen_on": STR,
+            "port": PORT,
+            "device": STR,
+            "remote": STR,
+            "target_host": STR,
+            "target_port": PORT,
+            "prefer_ipv6": BOOL,
+        },
+        "template": {"listen_on": "0.0.0.0", "port": 4242},
+    },
+    "TCPClientInterface": {
+        "description": "Outgoing TCP connection to another node",
+        "required": [("target_host",), ("target_port",)],
+        "keys": {
+            "target_host": STR,
+            "target_port": PORT,
+            "kiss_framing": BOOL,
+            "i2p_tunneled": BOOL,
+        },
+        "template": {"target_host": None, "target_port": 4242},
+    },
+    "TCPServerInterface": {
+        "description": "Accept TCP connections from other nodes",
+        "required": [("listen_port", "port")],
+        "keys": {
+            "listen_ip": STR,
+            "listen_port": PORT,
+            "port": PORT,
+            "device": STR,
+            "prefer_ipv6": BOOL,
+            "i2p_tunneled": BOOL,
+        },
+        "template": {"listen_ip": "0.0.0.0", "listen_port": 4242},
+    },
+    "UDPInterface": {
+        "description": "UDP broadcast or unicast on an IP network",
+        "required": [("listen_port", "port"), ("forward_port", "port")],
+        "keys": {
+            "listen_ip": STR,
+            "listen_port": PORT,
+            "forward_ip": STR,
+            "forward_port": PORT,
+            "port": PORT,
+            "device": STR,
+        },
+        "template": {"listen_ip": "0.0.0.0", "listen_port": 4242,
+                     "forward_ip": "255.255.255.255", "forward_port": 4242},
+    },
+    "I2PInterface": {
+        "description": "Tunnel over the I2P anonymity network",
+        "required": [],
+        "keys": {
+            "peers": STR,
+            "connectable": BOOL,
+        },
+        "template": {"connectable": "yes", "peers": ""},
+    },
+    "RNodeInterface": {
+        "description": "LoRa radio through an RNode",
+        "required": [("port",)] + [(key,) for key in RNODE_SETTINGS],
+        "keys": dict({key: ("int", LORA_LIMITS[key]) for key in RNODE_SETTINGS}, **{
+            "port": STR,
+            "flow_control": BOOL,
+            "id_interval": POSITIVE_INT,
+            "id_callsign": STR,
+            "airtime_limit_long": PERCENT,
+            "airtime_limit_short": PERCENT,
+        }),
+        "template": dict({"port": None}, **{key: RNODE_PRESETS[DEFAULT_RNODE_PRESET][key] for key in RNODE_SETTINGS}),
+    },
+    "RNodeMultiInterface": {
+        "description": "Multi-radio RNode, radios as [[[subinterfaces]]]",
+        "required": [("port",)],
+        "keys": {
+            "port": STR,
+            "id_interval": POSITIVE_INT,
+            "id_callsign": STR,
+        },
+        "template": {"port": None},
+    },
+    "SerialInterface": {
+        "description": "Raw serial link, such as a cable or transparent modem",
+        "required": [("port",)],
+        "keys": SERIAL_KEYS,
+        "template": SERIAL_TEMPLATE,
+    },
+    "KISSInterface": {
+        "description": "Packet radio TNC speaking KISS",
+        "required": [("port",)],
+        "keys": KISS_KEYS,
+        "template": KISS_TEMPLATE,
+    },
+    "AX25KISSInterface": {
+        "description": "Packet radio TNC with AX.25 framing",
+        "required": [("port",), ("callsign",)],
+        "keys": dict(KISS_KEYS, callsign=STR, ssid=("int", (0, 15))),
+        "template": dict(KISS_TEMPLATE, callsign=None, ssid=0),
+    },
+    "PipeInterface": {
+        "description": "Any program speaking HDLC framing on stdin and stdout",
+        "required": [("command",)],
+        "keys": {
+            "command": STR,
+            "respawn_delay": ("float", (0, None)),  # seconds
+        },
+        "template": {"command": None, "respawn_delay": 5},
+    },
+}
+
+# Interface types known to Reticulum and the keys each one needs when enabled
+INTERFACE_REQUIRED_KEYS = {name: schema["required"] for name, schema in INTERFACE_SCHEMAS.items()}
+
+# Keys rnsd reads with as_bool() / as_int(), which abort startup on bad values
+RETICULUM_BOOL_KEYS = [
+    "enable_transport",
+    "share_instance",
+    "panic_on_interface_error",
+    "use_implicit_proof",
+    "respond_to_probes",
+]
+RETICULUM_INT_KEYS = [
+    "shared_instance_port",
+    "instance_control_port",
+]
+
+INLINE_COMMENT = re.compile(r'\s*#.*$')     # ConfigObj ends an unquoted value at the first #
+
+_rns_configobj = None
+_compiled_schemas = None
+
+
+def load_rns_configobj():
+    """Return the ConfigObj class vendored by RNS, or None if RNS is not installed"""
+    global _rns_configobj
+    if _rns_configobj is None:
+        try:
+            from RNS.vendor.configobj import ConfigObj
+            _rns_configobj = ConfigObj
+        except Exception:
+            _rns_configobj = False
+    return _rns_configobj or None
+
+
+def config_value(value):
+    """A raw config value as ConfigObj reads it: without an inline comment or quotes"""
+    value = value.strip()
+    if value[:1] in ["\"", "'"]:
+        end = value.find(value[0], 1)
+        if end > 0 and (not value[end + 1:].strip() or value[end + 1:].lstrip().startswith("#")):
+            return value[1:end]
+    return INLINE_COMMENT.sub("", value)
+
+
+def same_config_value(first, second):
+    """Whether two raw values mean the same to rnsd: the same boolean, number or text"""
+    if first is None or second is None:
+        return first is second
+    first, second = config_value(str(first)), config_value(str(second))
+    if first.lower() in CONFIGOBJ_BOOL_VALUES and second.lower() in CONFIGOBJ_BOOL_VALUES:
+        return (first.lower() in CONFIGOBJ_TRUE_VALUES) == (second.lower() in CONFIGOBJ_TRUE_VALUES)
+    try:
+        return float(first) == float(second)
+    except ValueError:
+        return first == second
+
+
+def _compile_spec(spec):
+    """Turn a value spec into a function returning an error message or None"""
+    kind, limits = spec
+    if isinstance(kind, list):
+        words = frozenset(kind)
+        accepted = ", ".join(kind)
+        return lambda value: None if value.lower() in words else f"must be one of {accepted}"
+    if kind == "bool":
+        words = frozenset(CONFIGOBJ_BOOL_VALUES)
+        return lambda value: None if value.lower() in words else "must be yes or no"
+    if kind == "str":
+        return lambda value: None if value else "must not be empty"
+    
+    convert = int if kind == "int" else float
+    low, high = limits or (None, None)
+    if low is not None and high is not None:
+        bounds = f"{low}-{high}"
+    elif low is not None:
+        bounds = f"at least {low}"
+    else:
+        bounds = f"at most {high}"
+    
+    def check(value):
+        try:
+            number = convert(value)
+        except ValueError:
+            return f"must be {'a whole number' if kind == 'int' else 'a number'}"
+        if (low is not None and number < low) or (high is not None and number > high):
+            return f"must be {bounds}"
+        return None
+    return check
+
+
+def compiled_interface_schemas():
+    """Per interface type, a checker function for every key it reads; built once and cached"""
+    global _compiled_schemas
+    if _compiled_schemas is None:
+        common = {key: _compile_spec(spec) for key, spec in COMMON_INTERFACE_KEYS.items()}
+        _compiled_schemas = {
+            name: dict(common, **{key: _compile_spec(spec) for key, spec in schema["keys"].items()})
+            for name, schema in INTERFACE_SCHEMAS.items()
+        }
+    return _compiled_schemas
+
+
+def check_interface_value(iface_type, key, value):
+    """Why a raw value is invalid for a key of an interface type, None if it is valid or unchecked"""
+    checkers = compiled_interface_schemas().get(iface_type)
+    check = checkers.get(key) if checkers else None
+    return check(config_value(value)) if check else None
+
+
+def validate_interface(iface_type, properties):
+    """Problems of an interface of a known type, as (key, message) pairs
+
+    Every key the schema knows is checked for its type and range; the required
+    keys are only checked for enabled interfaces, as rnsd skips the others.
+    Keys the schema does not know are left alone.
+    """
+    problems = []
+    for key, value in properties.items():
+        message = check_interface_value(iface_type, key, value)
+        if message:
+            problems.append((key, f"{key} {message}, got '{config_value(value)}'"))
+    
+    enabled = properties.get("enabled", properties.get("interface_enabled", "no"))
+    if config_value(enabled).lower() in ["yes", "true", "on", "1"]:
+        for alternatives in INTERFACE_REQUIRED_KEYS.get(iface_type, []):
+            if not any(key in properties for key in alternatives):
+                problems.append((alternatives[0], f"missing '{alternatives[0]}'"))
+    return problems
+
+
+def interface_template(iface_type, values=None):
+    """Keys and values of a new interface: the type's template updated with the given values
+
+    Template keys without a default and not in values come out as None.
+    """
+    template = {"type": iface_type, "enabled": "yes"}
+    template.update(INTERFACE_SCHEMAS[iface_type]["template"])
+    template.update(values or {})
+    return template
+
+
+def validate_template(iface_type, values=None):
+    """validate_interface() for a new interface made from the type's template and the given values"""
+    template = interface_template(iface_type, values)
+    return validate_interface(iface_type, {key: str(value) for key, value in template.items() if value not in (None, "")})
@@ -0,0 +1,137 @@
+"""Atomic config writes and the content-addressed backup store"""
+
+import os
+import gzip
+import shutil
+import json
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime
+
+
+BACKUP_RETENTION_ENV = "RNSTOOLS_BACKUP_RETENTION"
+BACKUP_COMPRESS_ENV = "RNSTOOLS_BACKUP_COMPRESS"
+DEFAULT_BACKUP_RETENTION = 20
+
+
+def atomic_write(path, content):
+    """Replace a file with new text so readers never see a partial write"""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp{os.getpid()}_{threading.get_ident()}")
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    
+    # Persist the rename itself, otherwise a power cut can still lose it
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def backup_retention():
+    """Backups kept per config from the environment, 0 for all; a bad value must not break saving"""
+    try:
+        retention = int(os.environ.get(BACKUP_RETENTION_ENV, DEFAULT_BACKUP_RETENTION))
+    except ValueError:
+        return DEFAULT_BACKUP_RETENTION
+    return retention if retention >= 0 else DEFAULT_BACKUP_RETENTION
+
+
+class BackupStore:
+    """Content-addressed config backups, one stored copy per unique content"""
+    
+    def __init__(self, config_path, retention=None, compress=None):
+        self.config_path = Path(config_path)
+        self.directory = self.config_path.parent / f"{self.config_path.name}_backups"
+        self.index_path = self.directory / "index.json"
+        if retention is None:
+            retention = backup_retention()
+        if compress is None:
+            compress = os.environ.get(BACKUP_COMPRESS_ENV, "").lower() in ["1", "yes", "true"]
+        self.retention = retention
+        self.compress = compress
+    
+    def entries(self):
+        """Return the backup history, oldest first"""
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+    
+    def object_path(self, digest, compressed):
+        """Path of the stored copy for a content hash"""
+        return self.directory / (f"{digest}.gz" if compressed else digest)
+    
+    def find_object(self, digest):
+        """Return the existing stored copy for a hash, or None"""
+        for compressed in [False, True]:
+            path = self.object_path(digest, compressed)
+            if path.exists():
+                return path
+        return None
+    
+    def save(self, content):
+        """Store content unless an identical copy exists, record it and prune, return its path"""
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        
+        path = self.find_object(digest)
+        if path is None:
+            path = self.object_path(digest, self.compress)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(data) if self.compress else data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        
+        entries = self.entries()
+        if not entries or entries[-1]["hash"] != digest:
+            entries.append({
+                "hash": digest,
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "size": len(data),
+            })
+        self.prune(entries)
+        return path
+    
+    def prune(self, entries):
+        """Keep the newest entries up to the retention limit and drop unreferenced copies"""
+        if self.retention > 0:
+            entries = entries[-self.retention:]
+        atomic_write(self.index_path, json.dumps(entries, indent=2))
+        
+        keep = {entry["hash"] for entry in entries}
+        for path in self.directory.iterdir():
+            digest = path.name.split(".")[0]
+            if path != self.index_path and not path.name.startswith(".") and digest not in keep:
+                path.unlink()
+    
+    def read(self, digest):
+        """Return the stored content for a full or abbreviated hash"""
+        matches = {entry["hash"] for entry in self.entries() if entry["hash"].startswith(digest)}
+        if len(matches) != 1:
+            raise KeyError(f"{'Ambiguous' if matches else 'Unknown'} backup: {digest}")
+        path = self.find_object(matches.pop())
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+        return data.decode("utf-8")
@@ -0,0 +1,608 @@
+"""Local multi-instance rnsd testbed and announce propagation benchmark"""
+
+import os
+import sys
+import argparse
+import time
+import json
+import statistics
+import subprocess
+import random
+import signal
+import itertools
+from pathlib import Path
+from datetime import datetime
+
+from rnstools.profiles import PERFORMANCE_PROFILES
+from rnstools.reticulum import (
+    DEFAULT_CONFIG,
+    RNSD_ERROR_MARKERS,
+    RNSD_READY_MARKERS,
+    ReticulumConfigurator,
+)
+
+
+TOPOLOGIES = ["line", "star", "mesh", "random"]
+
+DEFAULT_BASE_DIR = Path("testbed")
+DEFAULT_BASE_PORT = 42000
+PORTS_PER_NODE = 3          # shared instance, instance control, TCP server
+RANDOM_EXTRA_LINKS = 1.0    # extra links per node on top of the spanning tree
+START_TIMEOUT = 60
+STOP_TIMEOUT = 10           # seconds nodes get to exit on SIGTERM before SIGKILL
+MANIFEST_NAME = "testbed.json"
+
+BENCH_SIZES = [5, 20, 100]
+BENCH_TOPOLOGIES = ["line", "star", "random"]
+BENCH_WINDOW = 20           # seconds observers wait for the announce to arrive
+BENCH_APP_NAME = "rnstools"
+BENCH_ASPECT = "bench"
+
+# Benchmark helpers run this module with -m and must find the package
+PACKAGE_PATH = os.pathsep.join(filter(None, [
+    str(Path(__file__).resolve().parent.parent), os.environ.get("PYTHONPATH")
+]))
+
+
+def build_topology(count, topology, seed=None):
+    """Return the list of (server, client) node index pairs for a topology
+
+    The node with the lower index always runs the server end of a link.
+    """
+    if topology == "line":
+        return [(i - 1, i) for i in range(1, count)]
+    
+    if topology == "star":
+        return [(0, i) for i in range(1, count)]
+    
+    if topology == "mesh":
+        return list(itertools.combinations(range(count), 2))
+    
+    if topology == "random":
+        rng = random.Random(seed)
+        # Random spanning tree keeps every node reachable
+        edges = {(rng.randrange(i), i) for i in range(1, count)}
+        candidates = [pair for pair in itertools.combinations(range(count), 2) if pair not in edges]
+        extra = min(len(candidates), int(count * RANDOM_EXTRA_LINKS))
+        edges.update(rng.sample(candidates, extra))
+        return sorted(edges)
+    
+    raise ValueError(f"Unknown topology '{topology}', expected one of: {', '.join(TOPOLOGIES)}")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# TESTBED CLASS
+# ══════════════════════════════════════════════════════════════════════════════
+
+class ReticulumTestbed:
+    def __init__(self, base_dir=DEFAULT_BASE_DIR):
+        self.base_dir = Path(base_dir).resolve()
+        self.manifest_path = self.base_dir / MANIFEST_NAME
+        self.manifest = None
+        self.processes = {}
+    
+    def load_manifest(self):
+        """Load testbed.json, return False if the testbed was never generated"""
+        if not self.manifest_path.exists():
+            return False
+        with open(self.manifest_path, 'r') as f:
+            self.manifest = json.load(f)
+        return True
+    
+    def save_manifest(self):
+        """Write testbed.json"""
+        with open(self.manifest_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2)
+    
+    def node_config(self, index, node, links, loglevel, profile=None):
+        """Build the config file content for one node"""
+        configurator = ReticulumConfigurator(config_path=Path(node["dir"]) / "config")
+        configurator.config_content = DEFAULT_CONFIG
+        
+        # Isolated instance: own ports, no AutoInterface discovery on the LAN
+        configurator.set_setting("reticulum", "enable_transport", "Yes")
+        configurator.set_setting("reticulum", "shared_instance_type", "tcp")
+        configurator.set_setting("reticulum", "instance_name", f"testbed_{index}")
+        configurator.set_setting("reticulum", "shared_instance_port", str(node["shared_instance_port"]))
+        configurator.set_setting("reticulum", "instance_control_port", str(node["instance_control_port"]))
+        configurator.set_setting("logging", "loglevel", str(loglevel))
+        configurator.remove_interface("Default Interface")
+        
+        configurator.add_tcp_server_interface("Testbed Server", "127.0.0.1", node["listen_port"])
+        for server_index, server_port in links:
+            configurator.add_tcp_interface(f"Testbed Link {server_index}", "127.0.0.1", server_port)
+        
+        if profile:
+            configurator.apply_profile(profile)
+        
+        return configurator.config_content
+    
+    def generate(self, count, topology, seed=None, base_port=DEFAULT_BASE_PORT, loglevel=4, profile=None):
+        """Write the config directories and manifest for a new testbed"""
+        if self.load_manifest() and self.running_nodes():
+            raise RuntimeError("The testbed is running, stop it before generating a new one")
+        
+        edges = build_topology(count, topology, seed)
+        nodes = []
+        for index in range(count):
+            port = base_port + index * PORTS_PER_NODE
+            nodes.append({
+                "index": index,
+                "dir": str(self.base_dir / f"node_{index:03d}"),
+                "shared_instance_port": port,
+                "instance_control_port": port + 1,
+                "listen_port": port + 2,
+                "pid": None,
+            })
+        
+        for index, node in enumerate(nodes):
+            links = [(a, nodes[a]["listen_port"]) for a, b in edges if b == index]
+            content = self.node_config(index, node, links, loglevel, profile)
+            Path(node["dir"]).mkdir(parents=True, exist_ok=True)
+            with open(Path(node["dir"]) / "config", 'w') as f:
+                f.write(content)
+        
+        self.manifest = {
+            "topology": topology,
+            "seed": seed,
+            "profile": profile,
+            "base_port": base_port,
+            "edges": edges,
+            "nodes": nodes,
+        }
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.save_manifest()
+        return self.manifest
+    
+    def start(self, wait=True, timeout=START_TIMEOUT):
+        """Launch one rnsd per node, optionally waiting until all report startup"""
+        env = dict(os.environ, PYTHONUNBUFFERED="1")
+        for node in self.manifest["nodes"]:
+            if self.is_alive(node.get("pid")):
+                continue
+            log_path = Path(node["dir"]) / "rnsd.log"
+            with open(log_path, 'w') as log:
+                process = subprocess.Popen(
+                    ["rnsd", "--config", node["dir"]],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    stdin=subprocess.DEVNULL,
+                    env=env,
+                    start_new_session=True
+                )
+            node["pid"] = process.pid
+            self.processes[node["index"]] = process
+        self.save_manifest()
+        
+        if wait:
+            return self.wait_ready(timeout)
+        return True, []
+    
+    def wait_ready(self, timeout=START_TIMEOUT):
+        """Poll the node logs until every rnsd reports startup, return (ok, failed_nodes)"""
+        pending = {node["index"]: node for node in self.manifest["nodes"]}
+        failed = []
+        deadline = time.monotonic() + timeout
+        
+        while pending and time.monotonic() < deadline:
+            for index, node in list(pending.items()):
+                try:
+                    log = (Path(node["dir"]) / "rnsd.log").read_text(errors="replace")
+                except OSError:
+                    log = ""
+                process = self.processes.get(index)
+                exited = process.poll() is not None if process else not self.is_alive(node["pid"])
+                if exited or any(marker in log for marker in RNSD_ERROR_MARKERS):
+                    failed.append(index)
+                    del pending[index]
+                elif any(marker in log for marker in RNSD_READY_MARKERS):
+                    del pending[index]
+            time.sleep(0.1)
+        
+        failed.extend(pending)
+        return not failed, sorted(failed)
+    
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Terminate every running node and wait until all have exited, killing stragglers"""
+        stopping = []
+        for node in self.manifest["nodes"]:
+            pid = node.get("pid")
+            if self.is_alive(pid):
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    stopping.append(node)
+                except OSError:
+                    pass
+        
+        # The next run reuses the ports, so the nodes must be gone before returning
+        deadline = time.monotonic() + timeout
+        for node in stopping:
+            if not self.wait_exit(node, deadline - time.monotonic()):
+                try:
+                    os.kill(node["pid"], signal.SIGKILL)
+                except OSError:
+                    pass
+                self.wait_exit(node, timeout)
+        
+        for node in self.manifest["nodes"]:
+            node["pid"] = None
+        self.processes.clear()
+        self.save_manifest()
+        return len(stopping)
+    
+    def wait_exit(self, node, timeout):
+        """Wait up to timeout seconds for a node's rnsd to exit, return whether it did"""
+        process = self.processes.get(node["index"])
+        if process is not None:
+            try:
+                process.wait(max(timeout, 0))
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        deadline = time.monotonic() + timeout
+        while self.is_alive(node["pid"]) and time.monotonic() < deadline:
+            time.sleep(0.1)
+        return not self.is_alive(node["pid"])
+    
+    def running_nodes(self):
+        """Return the nodes whose rnsd process is alive"""
+        return [node for node in self.manifest["nodes"] if self.is_alive(node.get("pid"))]
+    
+    @staticmethod
+    def is_alive(pid):
+        """True if a process with this pid exists"""
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ANNOUNCE PROPAGATION BENCHMARK
+# ══════════════════════════════════════════════════════════════════════════════
+#
+# Each measurement attaches one helper process per node to that node's rnsd
+# shared instance (RNS allows one instance per process). The helpers talk to
+# the benchmark over stdin/stdout, one JSON object per line:
+#
+#   _announce: {"ready", "txb"} -> waits for "go" -> {"hash", "announced_at"}
+#              -> waits for "stop" -> {"txb"}
+#   _observe:  {"ready", "txb"} -> reads the destination hash
+#              -> {"found_at", "hops", "txb"} after the window
+
+def _wire_bytes(reticulum):
+    """Bytes sent on the node's network interfaces, excluding local clients"""
+    stats = reticulum.get_interface_stats() or {}
+    total = 0
+    for iface in stats.get("interfaces", []):
+        name = iface.get("name", "")
+        if name.startswith("Shared Instance") or name.startswith("LocalInterface"):
+            continue
+        total += iface.get("txb", 0)
+    return total
+
+
+def _emit(message):
+    """Write one JSON line to the benchmark"""
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def helper_announce(config_dir):
+    """Benchmark helper: announce one destination from a node"""
+    import RNS
+    reticulum = RNS.Reticulum(configdir=config_dir, loglevel=RNS.LOG_CRITICAL)
+    destination = RNS.Destination(
+        RNS.Identity(), RNS.Destination.IN, RNS.Destination.SINGLE, BENCH_APP_NAME, BENCH_ASPECT
+    )
+    _emit({"ready": True, "txb": _wire_bytes(reticulum)})
+    
+    sys.stdin.readline()
+    announced_at = time.time()
+    destination.announce()
+    _emit({"hash": destination.hash.hex(), "announced_at": announced_at})
+    
+    sys.stdin.readline()
+    _emit({"txb": _wire_bytes(reticulum)})
+
+
+def helper_observe(config_dir, window):
+    """Benchmark helper: wait for a path to the announced destination"""
+    import RNS
+    reticulum = RNS.Reticulum(configdir=config_dir, loglevel=RNS.LOG_CRITICAL)
+    _emit({"ready": True, "txb": _wire_bytes(reticulum)})
+    
+    destination_hash = bytes.fromhex(sys.stdin.readline().strip())
+    deadline = time.time() + window
+    found_at = None
+    while time.time() < deadline:
+        if found_at is None and RNS.Transport.has_path(destination_hash):
+            found_at = time.time()
+        time.sleep(0.01)
+    
+    hops = RNS.Transport.hops_to(destination_hash) if found_at else None
+    _emit({"found_at": found_at, "hops": hops, "txb": _wire_bytes(reticulum)})
+
+
+def rns_version():
+    """Installed RNS version, or None"""
+    try:
+        from importlib.metadata import version
+        return version("rns")
+    except Exception:
+        return None
+
+
+def _percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class AnnounceBenchmark:
+    def __init__(self, base_dir=DEFAULT_BASE_DIR, window=BENCH_WINDOW, base_port=DEFAULT_BASE_PORT):
+        self.base_dir = Path(base_dir).resolve()
+        self.window = window
+        self.base_port = base_port
+    
+    def spawn_helper(self, *args):
+        """Start a helper subprocess of this script"""
+        return subprocess.Popen(
+            [sys.executable, "-m", "rnstools.testbed", *args],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            env=dict(os.environ, PYTHONPATH=PACKAGE_PATH)
+        )
+    
+    @staticmethod
+    def read_message(process):
+        """Read one JSON line from a helper"""
+        line = process.stdout.readline()
+        if not line:
+            raise RuntimeError("benchmark helper exited unexpectedly")
+        return json.loads(line)
+    
+    def measure(self, nodes, topology, seed=0, profile=None):
+        """Run one topology/size combination and return its result record"""
+        testbed = ReticulumTestbed(self.base_dir / f"{topology}_{nodes}")
+        manifest = testbed.generate(nodes, topology, seed, self.base_port, loglevel=2, profile=profile)
+        ok, failed = testbed.start(wait=True)
+        helpers = []
+        try:
+            if not ok:
+                raise RuntimeError(f"nodes failed to start: {failed}")
+            
+            dirs = [node["dir"] for node in manifest["nodes"]]
+            announcer = self.spawn_helper("_announce", "--config", dirs[0])
+            helpers.append(announcer)
+            observers = [self.spawn_helper("_observe", "--config", d, "--window", str(self.window))
+                         for d in dirs[1:]]
+            helpers.extend(observers)
+            
+            txb_before = sum(self.read_message(h)["txb"] for h in helpers)
+            
+            announcer.stdin.write("go\n")
+            announcer.stdin.flush()
+            announce = self.read_message(announcer)
+            for observer in observers:
+                observer.stdin.write(announce["hash"] + "\n")
+                observer.stdin.flush()
+            
+            results = [self.read_message(o) for o in observers]
+            announcer.stdin.write("stop\n")
+            announcer.stdin.flush()
+            txb_after = self.read_message(announcer)["txb"] + sum(r["txb"] for r in results)
+        finally:
+            for helper in helpers:
+                if helper.poll() is None:
+                    helper.kill()
+                helper.wait()
+            testbed.stop()
+        
+        times = [r["found_at"] - announce["announced_at"] for r in results if r["found_at"]]
+        hops = [r["hops"] for r in results if r["hops"] is not None]
+        record = {
+            "topology": topology,
+            "nodes": nodes,
+            "links": len(manifest["edges"]),
+            "reached": len(times),
+            "fan_out": len(times) / len(observers) if observers else 1.0,
+            "bytes_on_wire": txb_after - txb_before,
+            "max_hops": max(hops) if hops else None,
+            "time_to_path": None,
+        }
+        if times:
+            record["time_to_path"] = {
+                "min": min(times),
+                "median": statistics.median(times),
+                "p95": _percentile(times, 0.95),
+                "max": max(times),
+            }
+        return record
+    
+    def run(self, sizes=BENCH_SIZES, topologies=BENCH_TOPOLOGIES, profile=None, seed=0):
+        """Measure every size/topology combination and return the baseline document"""
+        runs = []
+        for topology in topologies:
+            for nodes in sizes:
+                print(f"  ⏱️  {topology:<6} {nodes:4} nodes ...", end="", flush=True)
+                record = self.measure(nodes, topology, seed, profile)
+                runs.append(record)
+                median = record["time_to_path"]["median"] if record["time_to_path"] else None
+                median_str = f"{median * 1000:8.1f} ms" if median is not None else "      - ms"
+                print(f" reached {record['fan_out']:5.0%}, median {median_str}, "
+                      f"{record['bytes_on_wire']} bytes")
+        
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "rns_version": rns_version(),
+            "profile": profile,
+            "window": self.window,
+            "runs": runs,
+        }
+
+
+def compare_baselines(baseline, current):
+    """Print the change of every metric between two benchmark documents"""
+    print(f"  Baseline: RNS {baseline.get('rns_version')}, profile {baseline.get('profile')}")
+    print(f"  Current:  RNS {current.get('rns_version')}, profile {current.get('profile')}\n")
+    print(f"  {'Run':<14} {'Fan-out':>16} {'Median ms':>22} {'Bytes on wire':>26}")
+    
+    old_runs = {(r["topology"], r["nodes"]): r for r in baseline.get("runs", [])}
+    for run in current.get("runs", []):
+        old = old_runs.get((run["topology"], run["nodes"]))
+        if old is None:
+            continue
+        
+        def median_ms(record):
+            return record["time_to_path"]["median"] * 1000 if record["time_to_path"] else None
+        
+        def change(before, after):
+            if before is None or after is None:
+                return "          -"
+            if before == 0:
+                return f"{before:.0f}→{after:.0f}"
+            return f"{before:.0f}→{after:.0f} ({(after - before) / before:+.0%})"
+        
+        print(f"  {run['topology'] + ' ' + str(run['nodes']):<14} "
+              f"{old['fan_out']:>7.0%}→{run['fan_out']:<7.0%} "
+              f"{change(median_ms(old), median_ms(run)):>22} "
+              f"{change(old['bytes_on_wire'], run['bytes_on_wire']):>26}")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# MAIN ENTRY POINT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    """Main entry point"""
+    if sys.version_info < (3, 7):
+        print("❌ Error: Python 3.7 or higher is required.")
+        sys.exit(1)
+    
+    parser = argparse.ArgumentParser(description="Local multi-instance Reticulum testbed")
+    parser.add_argument("--dir", default=str(DEFAULT_BASE_DIR), help="testbed directory (default: ./testbed)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    generate = commands.add_parser("generate", help="write node configs for a new testbed")
+    generate.add_argument("-n", "--nodes", type=int, default=5, help="number of rnsd instances")
+    generate.add_argument("-t", "--topology", choices=TOPOLOGIES, default="line")
+    generate.add_argument("--seed", type=int, default=None, help="seed for the random topology")
+    generate.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    generate.add_argument("--loglevel", type=int, default=4)
+    generate.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), default=None,
+                          help="performance profile applied to every node")
+    
+    start = commands.add_parser("start", help="launch all nodes")
+    start.add_argument("--no-wait", action="store_true", help="do not wait for the nodes to come up")
+    start.add_argument("--timeout", type=float, default=START_TIMEOUT)
+    
+    commands.add_parser("stop", help="terminate all nodes")
+    commands.add_parser("status", help="show which nodes are running")
+    
+    bench = commands.add_parser("bench", help="measure announce propagation across topologies")
+    bench.add_argument("--sizes", default=",".join(str(n) for n in BENCH_SIZES), help="comma separated node counts")
+    bench.add_argument("--topologies", default=",".join(BENCH_TOPOLOGIES), help="comma separated topologies")
+    bench.add_argument("--window", type=float, default=BENCH_WINDOW, help="seconds to wait for paths")
+    bench.add_argument("--profile", choices=list(PERFORMANCE_PROFILES), default=None,
+                       help="performance profile applied to every node")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--base-port", type=int, default=DEFAULT_BASE_PORT)
+    bench.add_argument("-o", "--output", default="bench_results.json", help="JSON file for the results")
+    bench.add_argument("--compare", default=None, help="baseline JSON to compare the results with")
+    
+    compare = commands.add_parser("compare", help="compare two benchmark JSON files")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    
+    announce_helper = commands.add_parser("_announce")
+    announce_helper.add_argument("--config", required=True)
+    observe_helper = commands.add_parser("_observe")
+    observe_helper.add_argument("--config", required=True)
+    observe_helper.add_argument("--window", type=float, default=BENCH_WINDOW)
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "_announce":
+        helper_announce(args.config)
+        return
+    if args.command == "_observe":
+        helper_observe(args.config, args.window)
+        return
+    
+    if args.command == "compare":
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        with open(args.current, 'r') as f:
+            current = json.load(f)
+        compare_baselines(baseline, current)
+        return
+    
+    if args.command == "bench":
+        if rns_version() is None:
+            print("❌ The benchmark needs RNS installed (pip install rns).")
+            sys.exit(1)
+        sizes = [int(n) for n in args.sizes.split(",") if n.strip()]
+        topologies = [t.strip() for t in args.topologies.split(",") if t.strip()]
+        print(f"📊 Announce propagation benchmark, window {args.window:.0f}s\n")
+        benchmark = AnnounceBenchmark(Path(args.dir) / "bench", args.window, args.base_port)
+        try:
+            results = benchmark.run(sizes, topologies, args.profile, args.seed)
+        except (RuntimeError, ValueError) as e:
+            print(f"\n❌ Benchmark failed: {e}")
+            sys.exit(1)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+        if args.compare:
+            with open(args.compare, 'r') as f:
+                compare_baselines(json.load(f), results)
+        return
+    
+    testbed = ReticulumTestbed(args.dir)
+    
+    if args.command == "generate":
+        try:
+            manifest = testbed.generate(args.nodes, args.topology, args.seed, args.base_port,
+                                        args.loglevel, args.profile)
+        except (ValueError, RuntimeError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ Generated {len(manifest['nodes'])} nodes, {len(manifest['edges'])} links "
+              f"({args.topology}) in {testbed.base_dir}")
+        return
+    
+    if not testbed.load_manifest():
+        print(f"❌ No testbed found in {testbed.base_dir}, run 'generate' first.")
+        sys.exit(1)
+    
+    if args.command == "start":
+        started = time.monotonic()
+        ok, failed = testbed.start(wait=not args.no_wait, timeout=args.timeout)
+        if ok:
+            print(f"✅ {len(testbed.manifest['nodes'])} nodes started in {time.monotonic() - started:.1f}s")
+        else:
+            print(f"❌ Nodes failed to start: {', '.join(str(i) for i in failed)} (see node_*/rnsd.log)")
+            sys.exit(1)
+    
+    elif args.command == "stop":
+        print(f"🛑 Stopped {testbed.stop()} nodes")
+    
+    elif args.command == "status":
+        running = {node["index"] for node in testbed.running_nodes()}
+        print(f"📡 {testbed.manifest['topology']} testbed, {len(running)}/{len(testbed.manifest['nodes'])} running\n")
+        for node in testbed.manifest["nodes"]:
+            status = "✅" if node["index"] in running else "🔴"
+            print(f"  {status} node {node['index']:3}  port {node['listen_port']}  {node['dir']}")
+
+
+if __name__ == "__main__":
+    main()
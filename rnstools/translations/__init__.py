@@ -0,0 +1 @@
+"""User-facing strings of each interactive tool, one module per tool, loaded on first use"""
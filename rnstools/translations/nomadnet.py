@@ -0,0 +1,851 @@
+"""Strings of the NomadNet configurator in every supported language"""
+
+TRANSLATIONS = {
+    "en": {
+        "lang_name": "English",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    NOMADNET - INTERACTIVE CONFIGURATOR                       ║
+║                                                                              ║
+║  This tool helps you configure NomadNet interactively.                      ║
+║  It will edit your ~/.nomadnetwork/config file safely.                      ║
+║                                                                              ║
+║  A backup will be created before any changes are made.                      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  NomadNet config not found at:",
+        "create_default": "Would you like to create a default config? (y/n): ",
+        "creating_default": "📝 Creating default NomadNet configuration...",
+        "run_nomadnet_first": "💡 Tip: Run 'nomadnet' once to generate a default config, or let us create one.",
+        "config_found": "✅ Found NomadNet config at:",
+        "backup_created": "💾 Backup created:",
+        "permission_denied": "❌ Permission denied. Try running with sudo or fix permissions.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MAIN MENU                                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 View current configuration
+  [2] 👤 Edit client settings (display name, propagation, etc.)
+  [3] 🖥️  Edit text UI settings (intro time, colors, editor)
+  [4] 📡 Edit node settings (enable hosting, announce interval)
+  [5] 📄 Page hosting information
+  [6] 🔧 Check & Fix configuration
+  [7] 💾 Save and exit
+  [8] ❌ Exit without saving
+
+""",
+        "enter_choice": "Enter your choice: ",
+        "invalid_choice": "❌ Invalid choice. Please try again.",
+        "press_enter": "Press Enter to continue...",
+        "yes": "y",
+        "no": "n",
+        "save_changes": "💾 Save changes to config? (y/n): ",
+        "changes_saved": "✅ Configuration saved successfully!",
+        "no_changes": "ℹ️  No changes to save.",
+        "exit_without_save": "⚠️  Exit without saving changes? (y/n): ",
+        "goodbye": "👋 Thank you for using NomadNet Configurator!",
+        "current_value": "Current value:",
+        "new_value": "New value (press Enter to keep current): ",
+        "enabled": "enabled",
+        "disabled": "disabled",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      CHECK & FIX CONFIGURATION                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Checking configuration...",
+        "config_valid": "✅ Configuration is valid!",
+        "config_issues": "⚠️  Found {count} issue(s):",
+        "fix_issues": "🔧 Would you like to fix these issues? (y/n): ",
+        "fixing_issues": "🔧 Fixing issues...",
+        "issues_fixed": "✅ All issues fixed!",
+        "issue_invalid_colormode": "Invalid colormode value (must be: monochrome, 16, 88, 256, or 24bit)",
+        "issue_section_missing": "Missing section: [{section}]",
+        "testing_with_nomadnet": "🧪 Testing with nomadnet...",
+        "nomadnet_not_found": "⚠️  nomadnet not found - cannot validate config",
+        "nomadnet_test_passed": "✅ nomadnet validation passed!",
+        "nomadnet_test_failed": "❌ nomadnet validation failed:",
+        "client_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          CLIENT SETTINGS                                     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 👤 Display name: {display_name}
+  [2] 📧 Enable propagation node: {propagation}
+  [3] 🔔 Announce at startup: {announce_startup}
+  [4] ⏰ Announce interval (minutes): {announce_interval}
+  [5] 🔙 Back to main menu
+
+""",
+        "textui_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          TEXT UI SETTINGS                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] ⏱️  Intro screen time (seconds): {intro_time}
+  [2] 🖊️  Default editor: {editor}
+  [3] 🎨 Theme (dark/light): {theme}
+  [4] 🌈 Colormode: {colormode}
+  [5] 🔤 Glyphs: {glyphs}
+  [6] 🖱️  Mouse support: {mouse}
+  [7] 🔙 Back to main menu
+
+""",
+        "node_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                           NODE SETTINGS                                      ║
+║                                                                              ║
+║  Enable node hosting to serve pages and files to other NomadNet users!      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📡 Enable node hosting: {enabled}
+  [2] 📛 Node name: {name}
+  [3] ⏰ Announce interval (minutes): {interval}
+  [4] 📄 Default homepage: {homepage}
+  [5] 🔙 Back to main menu
+
+""",
+        "page_hosting_info": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        📄 PAGE HOSTING INFORMATION                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+To host pages on your NomadNet node, you need to:
+
+1️⃣  ENABLE NODE HOSTING
+    Set 'enable_node = yes' in your config (use menu option 4)
+
+2️⃣  CREATE YOUR PAGES
+    Your pages should be placed in:
+    
+    📁 {pages_path}
+    
+    Create this folder if it doesn't exist!
+
+3️⃣  PAGE FORMAT
+    Pages use the Micron markup format (.mu extension)
+    Your homepage should be named: index.mu
+    
+    Example page (index.mu):
+    ─────────────────────────────────────────
+    `!Welcome to My Node
+    
+    >This is my NomadNet node!
+    
+    Here you can find:
+    `[Links`:/page/about.mu]
+    `[Files`::file/myfile.txt]
+    ─────────────────────────────────────────
+
+4️⃣  HOST FILES
+    Files to share should be placed in:
+    
+    📁 {files_path}
+
+5️⃣  AFTER CHANGES
+    Restart NomadNet to apply changes:
+    $ nomadnet --daemon  (for headless)
+    $ nomadnet           (for interactive)
+
+📚 For more info on Micron markup:
+   https://github.com/markqvist/NomadNet
+
+""",
+        "enter_display_name": "Enter your display name: ",
+        "enter_node_name": "Enter node name (shown to visitors): ",
+        "enter_editor": "Enter editor command (e.g., nano, vim, editor): ",
+        "enter_intro_time": "Enter intro screen time in seconds (0 to skip): ",
+        "enter_announce_interval": "Enter announce interval in minutes (0 to disable): ",
+        "enter_homepage": "Enter homepage filename (e.g., index.mu): ",
+        "select_theme": "Select theme:\n  [1] dark\n  [2] light\nChoice: ",
+        "select_colormode": "Select color depth:\n  [1] monochrome\n  [2] 16 colors\n  [3] 88 colors\n  [4] 256 colors\n  [5] 24bit (true color)\nChoice: ",
+        "select_glyphs": "Select glyph style:\n  [1] plain (ASCII only)\n  [2] unicode (default)\n  [3] nerdfont (requires Nerd Font)\nChoice: ",
+        "setting_updated": "✅ Setting updated!",
+        "enable_propagation": "Enable LXMF propagation node? (y/n): ",
+        "enable_node": "Enable node hosting? (y/n): ",
+        "enable_announce_startup": "Announce at startup? (y/n): ",
+        "enable_mouse": "Enable mouse support? (y/n): ",
+        "config_location": "📁 Config file location:",
+        "view_config": "📋 Current Configuration:",
+        "pages_folder": "📁 Pages folder:",
+        "files_folder": "📁 Files folder:",
+        "folder_exists": "✅ Folder exists",
+        "folder_missing": "⚠️  Folder does not exist - will be created when you run NomadNet",
+        "create_folders": "Would you like to create the hosting folders now? (y/n): ",
+        "folders_created": "✅ Folders created!",
+        "example_page_created": "📄 Example homepage created:",
+    },
+    
+    "it": {
+        "lang_name": "Italiano",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    NOMADNET - CONFIGURATORE INTERATTIVO                      ║
+║                                                                              ║
+║  Questo strumento ti aiuta a configurare NomadNet in modo interattivo.      ║
+║  Modificherà il file ~/.nomadnetwork/config in sicurezza.                   ║
+║                                                                              ║
+║  Verrà creato un backup prima di qualsiasi modifica.                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Config NomadNet non trovato in:",
+        "create_default": "Vuoi creare una configurazione predefinita? (s/n): ",
+        "creating_default": "📝 Creazione configurazione NomadNet predefinita...",
+        "run_nomadnet_first": "💡 Suggerimento: Esegui 'nomadnet' una volta per generare un config predefinito.",
+        "config_found": "✅ Trovato config NomadNet in:",
+        "backup_created": "💾 Backup creato:",
+        "permission_denied": "❌ Permesso negato. Prova con sudo o correggi i permessi.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MENU PRINCIPALE                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Visualizza configurazione attuale
+  [2] 👤 Modifica impostazioni client (nome, propagazione, ecc.)
+  [3] 🖥️  Modifica impostazioni UI testo (intro, colori, editor)
+  [4] 📡 Modifica impostazioni nodo (abilita hosting, intervallo annunci)
+  [5] 📄 Informazioni hosting pagine
+  [6] 🔧 Controlla e Correggi configurazione
+  [7] 💾 Salva ed esci
+  [8] ❌ Esci senza salvare
+
+""",
+        "enter_choice": "Inserisci la tua scelta: ",
+        "invalid_choice": "❌ Scelta non valida. Riprova.",
+        "press_enter": "Premi Invio per continuare...",
+        "yes": "s",
+        "no": "n",
+        "save_changes": "💾 Salvare le modifiche? (s/n): ",
+        "changes_saved": "✅ Configurazione salvata con successo!",
+        "no_changes": "ℹ️  Nessuna modifica da salvare.",
+        "exit_without_save": "⚠️  Uscire senza salvare le modifiche? (s/n): ",
+        "goodbye": "👋 Grazie per aver usato il Configuratore NomadNet!",
+        "current_value": "Valore attuale:",
+        "new_value": "Nuovo valore (premi Invio per mantenere): ",
+        "enabled": "abilitato",
+        "disabled": "disabilitato",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    CONTROLLA E CORREGGI CONFIGURAZIONE                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Controllo configurazione...",
+        "config_valid": "✅ La configurazione è valida!",
+        "config_issues": "⚠️  Trovati {count} problema/i:",
+        "fix_issues": "🔧 Vuoi correggere questi problemi? (s/n): ",
+        "fixing_issues": "🔧 Correzione in corso...",
+        "issues_fixed": "✅ Tutti i problemi sono stati corretti!",
+        "client_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        IMPOSTAZIONI CLIENT                                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 👤 Nome visualizzato: {display_name}
+  [2] 📧 Abilita nodo propagazione: {propagation}
+  [3] 🔔 Annuncia all'avvio: {announce_startup}
+  [4] ⏰ Intervallo annunci (minuti): {announce_interval}
+  [5] 🔙 Torna al menu principale
+
+""",
+        "textui_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        IMPOSTAZIONI UI TESTO                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] ⏱️  Tempo schermata intro (secondi): {intro_time}
+  [2] 🖊️  Editor predefinito: {editor}
+  [3] 🎨 Tema (dark/light): {theme}
+  [4] 🌈 Profondità colore: {colormode}
+  [5] 🔤 Glifi: {glyphs}
+  [6] 🖱️  Supporto mouse: {mouse}
+  [7] 🔙 Torna al menu principale
+
+""",
+        "node_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         IMPOSTAZIONI NODO                                    ║
+║                                                                              ║
+║  Abilita l'hosting del nodo per servire pagine e file ad altri utenti!      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📡 Abilita hosting nodo: {enabled}
+  [2] 📛 Nome nodo: {name}
+  [3] ⏰ Intervallo annunci (minuti): {interval}
+  [4] 📄 Homepage predefinita: {homepage}
+  [5] 🔙 Torna al menu principale
+
+""",
+        "page_hosting_info": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     📄 INFORMAZIONI HOSTING PAGINE                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Per ospitare pagine sul tuo nodo NomadNet, devi:
+
+1️⃣  ABILITARE L'HOSTING DEL NODO
+    Imposta 'enable_node = yes' nel tuo config (usa opzione menu 4)
+
+2️⃣  CREARE LE TUE PAGINE
+    Le tue pagine devono essere in:
+    
+    📁 {pages_path}
+    
+    Crea questa cartella se non esiste!
+
+3️⃣  FORMATO PAGINE
+    Le pagine usano il formato Micron (.mu)
+    La tua homepage dovrebbe chiamarsi: index.mu
+    
+    Esempio pagina (index.mu):
+    ─────────────────────────────────────────
+    `!Benvenuto nel Mio Nodo
+    
+    >Questo è il mio nodo NomadNet!
+    
+    Qui puoi trovare:
+    `[Link`:/page/about.mu]
+    `[File`::file/miofile.txt]
+    ─────────────────────────────────────────
+
+4️⃣  OSPITARE FILE
+    I file da condividere vanno in:
+    
+    📁 {files_path}
+
+5️⃣  DOPO LE MODIFICHE
+    Riavvia NomadNet per applicare le modifiche:
+    $ nomadnet --daemon  (per headless)
+    $ nomadnet           (per interattivo)
+
+📚 Per maggiori info sul markup Micron:
+   https://github.com/markqvist/NomadNet
+
+""",
+        "enter_display_name": "Inserisci il tuo nome visualizzato: ",
+        "enter_node_name": "Inserisci nome nodo (visibile ai visitatori): ",
+        "enter_editor": "Inserisci comando editor (es. nano, vim, editor): ",
+        "enter_intro_time": "Inserisci tempo schermata intro in secondi (0 per saltare): ",
+        "enter_announce_interval": "Inserisci intervallo annunci in minuti (0 per disabilitare): ",
+        "enter_homepage": "Inserisci nome file homepage (es. index.mu): ",
+        "select_theme": "Seleziona tema:\n  [1] dark\n  [2] light\nScelta: ",
+        "select_colormode": "Seleziona profondità colore:\n  [1] monocromo\n  [2] 16 colori\n  [3] 88 colori\n  [4] 256 colori\n  [5] 24bit (true color)\nScelta: ",
+        "select_glyphs": "Seleziona stile glifi:\n  [1] plain (solo ASCII)\n  [2] unicode (predefinito)\n  [3] nerdfont (richiede Nerd Font)\nScelta: ",
+        "setting_updated": "✅ Impostazione aggiornata!",
+        "enable_propagation": "Abilitare nodo propagazione LXMF? (s/n): ",
+        "enable_node": "Abilitare hosting nodo? (s/n): ",
+        "enable_announce_startup": "Annunciare all'avvio? (s/n): ",
+        "enable_glyphs": "Usare glifi (simboli)? (s/n): ",
+        "enable_mouse": "Abilitare supporto mouse? (s/n): ",
+        "config_location": "📁 Posizione file config:",
+        "view_config": "📋 Configurazione Attuale:",
+        "pages_folder": "📁 Cartella pagine:",
+        "files_folder": "📁 Cartella file:",
+        "folder_exists": "✅ Cartella esistente",
+        "folder_missing": "⚠️  Cartella non esistente - verrà creata quando esegui NomadNet",
+        "create_folders": "Vuoi creare le cartelle hosting ora? (s/n): ",
+        "folders_created": "✅ Cartelle create!",
+        "example_page_created": "📄 Homepage esempio creata:",
+    },
+    
+    "es": {
+        "lang_name": "Español",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    NOMADNET - CONFIGURADOR INTERACTIVO                       ║
+║                                                                              ║
+║  Esta herramienta te ayuda a configurar NomadNet interactivamente.          ║
+║  Editará tu archivo ~/.nomadnetwork/config de forma segura.                 ║
+║                                                                              ║
+║  Se creará una copia de seguridad antes de cualquier cambio.                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Config de NomadNet no encontrado en:",
+        "create_default": "¿Deseas crear una configuración predeterminada? (s/n): ",
+        "creating_default": "📝 Creando configuración NomadNet predeterminada...",
+        "run_nomadnet_first": "💡 Consejo: Ejecuta 'nomadnet' una vez para generar un config predeterminado.",
+        "config_found": "✅ Encontrado config NomadNet en:",
+        "backup_created": "💾 Copia de seguridad creada:",
+        "permission_denied": "❌ Permiso denegado. Intenta con sudo o corrige los permisos.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MENÚ PRINCIPAL                                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Ver configuración actual
+  [2] 👤 Editar configuración cliente (nombre, propagación, etc.)
+  [3] 🖥️  Editar configuración UI texto (intro, colores, editor)
+  [4] 📡 Editar configuración nodo (habilitar hosting, intervalo anuncios)
+  [5] 📄 Información de hosting de páginas
+  [6] 🔧 Verificar y Corregir configuración
+  [7] 💾 Guardar y salir
+  [8] ❌ Salir sin guardar
+
+""",
+        "enter_choice": "Ingresa tu elección: ",
+        "invalid_choice": "❌ Elección inválida. Intenta de nuevo.",
+        "press_enter": "Presiona Enter para continuar...",
+        "yes": "s",
+        "no": "n",
+        "save_changes": "💾 ¿Guardar los cambios? (s/n): ",
+        "changes_saved": "✅ ¡Configuración guardada exitosamente!",
+        "no_changes": "ℹ️  No hay cambios que guardar.",
+        "exit_without_save": "⚠️  ¿Salir sin guardar los cambios? (s/n): ",
+        "goodbye": "👋 ¡Gracias por usar el Configurador NomadNet!",
+        "current_value": "Valor actual:",
+        "new_value": "Nuevo valor (presiona Enter para mantener): ",
+        "enabled": "habilitado",
+        "disabled": "deshabilitado",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   VERIFICAR Y CORREGIR CONFIGURACIÓN                         ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Verificando configuración...",
+        "config_valid": "✅ ¡La configuración es válida!",
+        "config_issues": "⚠️  Se encontraron {count} problema(s):",
+        "fix_issues": "🔧 ¿Deseas corregir estos problemas? (s/n): ",
+        "fixing_issues": "🔧 Corrigiendo problemas...",
+        "issues_fixed": "✅ ¡Todos los problemas han sido corregidos!",
+        "client_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        CONFIGURACIÓN CLIENTE                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 👤 Nombre a mostrar: {display_name}
+  [2] 📧 Habilitar nodo propagación: {propagation}
+  [3] 🔔 Anunciar al inicio: {announce_startup}
+  [4] ⏰ Intervalo de anuncios (minutos): {announce_interval}
+  [5] 🔙 Volver al menú principal
+
+""",
+        "textui_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        CONFIGURACIÓN UI TEXTO                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] ⏱️  Tiempo pantalla intro (segundos): {intro_time}
+  [2] 🖊️  Editor predeterminado: {editor}
+  [3] 🎨 Tema (dark/light): {theme}
+  [4] 🌈 Profundidad de color: {colormode}
+  [5] 🔤 Glifos: {glyphs}
+  [6] 🖱️  Soporte de ratón: {mouse}
+  [7] 🔙 Volver al menú principal
+
+""",
+        "node_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        CONFIGURACIÓN DE NODO                                 ║
+║                                                                              ║
+║  ¡Habilita el hosting de nodo para servir páginas y archivos a otros!       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📡 Habilitar hosting de nodo: {enabled}
+  [2] 📛 Nombre del nodo: {name}
+  [3] ⏰ Intervalo de anuncios (minutos): {interval}
+  [4] 📄 Página de inicio: {homepage}
+  [5] 🔙 Volver al menú principal
+
+""",
+        "page_hosting_info": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                  📄 INFORMACIÓN DE HOSTING DE PÁGINAS                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Para hospedar páginas en tu nodo NomadNet, necesitas:
+
+1️⃣  HABILITAR EL HOSTING DE NODO
+    Configura 'enable_node = yes' en tu config (usa opción de menú 4)
+
+2️⃣  CREAR TUS PÁGINAS
+    Tus páginas deben estar en:
+    
+    📁 {pages_path}
+    
+    ¡Crea esta carpeta si no existe!
+
+3️⃣  FORMATO DE PÁGINAS
+    Las páginas usan el formato Micron (.mu)
+    Tu página de inicio debe llamarse: index.mu
+    
+    Ejemplo de página (index.mu):
+    ─────────────────────────────────────────
+    `!Bienvenido a Mi Nodo
+    
+    >¡Este es mi nodo NomadNet!
+    
+    Aquí puedes encontrar:
+    `[Enlaces`:/page/about.mu]
+    `[Archivos`::file/miarchivo.txt]
+    ─────────────────────────────────────────
+
+4️⃣  HOSPEDAR ARCHIVOS
+    Los archivos a compartir van en:
+    
+    📁 {files_path}
+
+5️⃣  DESPUÉS DE CAMBIOS
+    Reinicia NomadNet para aplicar cambios:
+    $ nomadnet --daemon  (para headless)
+    $ nomadnet           (para interactivo)
+
+📚 Para más info sobre el markup Micron:
+   https://github.com/markqvist/NomadNet
+
+""",
+        "enter_display_name": "Ingresa tu nombre a mostrar: ",
+        "enter_node_name": "Ingresa nombre del nodo (visible para visitantes): ",
+        "enter_editor": "Ingresa comando del editor (ej. nano, vim, editor): ",
+        "enter_intro_time": "Ingresa tiempo de pantalla intro en segundos (0 para omitir): ",
+        "enter_announce_interval": "Ingresa intervalo de anuncios en minutos (0 para deshabilitar): ",
+        "enter_homepage": "Ingresa nombre de archivo de inicio (ej. index.mu): ",
+        "select_theme": "Selecciona tema:\n  [1] dark\n  [2] light\nElección: ",
+        "select_colormode": "Selecciona profundidad de color:\n  [1] monocromo\n  [2] 16 colores\n  [3] 88 colores\n  [4] 256 colores\n  [5] 24bit (color verdadero)\nElección: ",
+        "select_glyphs": "Selecciona estilo de glifos:\n  [1] plain (solo ASCII)\n  [2] unicode (predeterminado)\n  [3] nerdfont (requiere Nerd Font)\nElección: ",
+        "setting_updated": "✅ ¡Configuración actualizada!",
+        "enable_propagation": "¿Habilitar nodo de propagación LXMF? (s/n): ",
+        "enable_node": "¿Habilitar hosting de nodo? (s/n): ",
+        "enable_announce_startup": "¿Anunciar al inicio? (s/n): ",
+        "enable_glyphs": "¿Usar glifos (símbolos)? (s/n): ",
+        "enable_mouse": "¿Habilitar soporte de ratón? (s/n): ",
+        "config_location": "📁 Ubicación del archivo config:",
+        "view_config": "📋 Configuración Actual:",
+        "pages_folder": "📁 Carpeta de páginas:",
+        "files_folder": "📁 Carpeta de archivos:",
+        "folder_exists": "✅ Carpeta existe",
+        "folder_missing": "⚠️  Carpeta no existe - se creará cuando ejecutes NomadNet",
+        "create_folders": "¿Deseas crear las carpetas de hosting ahora? (s/n): ",
+        "folders_created": "✅ ¡Carpetas creadas!",
+        "example_page_created": "📄 Página de inicio de ejemplo creada:",
+    },
+    
+    "de": {
+        "lang_name": "Deutsch",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    NOMADNET - INTERAKTIVER KONFIGURATOR                      ║
+║                                                                              ║
+║  Dieses Tool hilft dir, NomadNet interaktiv zu konfigurieren.               ║
+║  Es bearbeitet deine ~/.nomadnetwork/config Datei sicher.                   ║
+║                                                                              ║
+║  Ein Backup wird vor Änderungen erstellt.                                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  NomadNet-Konfiguration nicht gefunden unter:",
+        "create_default": "Möchtest du eine Standardkonfiguration erstellen? (j/n): ",
+        "creating_default": "📝 Erstelle Standard-NomadNet-Konfiguration...",
+        "run_nomadnet_first": "💡 Tipp: Führe 'nomadnet' einmal aus, um eine Standardkonfiguration zu generieren.",
+        "config_found": "✅ NomadNet-Konfiguration gefunden unter:",
+        "backup_created": "💾 Backup erstellt:",
+        "permission_denied": "❌ Zugriff verweigert. Versuche es mit sudo oder korrigiere die Berechtigungen.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              HAUPTMENÜ                                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Aktuelle Konfiguration anzeigen
+  [2] 👤 Client-Einstellungen bearbeiten (Name, Propagierung, etc.)
+  [3] 🖥️  Text-UI-Einstellungen bearbeiten (Intro, Farben, Editor)
+  [4] 📡 Knoten-Einstellungen bearbeiten (Hosting aktivieren, Ankündigungsintervall)
+  [5] 📄 Informationen zum Seiten-Hosting
+  [6] 🔧 Konfiguration prüfen und reparieren
+  [7] 💾 Speichern und beenden
+  [8] ❌ Beenden ohne zu speichern
+
+""",
+        "enter_choice": "Gib deine Wahl ein: ",
+        "invalid_choice": "❌ Ungültige Wahl. Bitte versuche es erneut.",
+        "press_enter": "Drücke Enter zum Fortfahren...",
+        "yes": "j",
+        "no": "n",
+        "save_changes": "💾 Änderungen speichern? (j/n): ",
+        "changes_saved": "✅ Konfiguration erfolgreich gespeichert!",
+        "no_changes": "ℹ️  Keine Änderungen zum Speichern.",
+        "exit_without_save": "⚠️  Ohne Speichern beenden? (j/n): ",
+        "goodbye": "👋 Danke für die Nutzung des NomadNet-Konfigurators!",
+        "current_value": "Aktueller Wert:",
+        "new_value": "Neuer Wert (Enter drücken zum Beibehalten): ",
+        "enabled": "aktiviert",
+        "disabled": "deaktiviert",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   KONFIGURATION PRÜFEN UND REPARIEREN                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Prüfe Konfiguration...",
+        "config_valid": "✅ Die Konfiguration ist gültig!",
+        "config_issues": "⚠️  {count} Problem(e) gefunden:",
+        "fix_issues": "🔧 Möchtest du diese Probleme beheben? (j/n): ",
+        "fixing_issues": "🔧 Behebe Probleme...",
+        "issues_fixed": "✅ Alle Probleme wurden behoben!",
+        "client_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        CLIENT-EINSTELLUNGEN                                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 👤 Anzeigename: {display_name}
+  [2] 📧 Propagierungsknoten aktivieren: {propagation}
+  [3] 🔔 Bei Start ankündigen: {announce_startup}
+  [4] ⏰ Ankündigungsintervall (Minuten): {announce_interval}
+  [5] 🔙 Zurück zum Hauptmenü
+
+""",
+        "textui_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        TEXT-UI-EINSTELLUNGEN                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] ⏱️  Intro-Bildschirmzeit (Sekunden): {intro_time}
+  [2] 🖊️  Standard-Editor: {editor}
+  [3] 🎨 Theme (dark/light): {theme}
+  [4] 🌈 Farbtiefe: {colormode}
+  [5] 🔤 Glyphen: {glyphs}
+  [6] 🖱️  Maus-Unterstützung: {mouse}
+  [7] 🔙 Zurück zum Hauptmenü
+
+""",
+        "node_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        KNOTEN-EINSTELLUNGEN                                  ║
+║                                                                              ║
+║  Aktiviere Knoten-Hosting, um Seiten und Dateien für andere bereitzustellen!║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📡 Knoten-Hosting aktivieren: {enabled}
+  [2] 📛 Knotenname: {name}
+  [3] ⏰ Ankündigungsintervall (Minuten): {interval}
+  [4] 📄 Standard-Homepage: {homepage}
+  [5] 🔙 Zurück zum Hauptmenü
+
+""",
+        "page_hosting_info": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    📄 INFORMATIONEN ZUM SEITEN-HOSTING                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Um Seiten auf deinem NomadNet-Knoten zu hosten, musst du:
+
+1️⃣  KNOTEN-HOSTING AKTIVIEREN
+    Setze 'enable_node = yes' in deiner Konfiguration (Menüoption 4)
+
+2️⃣  DEINE SEITEN ERSTELLEN
+    Deine Seiten sollten hier platziert werden:
+    
+    📁 {pages_path}
+    
+    Erstelle diesen Ordner, wenn er nicht existiert!
+
+3️⃣  SEITENFORMAT
+    Seiten verwenden das Micron-Markup-Format (.mu)
+    Deine Homepage sollte heißen: index.mu
+    
+    Beispielseite (index.mu):
+    ─────────────────────────────────────────
+    `!Willkommen auf Meinem Knoten
+    
+    >Dies ist mein NomadNet-Knoten!
+    
+    Hier findest du:
+    `[Links`:/page/about.mu]
+    `[Dateien`::file/meinedatei.txt]
+    ─────────────────────────────────────────
+
+4️⃣  DATEIEN HOSTEN
+    Zu teilende Dateien gehören in:
+    
+    📁 {files_path}
+
+5️⃣  NACH ÄNDERUNGEN
+    Starte NomadNet neu, um Änderungen anzuwenden:
+    $ nomadnet --daemon  (für headless)
+    $ nomadnet           (für interaktiv)
+
+📚 Für mehr Infos zum Micron-Markup:
+   https://github.com/markqvist/NomadNet
+
+""",
+        "enter_display_name": "Gib deinen Anzeigenamen ein: ",
+        "enter_node_name": "Gib Knotennamen ein (für Besucher sichtbar): ",
+        "enter_editor": "Gib Editor-Befehl ein (z.B. nano, vim, editor): ",
+        "enter_intro_time": "Gib Intro-Bildschirmzeit in Sekunden ein (0 zum Überspringen): ",
+        "enter_announce_interval": "Gib Ankündigungsintervall in Minuten ein (0 zum Deaktivieren): ",
+        "enter_homepage": "Gib Homepage-Dateinamen ein (z.B. index.mu): ",
+        "select_theme": "Wähle Theme:\n  [1] dark\n  [2] light\nWahl: ",
+        "select_colormode": "Wähle Farbtiefe:\n  [1] monochrom\n  [2] 16 Farben\n  [3] 88 Farben\n  [4] 256 Farben\n  [5] 24bit (True Color)\nWahl: ",
+        "select_glyphs": "Wähle Glyphenstil:\n  [1] plain (nur ASCII)\n  [2] unicode (Standard)\n  [3] nerdfont (erfordert Nerd Font)\nWahl: ",
+        "setting_updated": "✅ Einstellung aktualisiert!",
+        "enable_propagation": "LXMF-Propagierungsknoten aktivieren? (j/n): ",
+        "enable_node": "Knoten-Hosting aktivieren? (j/n): ",
+        "enable_announce_startup": "Bei Start ankündigen? (j/n): ",
+        "enable_glyphs": "Glyphen verwenden (Symbole)? (j/n): ",
+        "enable_mouse": "Maus-Unterstützung aktivieren? (j/n): ",
+        "config_location": "📁 Konfigurationsdatei-Speicherort:",
+        "view_config": "📋 Aktuelle Konfiguration:",
+        "pages_folder": "📁 Seiten-Ordner:",
+        "files_folder": "📁 Dateien-Ordner:",
+        "folder_exists": "✅ Ordner existiert",
+        "folder_missing": "⚠️  Ordner existiert nicht - wird erstellt, wenn du NomadNet startest",
+        "create_folders": "Möchtest du die Hosting-Ordner jetzt erstellen? (j/n): ",
+        "folders_created": "✅ Ordner erstellt!",
+        "example_page_created": "📄 Beispiel-Homepage erstellt:",
+    },
+    
+    "ru": {
+        "lang_name": "Русский",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    NOMADNET - ИНТЕРАКТИВНЫЙ КОНФИГУРАТОР                     ║
+║                                                                              ║
+║  Этот инструмент поможет вам настроить NomadNet интерактивно.               ║
+║  Он безопасно отредактирует ваш файл ~/.nomadnetwork/config.                ║
+║                                                                              ║
+║  Резервная копия будет создана перед любыми изменениями.                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Конфигурация NomadNet не найдена в:",
+        "create_default": "Создать конфигурацию по умолчанию? (д/н): ",
+        "creating_default": "📝 Создание конфигурации NomadNet по умолчанию...",
+        "run_nomadnet_first": "💡 Совет: Запустите 'nomadnet' один раз для генерации конфигурации по умолчанию.",
+        "config_found": "✅ Найдена конфигурация NomadNet в:",
+        "backup_created": "💾 Резервная копия создана:",
+        "permission_denied": "❌ Доступ запрещён. Попробуйте с sudo или исправьте права доступа.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              ГЛАВНОЕ МЕНЮ                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Показать текущую конфигурацию
+  [2] 👤 Редактировать настройки клиента (имя, распространение и т.д.)
+  [3] 🖥️  Редактировать настройки UI (интро, цвета, редактор)
+  [4] 📡 Редактировать настройки узла (хостинг, интервал объявлений)
+  [5] 📄 Информация о хостинге страниц
+  [6] 💾 Сохранить и выйти
+  [7] ❌ Выйти без сохранения
+
+""",
+        "enter_choice": "Введите ваш выбор: ",
+        "invalid_choice": "❌ Неверный выбор. Попробуйте снова.",
+        "press_enter": "Нажмите Enter для продолжения...",
+        "yes": "д",
+        "no": "н",
+        "save_changes": "💾 Сохранить изменения? (д/н): ",
+        "changes_saved": "✅ Конфигурация успешно сохранена!",
+        "no_changes": "ℹ️  Нет изменений для сохранения.",
+        "exit_without_save": "⚠️  Выйти без сохранения изменений? (д/н): ",
+        "goodbye": "👋 Спасибо за использование конфигуратора NomadNet!",
+        "current_value": "Текущее значение:",
+        "new_value": "Новое значение (Enter для сохранения текущего): ",
+        "enabled": "включено",
+        "disabled": "выключено",
+        "client_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        НАСТРОЙКИ КЛИЕНТА                                     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 👤 Отображаемое имя: {display_name}
+  [2] 📧 Включить узел распространения: {propagation}
+  [3] 🔔 Объявить при запуске: {announce_startup}
+  [4] ⏰ Интервал объявлений (минуты): {announce_interval}
+  [5] 🔙 Вернуться в главное меню
+
+""",
+        "textui_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        НАСТРОЙКИ ТЕКСТОВОГО UI                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] ⏱️  Время заставки (секунды): {intro_time}
+  [2] 🖊️  Редактор по умолчанию: {editor}
+  [3] 🎨 Тема (dark/light): {theme}
+  [4] 🌈 Глубина цвета: {colormode}
+  [5] 🔤 Глифы: {glyphs}
+  [6] 🖱️  Поддержка мыши: {mouse}
+  [7] 🔙 Вернуться в главное меню
+
+""",
+        "node_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          НАСТРОЙКИ УЗЛА                                      ║
+║                                                                              ║
+║  Включите хостинг узла для предоставления страниц и файлов другим!          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📡 Включить хостинг узла: {enabled}
+  [2] 📛 Имя узла: {name}
+  [3] ⏰ Интервал объявлений (минуты): {interval}
+  [4] 📄 Домашняя страница по умолчанию: {homepage}
+  [5] 🔙 Вернуться в главное меню
+
+""",
+        "page_hosting_info": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   📄 ИНФОРМАЦИЯ О ХОСТИНГЕ СТРАНИЦ                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Для размещения страниц на вашем узле NomadNet, вам нужно:
+
+1️⃣  ВКЛЮЧИТЬ ХОСТИНГ УЗЛА
+    Установите 'enable_node = yes' в вашем конфиге (опция меню 4)
+
+2️⃣  СОЗДАТЬ ВАШИ СТРАНИЦЫ
+    Ваши страницы должны находиться в:
+    
+    📁 {pages_path}
+    
+    Создайте эту папку, если она не существует!
+
+3️⃣  ФОРМАТ СТРАНИЦ
+    Страницы используют формат разметки Micron (.mu)
+    Ваша домашняя страница должна называться: index.mu
+    
+    Пример страницы (index.mu):
+    ─────────────────────────────────────────
+    `!Добро пожаловать на Мой Узел
+    
+    >Это мой узел NomadNet!
+    
+    Здесь вы можете найти:
+    `[Ссылки`:/page/about.mu]
+    `[Файлы`::file/myfile.txt]
+    ─────────────────────────────────────────
+
+4️⃣  РАЗМЕЩЕНИЕ ФАЙЛОВ
+    Файлы для обмена размещаются в:
+    
+    📁 {files_path}
+
+5️⃣  ПОСЛЕ ИЗМЕНЕНИЙ
+    Перезапустите NomadNet для применения изменений:
+    $ nomadnet --daemon  (для headless)
+    $ nomadnet           (для интерактивного)
+
+📚 Для информации о разметке Micron:
+   https://github.com/markqvist/NomadNet
+
+""",
+        "enter_display_name": "Введите ваше отображаемое имя: ",
+        "enter_node_name": "Введите имя узла (видимое посетителям): ",
+        "enter_editor": "Введите команду редактора (напр. nano, vim, editor): ",
+        "enter_intro_time": "Введите время заставки в секундах (0 для пропуска): ",
+        "enter_announce_interval": "Введите интервал объявлений в минутах (0 для отключения): ",
+        "enter_homepage": "Введите имя файла домашней страницы (напр. index.mu): ",
+        "select_theme": "Выберите тему:\n  [1] dark\n  [2] light\nВыбор: ",
+        "select_colormode": "Выберите глубину цвета:\n  [1] monochrome\n  [2] 16 цветов\n  [3] 88 цветов\n  [4] 256 цветов\n  [5] 24bit (true color)\nВыбор: ",
+        "select_glyphs": "Выберите стиль глифов:\n  [1] plain (только ASCII)\n  [2] unicode (по умолчанию)\n  [3] nerdfont (требуется Nerd Font)\nВыбор: ",
+        "setting_updated": "✅ Настройка обновлена!",
+        "enable_propagation": "Включить узел распространения LXMF? (д/н): ",
+        "enable_node": "Включить хостинг узла? (д/н): ",
+        "enable_announce_startup": "Объявлять при запуске? (д/н): ",
+        "enable_glyphs": "Использовать глифы (символы)? (д/н): ",
+        "enable_mouse": "Включить поддержку мыши? (д/н): ",
+        "config_location": "📁 Расположение файла конфигурации:",
+        "view_config": "📋 Текущая Конфигурация:",
+        "pages_folder": "📁 Папка страниц:",
+        "files_folder": "📁 Папка файлов:",
+        "folder_exists": "✅ Папка существует",
+        "folder_missing": "⚠️  Папка не существует - будет создана при запуске NomadNet",
+        "create_folders": "Создать папки хостинга сейчас? (д/н): ",
+        "folders_created": "✅ Папки созданы!",
+        "example_page_created": "📄 Примерная домашняя страница создана:",
+    },
+}
@@ -0,0 +1,1123 @@
+"""Strings of the Reticulum configurator in every supported language"""
+
+TRANSLATIONS = {
+    "en": {
+        "lang_name": "English",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║              RETICULUM NETWORK STACK - INTERACTIVE CONFIGURATOR             ║
+║                                                                              ║
+║  This tool helps you configure Reticulum interactively.                     ║
+║  It will edit your ~/.reticulum/config file safely.                         ║
+║                                                                              ║
+║  A backup will be created before any changes are made.                      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Reticulum config not found at:",
+        "create_default": "Would you like to create a default config? (y/n): ",
+        "creating_default": "📝 Creating default Reticulum configuration...",
+        "run_rnsd_first": "💡 Tip: Run 'rnsd' once to generate a default config, or let us create one.",
+        "config_found": "✅ Found Reticulum config at:",
+        "backup_created": "💾 Backup created:",
+        "permission_denied": "❌ Permission denied. Try running with sudo or fix permissions.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MAIN MENU                                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 View current configuration
+  [2] ⚙️  Edit general settings (loglevel, transport, etc.)
+  [3] 🌐 Manage interfaces
+  [4] 📡 Add TCP Client Interfaces (connect to network)
+  [5] 🔌 Quick Connect - Add recommended public nodes
+  [6] 🔧 Check & Fix configuration
+  [7] 🧰 Network tools & diagnostics
+  [8] 💾 Save and exit
+  [9] ❌ Exit without saving
+
+""",
+        "enter_choice": "Enter your choice: ",
+        "invalid_choice": "❌ Invalid choice. Please try again.",
+        "press_enter": "Press Enter to continue...",
+        "yes": "y",
+        "no": "n",
+        "save_changes": "💾 Save changes to config? (y/n): ",
+        "changes_saved": "✅ Configuration saved successfully!",
+        "no_changes": "ℹ️  No changes to save.",
+        "exit_without_save": "⚠️  Exit without saving changes? (y/n): ",
+        "goodbye": "👋 Thank you for using Reticulum Configurator!",
+        "current_value": "Current value:",
+        "new_value": "New value (press Enter to keep current): ",
+        "enabled": "enabled",
+        "disabled": "disabled",
+        "interface_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          INTERFACE MANAGEMENT                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 List all interfaces
+  [2] ✏️  Enable/Disable an interface
+  [3] ❌ Remove an interface
+  [4] ➕ Add new interface manually
+  [5] 📻 Add RNode LoRa interface
+  [6] 🔙 Back to main menu
+
+""",
+        "no_interfaces": "ℹ️  No interfaces found in configuration.",
+        "interface_list": "📡 Current Interfaces:",
+        "select_interface": "Select interface number: ",
+        "interface_enabled": "✅ Interface enabled:",
+        "interface_disabled": "🔴 Interface disabled:",
+        "interface_removed": "🗑️  Interface removed:",
+        "confirm_remove": "⚠️  Remove this interface? (y/n): ",
+        "tcp_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      ADD TCP CLIENT INTERFACE                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🌍 RMAP.world (Reticulum Map - recommended)
+  [2] 🇮🇪 Dublin Testnet Hub (official)
+  [3] 🌐 BetweenTheBorders Hub (community)
+  [4] 🇦🇺 Sydney RNS (community)
+  [5] 🇩🇪 Germany Node (community)
+  [6] ➕ Add custom TCP interface
+  [7] 📦 Add ALL recommended nodes
+  [8] 🗂️  Browse public node directory
+  [9] 🔙 Back to main menu
+
+""",
+        "quick_connect": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         QUICK CONNECT SETUP                                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+This will measure the connection latency to every known public node and
+add the fastest reachable ones to get you connected to the Reticulum
+network quickly.
+
+""",
+        "add_all_confirm": "Add all recommended nodes? (y/n): ",
+        "probing_nodes": "⏱️  Measuring latency to {count} public nodes...",
+        "add_fastest_confirm": "Add the {count} fastest reachable nodes? (y/n): ",
+        "no_nodes_reachable": "⚠️  No public node could be reached. Check your internet connection.",
+        "nodes_added": "✅ Nodes added successfully!",
+        "interface_name": "Interface name (e.g., 'My Node'): ",
+        "target_host": "Target host/IP: ",
+        "target_port": "Target port (default 4242): ",
+        "interface_added": "✅ Interface added:",
+        "already_exists": "⚠️  An interface with similar settings already exists.",
+        "rnode_ports": "🔌 USB serial devices found:",
+        "rnode_no_ports": "ℹ️  No USB serial devices found, enter the port path by hand.",
+        "rnode_select_port": "Device number or port path: ",
+        "rnode_presets": "📻 Radio presets:",
+        "rnode_select_preset": "Preset number (default 1): ",
+        "interface_types": "Interface types:",
+        "select_interface_type": "Type number: ",
+        "interface_settings": "Settings (Enter keeps the value in brackets):",
+        "value_required": "❌ {key} is required, the interface was not added",
+        "general_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          GENERAL SETTINGS                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📊 Log level (0-7, current: {loglevel})
+  [2] 🚀 Enable transport ({transport})
+  [3] 🔒 Panic on unrecoverable error ({panic})
+  [4] 🎛️  Apply performance profile
+  [5] 🔙 Back to main menu
+
+""",
+        "loglevel_help": """
+Log levels:
+  0 = Critical only
+  1 = Errors
+  2 = Warnings  
+  3 = Notices
+  4 = Info (default)
+  5 = Verbose
+  6 = Debug
+  7 = Extreme debug
+""",
+        "transport_help": """
+Transport mode allows your node to route traffic for other nodes.
+Enable this if you want to help the network or need to bridge interfaces.
+""",
+        "enter_loglevel": "Enter log level (0-7): ",
+        "enable_transport": "Enable transport mode? (y/n): ",
+        "setting_updated": "✅ Setting updated!",
+        "view_config": "📋 Current Configuration:",
+        "config_location": "📁 Config file location:",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      CHECK & FIX CONFIGURATION                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Checking configuration...",
+        "config_valid": "✅ Configuration is valid!",
+        "config_issues": "⚠️  Found {count} issue(s):",
+        "fix_issues": "🔧 Would you like to fix these issues? (y/n): ",
+        "fixing_issues": "🔧 Fixing issues...",
+        "issues_fixed": "✅ All issues fixed!",
+        "issue_section_missing": "Missing required section: [{section}]",
+        "issue_key_missing": "Missing key '{key}' in [{section}]",
+        "issue_bad_indentation": "Bad indentation in interface '{name}'",
+        "issue_invalid_value": "Invalid value for '{key}': {value}",
+        "issue_duplicate_interface": "Duplicate interface: {name}",
+        "issue_empty_section": "Empty [interfaces] section",
+        "testing_with_rnsd": "🧪 Testing with rnsd...",
+        "rnsd_not_found": "⚠️  rnsd not found - cannot validate config",
+        "rnsd_test_passed": "✅ rnsd validation passed!",
+        "rnsd_test_failed": "❌ rnsd validation failed:",
+        "tools_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                NETWORK TOOLS                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🩺 Monitor TCP interface health
+  [2] 📊 Live traffic dashboard
+  [3] 📈 Announce capacity planner
+  [4] 🔙 Back to main menu
+
+""",
+        "no_tcp_targets": "ℹ️  No enabled TCP client interfaces to monitor.",
+        "monitor_auto_disable": "Automatically disable interfaces that stay down? (y/n): ",
+        "monitor_stop_hint": "Press Ctrl+C to stop monitoring.",
+        "directory_select": "Node number to add, [r] refresh, [s] set source, Enter to go back: ",
+        "stats_unavailable": "⚠️  Could not read interface statistics. Is rnsd running?",
+        "select_profile": "Select profile number: ",
+        "apply_profile_confirm": "Apply these changes? (y/n): ",
+        "profile_applied": "✅ Profile applied:",
+        "profile_no_changes": "ℹ️  The configuration already matches this profile.",
+        "enter_destinations": "Expected number of destinations (default 100): ",
+        "enter_announce_interval": "Announce interval per destination in minutes (default 30): ",
+        "external_change": "⚠️  The config file was changed on disk by another program.",
+        "external_reloaded": "🔄 Reloaded the new version (you had no unsaved changes).",
+        "external_merged": "🔀 Your unsaved changes were merged with the new version.",
+        "merge_conflict_choice": "   Keep which value? (m = mine, t = on disk): ",
+        "profiles_title": "🎛️  Performance profiles",
+        "monitor_title": "🩺 TCP interface health - round {round}, every {interval}s",
+        "monitor_row": "median {median}  lost {lost}",
+        "health_ok": "ok",
+        "health_slow": "slow",
+        "health_down": "down",
+        "health_disabled": "disabled",
+        "health_unknown": "waiting",
+        "monitor_disabled": "⚠️  Disabled: {names} (save to keep the change)",
+        "directory_title": "🗂️  Public node directory",
+        "directory_source": "Source: {source} (updated: {updated})",
+        "directory_builtin_only": "built-in list only",
+        "directory_never": "never",
+        "directory_refresh_failed": "⚠️  Last refresh failed:",
+        "directory_refreshing": "⏳ Refreshing...",
+        "directory_enter_source": "File path or http(s) URL: ",
+        "node_added": "✅ Added:",
+        "node_skipped": "ℹ️  Skipped (exists):",
+        "node_unreachable": "unreachable",
+        "node_loss": "({loss} lost)",
+        "dashboard_title": "📊 Interface traffic - {time}, every {interval}s",
+        "dashboard_interface": "Interface",
+        "dashboard_stop_hint": "Press Ctrl+C to return to the menu.",
+        "planner_title": "📈 Announce capacity planner",
+        "add_interface_title": "➕ Add New Interface",
+        "rnode_title": "📻 Add RNode LoRa Interface",
+        "merge_conflict": "{where}: mine = {ours}, on disk = {theirs}",
+        "merge_present": "present",
+        "merge_removed": "removed",
+    },
+    
+    "it": {
+        "lang_name": "Italiano",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║              RETICULUM NETWORK STACK - CONFIGURATORE INTERATTIVO             ║
+║                                                                              ║
+║  Questo strumento ti aiuta a configurare Reticulum in modo interattivo.     ║
+║  Modificherà il file ~/.reticulum/config in sicurezza.                      ║
+║                                                                              ║
+║  Verrà creato un backup prima di qualsiasi modifica.                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Config Reticulum non trovato in:",
+        "create_default": "Vuoi creare una configurazione predefinita? (s/n): ",
+        "creating_default": "📝 Creazione configurazione Reticulum predefinita...",
+        "run_rnsd_first": "💡 Suggerimento: Esegui 'rnsd' una volta per generare un config predefinito.",
+        "config_found": "✅ Trovato config Reticulum in:",
+        "backup_created": "💾 Backup creato:",
+        "permission_denied": "❌ Permesso negato. Prova con sudo o correggi i permessi.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MENU PRINCIPALE                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Visualizza configurazione attuale
+  [2] ⚙️  Modifica impostazioni generali (loglevel, transport, ecc.)
+  [3] 🌐 Gestisci interfacce
+  [4] 📡 Aggiungi interfacce TCP Client (connetti alla rete)
+  [5] 🔌 Connessione Rapida - Aggiungi nodi pubblici consigliati
+  [6] 🔧 Controlla e Correggi configurazione
+  [7] 🧰 Strumenti di rete e diagnostica
+  [8] 💾 Salva ed esci
+  [9] ❌ Esci senza salvare
+
+""",
+        "enter_choice": "Inserisci la tua scelta: ",
+        "invalid_choice": "❌ Scelta non valida. Riprova.",
+        "press_enter": "Premi Invio per continuare...",
+        "yes": "s",
+        "no": "n",
+        "save_changes": "💾 Salvare le modifiche? (s/n): ",
+        "changes_saved": "✅ Configurazione salvata con successo!",
+        "no_changes": "ℹ️  Nessuna modifica da salvare.",
+        "exit_without_save": "⚠️  Uscire senza salvare le modifiche? (s/n): ",
+        "goodbye": "👋 Grazie per aver usato il Configuratore Reticulum!",
+        "current_value": "Valore attuale:",
+        "new_value": "Nuovo valore (premi Invio per mantenere): ",
+        "enabled": "abilitato",
+        "disabled": "disabilitato",
+        "interface_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        GESTIONE INTERFACCE                                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Elenca tutte le interfacce
+  [2] ✏️  Abilita/Disabilita un'interfaccia
+  [3] ❌ Rimuovi un'interfaccia
+  [4] ➕ Aggiungi nuova interfaccia manualmente
+  [5] 📻 Aggiungi interfaccia LoRa RNode
+  [6] 🔙 Torna al menu principale
+
+""",
+        "no_interfaces": "ℹ️  Nessuna interfaccia trovata nella configurazione.",
+        "interface_list": "📡 Interfacce Attuali:",
+        "select_interface": "Seleziona numero interfaccia: ",
+        "interface_enabled": "✅ Interfaccia abilitata:",
+        "interface_disabled": "🔴 Interfaccia disabilitata:",
+        "interface_removed": "🗑️  Interfaccia rimossa:",
+        "confirm_remove": "⚠️  Rimuovere questa interfaccia? (s/n): ",
+        "tcp_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    AGGIUNGI INTERFACCIA TCP CLIENT                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🌍 RMAP.world (Mappa Reticulum - consigliato)
+  [2] 🇮🇪 Dublin Testnet Hub (ufficiale)
+  [3] 🌐 BetweenTheBorders Hub (community)
+  [4] 🇦🇺 Sydney RNS (community)
+  [5] 🇩🇪 Nodo Germania (community)
+  [6] ➕ Aggiungi interfaccia TCP personalizzata
+  [7] 📦 Aggiungi TUTTI i nodi consigliati
+  [8] 🗂️  Sfoglia l'elenco dei nodi pubblici
+  [9] 🔙 Torna al menu principale
+
+""",
+        "quick_connect": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      CONFIGURAZIONE CONNESSIONE RAPIDA                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Questo misurerà la latenza di connessione verso tutti i nodi pubblici noti
+e aggiungerà i più veloci raggiungibili per connetterti rapidamente alla
+rete Reticulum.
+
+""",
+        "add_all_confirm": "Aggiungere tutti i nodi consigliati? (s/n): ",
+        "probing_nodes": "⏱️  Misurazione latenza verso {count} nodi pubblici...",
+        "add_fastest_confirm": "Aggiungere i {count} nodi raggiungibili più veloci? (s/n): ",
+        "no_nodes_reachable": "⚠️  Nessun nodo pubblico raggiungibile. Controlla la connessione internet.",
+        "nodes_added": "✅ Nodi aggiunti con successo!",
+        "interface_name": "Nome interfaccia (es. 'Mio Nodo'): ",
+        "target_host": "Host/IP di destinazione: ",
+        "target_port": "Porta di destinazione (predefinita 4242): ",
+        "interface_added": "✅ Interfaccia aggiunta:",
+        "already_exists": "⚠️  Un'interfaccia con impostazioni simili esiste già.",
+        "rnode_ports": "🔌 Dispositivi seriali USB trovati:",
+        "rnode_no_ports": "ℹ️  Nessun dispositivo seriale USB trovato, inserisci il percorso della porta a mano.",
+        "rnode_select_port": "Numero del dispositivo o percorso della porta: ",
+        "rnode_presets": "📻 Preimpostazioni radio:",
+        "rnode_select_preset": "Numero della preimpostazione (predefinito 1): ",
+        "interface_types": "Tipi di interfaccia:",
+        "select_interface_type": "Numero del tipo: ",
+        "interface_settings": "Impostazioni (Invio mantiene il valore tra parentesi):",
+        "value_required": "❌ {key} è obbligatorio, l'interfaccia non è stata aggiunta",
+        "general_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         IMPOSTAZIONI GENERALI                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📊 Livello log (0-7, attuale: {loglevel})
+  [2] 🚀 Abilita transport ({transport})
+  [3] 🔒 Panic su errore irreversibile ({panic})
+  [4] 🎛️  Applica profilo prestazioni
+  [5] 🔙 Torna al menu principale
+
+""",
+        "loglevel_help": """
+Livelli di log:
+  0 = Solo critici
+  1 = Errori
+  2 = Avvisi  
+  3 = Notifiche
+  4 = Info (predefinito)
+  5 = Verbose
+  6 = Debug
+  7 = Debug estremo
+""",
+        "transport_help": """
+La modalità transport permette al tuo nodo di instradare traffico per altri nodi.
+Abilitala se vuoi aiutare la rete o devi collegare interfacce.
+""",
+        "enter_loglevel": "Inserisci livello log (0-7): ",
+        "enable_transport": "Abilitare modalità transport? (s/n): ",
+        "setting_updated": "✅ Impostazione aggiornata!",
+        "view_config": "📋 Configurazione Attuale:",
+        "config_location": "📁 Posizione file config:",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    CONTROLLA E CORREGGI CONFIGURAZIONE                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Controllo configurazione...",
+        "config_valid": "✅ La configurazione è valida!",
+        "config_issues": "⚠️  Trovati {count} problema/i:",
+        "fix_issues": "🔧 Vuoi correggere questi problemi? (s/n): ",
+        "fixing_issues": "🔧 Correzione in corso...",
+        "issues_fixed": "✅ Tutti i problemi sono stati corretti!",
+        "issue_section_missing": "Sezione mancante: [{section}]",
+        "issue_key_missing": "Chiave '{key}' mancante in [{section}]",
+        "issue_bad_indentation": "Indentazione errata nell'interfaccia '{name}'",
+        "issue_invalid_value": "Valore non valido per '{key}': {value}",
+        "issue_duplicate_interface": "Interfaccia duplicata: {name}",
+        "issue_empty_section": "Sezione [interfaces] vuota",
+        "testing_with_rnsd": "🧪 Test con rnsd...",
+        "rnsd_not_found": "⚠️  rnsd non trovato - impossibile validare il config",
+        "rnsd_test_passed": "✅ Validazione rnsd superata!",
+        "rnsd_test_failed": "❌ Validazione rnsd fallita:",
+        "tools_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              STRUMENTI DI RETE                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🩺 Monitora lo stato delle interfacce TCP
+  [2] 📊 Dashboard traffico in tempo reale
+  [3] 📈 Pianificatore capacità annunci
+  [4] 🔙 Torna al menu principale
+
+""",
+        "no_tcp_targets": "ℹ️  Nessuna interfaccia client TCP abilitata da monitorare.",
+        "monitor_auto_disable": "Disabilitare automaticamente le interfacce sempre irraggiungibili? (s/n): ",
+        "monitor_stop_hint": "Premi Ctrl+C per fermare il monitoraggio.",
+        "directory_select": "Numero del nodo da aggiungere, [r] aggiorna, [s] imposta sorgente, Invio per tornare: ",
+        "stats_unavailable": "⚠️  Impossibile leggere le statistiche delle interfacce. rnsd è in esecuzione?",
+        "select_profile": "Seleziona il numero del profilo: ",
+        "apply_profile_confirm": "Applicare queste modifiche? (s/n): ",
+        "profile_applied": "✅ Profilo applicato:",
+        "profile_no_changes": "ℹ️  La configurazione corrisponde già a questo profilo.",
+        "enter_destinations": "Numero previsto di destinazioni (predefinito 100): ",
+        "enter_announce_interval": "Intervallo annunci per destinazione in minuti (predefinito 30): ",
+        "external_change": "⚠️  Il file di configurazione è stato modificato da un altro programma.",
+        "external_reloaded": "🔄 Ricaricata la nuova versione (nessuna modifica non salvata).",
+        "external_merged": "🔀 Le tue modifiche non salvate sono state unite alla nuova versione.",
+        "merge_conflict_choice": "   Quale valore tenere? (m = mio, t = su disco): ",
+        "profiles_title": "🎛️  Profili di prestazioni",
+        "monitor_title": "🩺 Stato delle interfacce TCP - giro {round}, ogni {interval}s",
+        "monitor_row": "mediana {median}  persi {lost}",
+        "health_ok": "ok",
+        "health_slow": "lento",
+        "health_down": "giù",
+        "health_disabled": "disattivata",
+        "health_unknown": "in attesa",
+        "monitor_disabled": "⚠️  Disattivate: {names} (salva per mantenere la modifica)",
+        "directory_title": "🗂️  Elenco dei nodi pubblici",
+        "directory_source": "Fonte: {source} (aggiornato: {updated})",
+        "directory_builtin_only": "solo l'elenco integrato",
+        "directory_never": "mai",
+        "directory_refresh_failed": "⚠️  L'ultimo aggiornamento non è riuscito:",
+        "directory_refreshing": "⏳ Aggiornamento...",
+        "directory_enter_source": "Percorso del file o URL http(s): ",
+        "node_added": "✅ Aggiunto:",
+        "node_skipped": "ℹ️  Saltato (esiste già):",
+        "node_unreachable": "irraggiungibile",
+        "node_loss": "({loss} persi)",
+        "dashboard_title": "📊 Traffico delle interfacce - {time}, ogni {interval}s",
+        "dashboard_interface": "Interfaccia",
+        "dashboard_stop_hint": "Premi Ctrl+C per tornare al menu.",
+        "planner_title": "📈 Pianificatore della capacità degli annunci",
+        "add_interface_title": "➕ Aggiungi nuova interfaccia",
+        "rnode_title": "📻 Aggiungi interfaccia LoRa RNode",
+        "merge_conflict": "{where}: mio = {ours}, su disco = {theirs}",
+        "merge_present": "presente",
+        "merge_removed": "rimossa",
+    },
+    
+    "es": {
+        "lang_name": "Español",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║              RETICULUM NETWORK STACK - CONFIGURADOR INTERACTIVO              ║
+║                                                                              ║
+║  Esta herramienta te ayuda a configurar Reticulum interactivamente.         ║
+║  Editará tu archivo ~/.reticulum/config de forma segura.                    ║
+║                                                                              ║
+║  Se creará una copia de seguridad antes de cualquier cambio.                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Config de Reticulum no encontrado en:",
+        "create_default": "¿Deseas crear una configuración predeterminada? (s/n): ",
+        "creating_default": "📝 Creando configuración Reticulum predeterminada...",
+        "run_rnsd_first": "💡 Consejo: Ejecuta 'rnsd' una vez para generar un config predeterminado.",
+        "config_found": "✅ Encontrado config Reticulum en:",
+        "backup_created": "💾 Copia de seguridad creada:",
+        "permission_denied": "❌ Permiso denegado. Intenta con sudo o corrige los permisos.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              MENÚ PRINCIPAL                                  ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Ver configuración actual
+  [2] ⚙️  Editar configuración general (loglevel, transport, etc.)
+  [3] 🌐 Gestionar interfaces
+  [4] 📡 Añadir interfaces TCP Client (conectar a la red)
+  [5] 🔌 Conexión Rápida - Añadir nodos públicos recomendados
+  [6] 🔧 Verificar y Corregir configuración
+  [7] 🧰 Herramientas de red y diagnóstico
+  [8] 💾 Guardar y salir
+  [9] ❌ Salir sin guardar
+
+""",
+        "enter_choice": "Ingresa tu elección: ",
+        "invalid_choice": "❌ Elección inválida. Intenta de nuevo.",
+        "press_enter": "Presiona Enter para continuar...",
+        "yes": "s",
+        "no": "n",
+        "save_changes": "💾 ¿Guardar los cambios? (s/n): ",
+        "changes_saved": "✅ ¡Configuración guardada exitosamente!",
+        "no_changes": "ℹ️  No hay cambios que guardar.",
+        "exit_without_save": "⚠️  ¿Salir sin guardar los cambios? (s/n): ",
+        "goodbye": "👋 ¡Gracias por usar el Configurador Reticulum!",
+        "current_value": "Valor actual:",
+        "new_value": "Nuevo valor (presiona Enter para mantener): ",
+        "enabled": "habilitado",
+        "disabled": "deshabilitado",
+        "interface_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                         GESTIÓN DE INTERFACES                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Listar todas las interfaces
+  [2] ✏️  Habilitar/Deshabilitar una interfaz
+  [3] ❌ Eliminar una interfaz
+  [4] ➕ Añadir nueva interfaz manualmente
+  [5] 📻 Añadir interfaz LoRa RNode
+  [6] 🔙 Volver al menú principal
+
+""",
+        "no_interfaces": "ℹ️  No se encontraron interfaces en la configuración.",
+        "interface_list": "📡 Interfaces Actuales:",
+        "select_interface": "Selecciona número de interfaz: ",
+        "interface_enabled": "✅ Interfaz habilitada:",
+        "interface_disabled": "🔴 Interfaz deshabilitada:",
+        "interface_removed": "🗑️  Interfaz eliminada:",
+        "confirm_remove": "⚠️  ¿Eliminar esta interfaz? (s/n): ",
+        "tcp_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    AÑADIR INTERFAZ TCP CLIENT                                ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🌍 RMAP.world (Mapa Reticulum - recomendado)
+  [2] 🇮🇪 Dublin Testnet Hub (oficial)
+  [3] 🌐 BetweenTheBorders Hub (comunidad)
+  [4] 🇦🇺 Sydney RNS (comunidad)
+  [5] 🇩🇪 Nodo Alemania (comunidad)
+  [6] ➕ Añadir interfaz TCP personalizada
+  [7] 📦 Añadir TODOS los nodos recomendados
+  [8] 🗂️  Explorar el directorio de nodos públicos
+  [9] 🔙 Volver al menú principal
+
+""",
+        "quick_connect": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   CONFIGURACIÓN DE CONEXIÓN RÁPIDA                           ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Esto medirá la latencia de conexión a todos los nodos públicos conocidos
+y añadirá los más rápidos alcanzables para conectarte rápidamente a la
+red Reticulum.
+
+""",
+        "add_all_confirm": "¿Añadir todos los nodos recomendados? (s/n): ",
+        "probing_nodes": "⏱️  Midiendo latencia a {count} nodos públicos...",
+        "add_fastest_confirm": "¿Añadir los {count} nodos alcanzables más rápidos? (s/n): ",
+        "no_nodes_reachable": "⚠️  No se pudo alcanzar ningún nodo público. Verifica tu conexión a internet.",
+        "nodes_added": "✅ ¡Nodos añadidos exitosamente!",
+        "interface_name": "Nombre de interfaz (ej. 'Mi Nodo'): ",
+        "target_host": "Host/IP de destino: ",
+        "target_port": "Puerto de destino (predeterminado 4242): ",
+        "interface_added": "✅ Interfaz añadida:",
+        "already_exists": "⚠️  Ya existe una interfaz con configuración similar.",
+        "rnode_ports": "🔌 Dispositivos serie USB encontrados:",
+        "rnode_no_ports": "ℹ️  No se encontraron dispositivos serie USB, introduce la ruta del puerto a mano.",
+        "rnode_select_port": "Número de dispositivo o ruta del puerto: ",
+        "rnode_presets": "📻 Ajustes de radio predefinidos:",
+        "rnode_select_preset": "Número de ajuste (predeterminado 1): ",
+        "interface_types": "Tipos de interfaz:",
+        "select_interface_type": "Número de tipo: ",
+        "interface_settings": "Ajustes (Enter mantiene el valor entre corchetes):",
+        "value_required": "❌ {key} es obligatorio, la interfaz no se añadió",
+        "general_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        CONFIGURACIÓN GENERAL                                 ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📊 Nivel de log (0-7, actual: {loglevel})
+  [2] 🚀 Habilitar transport ({transport})
+  [3] 🔒 Panic en error irrecuperable ({panic})
+  [4] 🎛️  Aplicar perfil de rendimiento
+  [5] 🔙 Volver al menú principal
+
+""",
+        "loglevel_help": """
+Niveles de log:
+  0 = Solo críticos
+  1 = Errores
+  2 = Advertencias  
+  3 = Avisos
+  4 = Info (predeterminado)
+  5 = Verbose
+  6 = Debug
+  7 = Debug extremo
+""",
+        "transport_help": """
+El modo transport permite a tu nodo enrutar tráfico para otros nodos.
+Habilítalo si quieres ayudar a la red o necesitas conectar interfaces.
+""",
+        "enter_loglevel": "Ingresa nivel de log (0-7): ",
+        "enable_transport": "¿Habilitar modo transport? (s/n): ",
+        "setting_updated": "✅ ¡Configuración actualizada!",
+        "view_config": "📋 Configuración Actual:",
+        "config_location": "📁 Ubicación del archivo config:",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   VERIFICAR Y CORREGIR CONFIGURACIÓN                         ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Verificando configuración...",
+        "config_valid": "✅ ¡La configuración es válida!",
+        "config_issues": "⚠️  Se encontraron {count} problema(s):",
+        "fix_issues": "🔧 ¿Deseas corregir estos problemas? (s/n): ",
+        "fixing_issues": "🔧 Corrigiendo problemas...",
+        "issues_fixed": "✅ ¡Todos los problemas han sido corregidos!",
+        "issue_section_missing": "Sección faltante: [{section}]",
+        "issue_key_missing": "Clave '{key}' faltante en [{section}]",
+        "issue_bad_indentation": "Indentación incorrecta en interfaz '{name}'",
+        "issue_invalid_value": "Valor inválido para '{key}': {value}",
+        "issue_duplicate_interface": "Interfaz duplicada: {name}",
+        "issue_empty_section": "Sección [interfaces] vacía",
+        "testing_with_rnsd": "🧪 Probando con rnsd...",
+        "rnsd_not_found": "⚠️  rnsd no encontrado - no se puede validar el config",
+        "rnsd_test_passed": "✅ ¡Validación rnsd exitosa!",
+        "rnsd_test_failed": "❌ Validación rnsd falló:",
+        "tools_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                             HERRAMIENTAS DE RED                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🩺 Monitorear el estado de interfaces TCP
+  [2] 📊 Panel de tráfico en vivo
+  [3] 📈 Planificador de capacidad de anuncios
+  [4] 🔙 Volver al menú principal
+
+""",
+        "no_tcp_targets": "ℹ️  No hay interfaces cliente TCP habilitadas para monitorear.",
+        "monitor_auto_disable": "¿Desactivar automáticamente las interfaces que siguen caídas? (s/n): ",
+        "monitor_stop_hint": "Presiona Ctrl+C para detener el monitoreo.",
+        "directory_select": "Número del nodo a añadir, [r] actualizar, [s] fijar fuente, Enter para volver: ",
+        "stats_unavailable": "⚠️  No se pudieron leer las estadísticas de interfaces. ¿Está rnsd en ejecución?",
+        "select_profile": "Selecciona el número de perfil: ",
+        "apply_profile_confirm": "¿Aplicar estos cambios? (s/n): ",
+        "profile_applied": "✅ Perfil aplicado:",
+        "profile_no_changes": "ℹ️  La configuración ya coincide con este perfil.",
+        "enter_destinations": "Número esperado de destinos (predeterminado 100): ",
+        "enter_announce_interval": "Intervalo de anuncios por destino en minutos (predeterminado 30): ",
+        "external_change": "⚠️  Otro programa ha modificado el archivo de configuración.",
+        "external_reloaded": "🔄 Se ha recargado la nueva versión (no había cambios sin guardar).",
+        "external_merged": "🔀 Tus cambios sin guardar se han combinado con la nueva versión.",
+        "merge_conflict_choice": "   ¿Qué valor mantener? (m = mío, t = en disco): ",
+        "profiles_title": "🎛️  Perfiles de rendimiento",
+        "monitor_title": "🩺 Estado de las interfaces TCP - ronda {round}, cada {interval}s",
+        "monitor_row": "mediana {median}  perdidos {lost}",
+        "health_ok": "ok",
+        "health_slow": "lento",
+        "health_down": "caído",
+        "health_disabled": "desactivada",
+        "health_unknown": "esperando",
+        "monitor_disabled": "⚠️  Desactivadas: {names} (guarda para conservar el cambio)",
+        "directory_title": "🗂️  Directorio de nodos públicos",
+        "directory_source": "Fuente: {source} (actualizado: {updated})",
+        "directory_builtin_only": "solo la lista integrada",
+        "directory_never": "nunca",
+        "directory_refresh_failed": "⚠️  La última actualización falló:",
+        "directory_refreshing": "⏳ Actualizando...",
+        "directory_enter_source": "Ruta del archivo o URL http(s): ",
+        "node_added": "✅ Añadido:",
+        "node_skipped": "ℹ️  Omitido (ya existe):",
+        "node_unreachable": "inalcanzable",
+        "node_loss": "({loss} perdidos)",
+        "dashboard_title": "📊 Tráfico de las interfaces - {time}, cada {interval}s",
+        "dashboard_interface": "Interfaz",
+        "dashboard_stop_hint": "Pulsa Ctrl+C para volver al menú.",
+        "planner_title": "📈 Planificador de capacidad de anuncios",
+        "add_interface_title": "➕ Añadir nueva interfaz",
+        "rnode_title": "📻 Añadir interfaz LoRa RNode",
+        "merge_conflict": "{where}: mío = {ours}, en disco = {theirs}",
+        "merge_present": "presente",
+        "merge_removed": "eliminada",
+    },
+    
+    "de": {
+        "lang_name": "Deutsch",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║              RETICULUM NETWORK STACK - INTERAKTIVER KONFIGURATOR             ║
+║                                                                              ║
+║  Dieses Tool hilft dir, Reticulum interaktiv zu konfigurieren.              ║
+║  Es bearbeitet deine ~/.reticulum/config Datei sicher.                      ║
+║                                                                              ║
+║  Ein Backup wird vor Änderungen erstellt.                                   ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Reticulum-Konfiguration nicht gefunden unter:",
+        "create_default": "Möchtest du eine Standardkonfiguration erstellen? (j/n): ",
+        "creating_default": "📝 Erstelle Standard-Reticulum-Konfiguration...",
+        "run_rnsd_first": "💡 Tipp: Führe 'rnsd' einmal aus, um eine Standardkonfiguration zu generieren.",
+        "config_found": "✅ Reticulum-Konfiguration gefunden unter:",
+        "backup_created": "💾 Backup erstellt:",
+        "permission_denied": "❌ Zugriff verweigert. Versuche es mit sudo oder korrigiere die Berechtigungen.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              HAUPTMENÜ                                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Aktuelle Konfiguration anzeigen
+  [2] ⚙️  Allgemeine Einstellungen bearbeiten (loglevel, transport, etc.)
+  [3] 🌐 Schnittstellen verwalten
+  [4] 📡 TCP-Client-Schnittstellen hinzufügen (mit Netzwerk verbinden)
+  [5] 🔌 Schnellverbindung - Empfohlene öffentliche Knoten hinzufügen
+  [6] 🔧 Konfiguration prüfen und reparieren
+  [7] 🧰 Netzwerk-Werkzeuge & Diagnose
+  [8] 💾 Speichern und beenden
+  [9] ❌ Beenden ohne zu speichern
+
+""",
+        "enter_choice": "Gib deine Wahl ein: ",
+        "invalid_choice": "❌ Ungültige Wahl. Bitte versuche es erneut.",
+        "press_enter": "Drücke Enter zum Fortfahren...",
+        "yes": "j",
+        "no": "n",
+        "save_changes": "💾 Änderungen speichern? (j/n): ",
+        "changes_saved": "✅ Konfiguration erfolgreich gespeichert!",
+        "no_changes": "ℹ️  Keine Änderungen zum Speichern.",
+        "exit_without_save": "⚠️  Ohne Speichern beenden? (j/n): ",
+        "goodbye": "👋 Danke für die Nutzung des Reticulum-Konfigurators!",
+        "current_value": "Aktueller Wert:",
+        "new_value": "Neuer Wert (Enter drücken zum Beibehalten): ",
+        "enabled": "aktiviert",
+        "disabled": "deaktiviert",
+        "interface_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        SCHNITTSTELLENVERWALTUNG                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Alle Schnittstellen auflisten
+  [2] ✏️  Schnittstelle aktivieren/deaktivieren
+  [3] ❌ Schnittstelle entfernen
+  [4] ➕ Neue Schnittstelle manuell hinzufügen
+  [5] 📻 RNode-LoRa-Schnittstelle hinzufügen
+  [6] 🔙 Zurück zum Hauptmenü
+
+""",
+        "no_interfaces": "ℹ️  Keine Schnittstellen in der Konfiguration gefunden.",
+        "interface_list": "📡 Aktuelle Schnittstellen:",
+        "select_interface": "Wähle Schnittstellennummer: ",
+        "interface_enabled": "✅ Schnittstelle aktiviert:",
+        "interface_disabled": "🔴 Schnittstelle deaktiviert:",
+        "interface_removed": "🗑️  Schnittstelle entfernt:",
+        "confirm_remove": "⚠️  Diese Schnittstelle entfernen? (j/n): ",
+        "tcp_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    TCP-CLIENT-SCHNITTSTELLE HINZUFÜGEN                       ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🌍 RMAP.world (Reticulum-Karte - empfohlen)
+  [2] 🇮🇪 Dublin Testnet Hub (offiziell)
+  [3] 🌐 BetweenTheBorders Hub (Community)
+  [4] 🇦🇺 Sydney RNS (Community)
+  [5] 🇩🇪 Deutschland-Knoten (Community)
+  [6] ➕ Benutzerdefinierte TCP-Schnittstelle hinzufügen
+  [7] 📦 ALLE empfohlenen Knoten hinzufügen
+  [8] 🗂️  Verzeichnis öffentlicher Knoten durchsuchen
+  [9] 🔙 Zurück zum Hauptmenü
+
+""",
+        "quick_connect": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      SCHNELLVERBINDUNGS-EINRICHTUNG                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Dies misst die Verbindungslatenz zu allen bekannten öffentlichen Knoten
+und fügt die schnellsten erreichbaren hinzu, um dich schnell mit dem
+Reticulum-Netzwerk zu verbinden.
+
+""",
+        "add_all_confirm": "Alle empfohlenen Knoten hinzufügen? (j/n): ",
+        "probing_nodes": "⏱️  Messe Latenz zu {count} öffentlichen Knoten...",
+        "add_fastest_confirm": "Die {count} schnellsten erreichbaren Knoten hinzufügen? (j/n): ",
+        "no_nodes_reachable": "⚠️  Kein öffentlicher Knoten erreichbar. Prüfe deine Internetverbindung.",
+        "nodes_added": "✅ Knoten erfolgreich hinzugefügt!",
+        "interface_name": "Schnittstellenname (z.B. 'Mein Knoten'): ",
+        "target_host": "Ziel-Host/IP: ",
+        "target_port": "Ziel-Port (Standard 4242): ",
+        "interface_added": "✅ Schnittstelle hinzugefügt:",
+        "already_exists": "⚠️  Eine Schnittstelle mit ähnlichen Einstellungen existiert bereits.",
+        "rnode_ports": "🔌 Gefundene serielle USB-Geräte:",
+        "rnode_no_ports": "ℹ️  Keine seriellen USB-Geräte gefunden, Port-Pfad bitte von Hand eingeben.",
+        "rnode_select_port": "Gerätenummer oder Port-Pfad: ",
+        "rnode_presets": "📻 Funk-Voreinstellungen:",
+        "rnode_select_preset": "Nummer der Voreinstellung (Standard 1): ",
+        "interface_types": "Schnittstellentypen:",
+        "select_interface_type": "Nummer des Typs: ",
+        "interface_settings": "Einstellungen (Enter behält den Wert in Klammern):",
+        "value_required": "❌ {key} ist erforderlich, die Schnittstelle wurde nicht hinzugefügt",
+        "general_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        ALLGEMEINE EINSTELLUNGEN                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📊 Log-Level (0-7, aktuell: {loglevel})
+  [2] 🚀 Transport aktivieren ({transport})
+  [3] 🔒 Panic bei nicht behebbarem Fehler ({panic})
+  [4] 🎛️  Leistungsprofil anwenden
+  [5] 🔙 Zurück zum Hauptmenü
+
+""",
+        "loglevel_help": """
+Log-Level:
+  0 = Nur kritisch
+  1 = Fehler
+  2 = Warnungen  
+  3 = Hinweise
+  4 = Info (Standard)
+  5 = Ausführlich
+  6 = Debug
+  7 = Extremes Debug
+""",
+        "transport_help": """
+Der Transport-Modus ermöglicht deinem Knoten, Verkehr für andere Knoten zu routen.
+Aktiviere dies, wenn du dem Netzwerk helfen oder Schnittstellen verbinden möchtest.
+""",
+        "enter_loglevel": "Gib Log-Level ein (0-7): ",
+        "enable_transport": "Transport-Modus aktivieren? (j/n): ",
+        "setting_updated": "✅ Einstellung aktualisiert!",
+        "view_config": "📋 Aktuelle Konfiguration:",
+        "config_location": "📁 Konfigurationsdatei-Speicherort:",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                   KONFIGURATION PRÜFEN UND REPARIEREN                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Prüfe Konfiguration...",
+        "config_valid": "✅ Die Konfiguration ist gültig!",
+        "config_issues": "⚠️  {count} Problem(e) gefunden:",
+        "fix_issues": "🔧 Möchtest du diese Probleme beheben? (j/n): ",
+        "fixing_issues": "🔧 Behebe Probleme...",
+        "issues_fixed": "✅ Alle Probleme wurden behoben!",
+        "issue_section_missing": "Fehlender Abschnitt: [{section}]",
+        "issue_key_missing": "Fehlender Schlüssel '{key}' in [{section}]",
+        "issue_bad_indentation": "Falsche Einrückung bei Schnittstelle '{name}'",
+        "issue_invalid_value": "Ungültiger Wert für '{key}': {value}",
+        "issue_duplicate_interface": "Doppelte Schnittstelle: {name}",
+        "issue_empty_section": "Leerer [interfaces] Abschnitt",
+        "testing_with_rnsd": "🧪 Teste mit rnsd...",
+        "rnsd_not_found": "⚠️  rnsd nicht gefunden - Konfiguration kann nicht validiert werden",
+        "rnsd_test_passed": "✅ rnsd Validierung bestanden!",
+        "rnsd_test_failed": "❌ rnsd Validierung fehlgeschlagen:",
+        "tools_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              NETZWERK-WERKZEUGE                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🩺 Zustand der TCP-Schnittstellen überwachen
+  [2] 📊 Live-Verkehrsübersicht
+  [3] 📈 Announce-Kapazitätsplaner
+  [4] 🔙 Zurück zum Hauptmenü
+
+""",
+        "no_tcp_targets": "ℹ️  Keine aktivierten TCP-Client-Schnittstellen zu überwachen.",
+        "monitor_auto_disable": "Dauerhaft ausgefallene Schnittstellen automatisch deaktivieren? (j/n): ",
+        "monitor_stop_hint": "Drücke Strg+C, um die Überwachung zu beenden.",
+        "directory_select": "Nummer des hinzuzufügenden Knotens, [r] aktualisieren, [s] Quelle festlegen, Enter für zurück: ",
+        "stats_unavailable": "⚠️  Schnittstellenstatistiken konnten nicht gelesen werden. Läuft rnsd?",
+        "select_profile": "Profilnummer wählen: ",
+        "apply_profile_confirm": "Diese Änderungen anwenden? (j/n): ",
+        "profile_applied": "✅ Profil angewendet:",
+        "profile_no_changes": "ℹ️  Die Konfiguration entspricht bereits diesem Profil.",
+        "enter_destinations": "Erwartete Anzahl Ziele (Standard 100): ",
+        "enter_announce_interval": "Announce-Intervall pro Ziel in Minuten (Standard 30): ",
+        "external_change": "⚠️  Die Konfigurationsdatei wurde von einem anderen Programm geändert.",
+        "external_reloaded": "🔄 Neue Version geladen (keine ungespeicherten Änderungen).",
+        "external_merged": "🔀 Deine ungespeicherten Änderungen wurden mit der neuen Version zusammengeführt.",
+        "merge_conflict_choice": "   Welchen Wert behalten? (m = meiner, t = auf der Platte): ",
+        "profiles_title": "🎛️  Leistungsprofile",
+        "monitor_title": "🩺 Zustand der TCP-Schnittstellen - Runde {round}, alle {interval}s",
+        "monitor_row": "Median {median}  verloren {lost}",
+        "health_ok": "ok",
+        "health_slow": "langsam",
+        "health_down": "down",
+        "health_disabled": "deaktiviert",
+        "health_unknown": "wartet",
+        "monitor_disabled": "⚠️  Deaktiviert: {names} (speichern, um die Änderung zu behalten)",
+        "directory_title": "🗂️  Verzeichnis öffentlicher Knoten",
+        "directory_source": "Quelle: {source} (aktualisiert: {updated})",
+        "directory_builtin_only": "nur die eingebaute Liste",
+        "directory_never": "nie",
+        "directory_refresh_failed": "⚠️  Letzte Aktualisierung fehlgeschlagen:",
+        "directory_refreshing": "⏳ Aktualisiere...",
+        "directory_enter_source": "Dateipfad oder http(s)-URL: ",
+        "node_added": "✅ Hinzugefügt:",
+        "node_skipped": "ℹ️  Übersprungen (existiert):",
+        "node_unreachable": "nicht erreichbar",
+        "node_loss": "({loss} verloren)",
+        "dashboard_title": "📊 Schnittstellenverkehr - {time}, alle {interval}s",
+        "dashboard_interface": "Schnittstelle",
+        "dashboard_stop_hint": "Drücke Strg+C, um zum Menü zurückzukehren.",
+        "planner_title": "📈 Announce-Kapazitätsplaner",
+        "add_interface_title": "➕ Neue Schnittstelle hinzufügen",
+        "rnode_title": "📻 RNode-LoRa-Schnittstelle hinzufügen",
+        "merge_conflict": "{where}: meiner = {ours}, auf der Platte = {theirs}",
+        "merge_present": "vorhanden",
+        "merge_removed": "entfernt",
+    },
+    
+    "ru": {
+        "lang_name": "Русский",
+        "welcome": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║              RETICULUM NETWORK STACK - ИНТЕРАКТИВНЫЙ КОНФИГУРАТОР            ║
+║                                                                              ║
+║  Этот инструмент поможет вам настроить Reticulum интерактивно.              ║
+║  Он безопасно отредактирует ваш файл ~/.reticulum/config.                   ║
+║                                                                              ║
+║  Резервная копия будет создана перед любыми изменениями.                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "config_not_found": "⚠️  Конфигурация Reticulum не найдена в:",
+        "create_default": "Создать конфигурацию по умолчанию? (д/н): ",
+        "creating_default": "📝 Создание конфигурации Reticulum по умолчанию...",
+        "run_rnsd_first": "💡 Совет: Запустите 'rnsd' один раз для генерации конфигурации по умолчанию.",
+        "config_found": "✅ Найдена конфигурация Reticulum в:",
+        "backup_created": "💾 Резервная копия создана:",
+        "permission_denied": "❌ Доступ запрещён. Попробуйте с sudo или исправьте права доступа.",
+        "main_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                              ГЛАВНОЕ МЕНЮ                                    ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Показать текущую конфигурацию
+  [2] ⚙️  Редактировать общие настройки (loglevel, transport и т.д.)
+  [3] 🌐 Управление интерфейсами
+  [4] 📡 Добавить TCP Client интерфейсы (подключиться к сети)
+  [5] 🔌 Быстрое подключение - Добавить рекомендуемые публичные узлы
+  [6] 🔧 Проверить и исправить конфигурацию
+  [7] 🧰 Сетевые инструменты и диагностика
+  [8] 💾 Сохранить и выйти
+  [9] ❌ Выйти без сохранения
+
+""",
+        "enter_choice": "Введите ваш выбор: ",
+        "invalid_choice": "❌ Неверный выбор. Попробуйте снова.",
+        "press_enter": "Нажмите Enter для продолжения...",
+        "yes": "д",
+        "no": "н",
+        "save_changes": "💾 Сохранить изменения? (д/н): ",
+        "changes_saved": "✅ Конфигурация успешно сохранена!",
+        "no_changes": "ℹ️  Нет изменений для сохранения.",
+        "exit_without_save": "⚠️  Выйти без сохранения изменений? (д/н): ",
+        "goodbye": "👋 Спасибо за использование конфигуратора Reticulum!",
+        "current_value": "Текущее значение:",
+        "new_value": "Новое значение (Enter для сохранения текущего): ",
+        "enabled": "включено",
+        "disabled": "выключено",
+        "interface_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                        УПРАВЛЕНИЕ ИНТЕРФЕЙСАМИ                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📋 Список всех интерфейсов
+  [2] ✏️  Включить/Выключить интерфейс
+  [3] ❌ Удалить интерфейс
+  [4] ➕ Добавить новый интерфейс вручную
+  [5] 📻 Добавить LoRa-интерфейс RNode
+  [6] 🔙 Вернуться в главное меню
+
+""",
+        "no_interfaces": "ℹ️  Интерфейсы не найдены в конфигурации.",
+        "interface_list": "📡 Текущие Интерфейсы:",
+        "select_interface": "Выберите номер интерфейса: ",
+        "interface_enabled": "✅ Интерфейс включён:",
+        "interface_disabled": "🔴 Интерфейс выключен:",
+        "interface_removed": "🗑️  Интерфейс удалён:",
+        "confirm_remove": "⚠️  Удалить этот интерфейс? (д/н): ",
+        "tcp_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    ДОБАВИТЬ TCP CLIENT ИНТЕРФЕЙС                             ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🌍 RMAP.world (Карта Reticulum - рекомендуется)
+  [2] 🇮🇪 Dublin Testnet Hub (официальный)
+  [3] 🌐 BetweenTheBorders Hub (сообщество)
+  [4] 🇦🇺 Sydney RNS (сообщество)
+  [5] 🇩🇪 Узел Германия (сообщество)
+  [6] ➕ Добавить свой TCP интерфейс
+  [7] 📦 Добавить ВСЕ рекомендуемые узлы
+  [8] 🗂️  Каталог публичных узлов
+  [9] 🔙 Вернуться в главное меню
+
+""",
+        "quick_connect": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                      НАСТРОЙКА БЫСТРОГО ПОДКЛЮЧЕНИЯ                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Это измерит задержку подключения ко всем известным публичным узлам
+и добавит самые быстрые доступные для быстрого подключения к сети
+Reticulum.
+
+""",
+        "add_all_confirm": "Добавить все рекомендуемые узлы? (д/н): ",
+        "probing_nodes": "⏱️  Измерение задержки до {count} публичных узлов...",
+        "add_fastest_confirm": "Добавить {count} самых быстрых доступных узлов? (д/н): ",
+        "no_nodes_reachable": "⚠️  Ни один публичный узел недоступен. Проверьте подключение к интернету.",
+        "nodes_added": "✅ Узлы успешно добавлены!",
+        "interface_name": "Имя интерфейса (например, 'Мой Узел'): ",
+        "target_host": "Целевой хост/IP: ",
+        "target_port": "Целевой порт (по умолчанию 4242): ",
+        "interface_added": "✅ Интерфейс добавлен:",
+        "already_exists": "⚠️  Интерфейс с похожими настройками уже существует.",
+        "rnode_ports": "🔌 Найденные последовательные USB-устройства:",
+        "rnode_no_ports": "ℹ️  Последовательные USB-устройства не найдены, введите путь к порту вручную.",
+        "rnode_select_port": "Номер устройства или путь к порту: ",
+        "rnode_presets": "📻 Предустановки радио:",
+        "rnode_select_preset": "Номер предустановки (по умолчанию 1): ",
+        "interface_types": "Типы интерфейсов:",
+        "select_interface_type": "Номер типа: ",
+        "interface_settings": "Параметры (Enter оставляет значение в скобках):",
+        "value_required": "❌ {key} обязателен, интерфейс не добавлен",
+        "general_settings": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                          ОБЩИЕ НАСТРОЙКИ                                     ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 📊 Уровень логов (0-7, текущий: {loglevel})
+  [2] 🚀 Включить transport ({transport})
+  [3] 🔒 Panic при неустранимой ошибке ({panic})
+  [4] 🎛️  Применить профиль производительности
+  [5] 🔙 Вернуться в главное меню
+
+""",
+        "loglevel_help": """
+Уровни логов:
+  0 = Только критические
+  1 = Ошибки
+  2 = Предупреждения  
+  3 = Уведомления
+  4 = Информация (по умолчанию)
+  5 = Подробно
+  6 = Отладка
+  7 = Максимальная отладка
+""",
+        "transport_help": """
+Режим transport позволяет вашему узлу маршрутизировать трафик для других узлов.
+Включите, если хотите помочь сети или нужно соединить интерфейсы.
+""",
+        "enter_loglevel": "Введите уровень логов (0-7): ",
+        "enable_transport": "Включить режим transport? (д/н): ",
+        "setting_updated": "✅ Настройка обновлена!",
+        "view_config": "📋 Текущая Конфигурация:",
+        "config_location": "📁 Расположение файла конфигурации:",
+        "check_fix_title": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                  ПРОВЕРИТЬ И ИСПРАВИТЬ КОНФИГУРАЦИЮ                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+""",
+        "checking_config": "🔍 Проверка конфигурации...",
+        "config_valid": "✅ Конфигурация корректна!",
+        "config_issues": "⚠️  Найдено {count} проблем(а):",
+        "fix_issues": "🔧 Исправить эти проблемы? (д/н): ",
+        "fixing_issues": "🔧 Исправление проблем...",
+        "issues_fixed": "✅ Все проблемы исправлены!",
+        "issue_section_missing": "Отсутствует секция: [{section}]",
+        "issue_key_missing": "Отсутствует ключ '{key}' в [{section}]",
+        "issue_bad_indentation": "Неправильный отступ в интерфейсе '{name}'",
+        "issue_invalid_value": "Недопустимое значение для '{key}': {value}",
+        "issue_duplicate_interface": "Дублирующийся интерфейс: {name}",
+        "issue_empty_section": "Пустая секция [interfaces]",
+        "testing_with_rnsd": "🧪 Тестирование с rnsd...",
+        "rnsd_not_found": "⚠️  rnsd не найден - невозможно проверить конфигурацию",
+        "rnsd_test_passed": "✅ Проверка rnsd пройдена!",
+        "rnsd_test_failed": "❌ Проверка rnsd не пройдена:",
+        "tools_menu": """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                             СЕТЕВЫЕ ИНСТРУМЕНТЫ                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+  [1] 🩺 Мониторинг состояния TCP интерфейсов
+  [2] 📊 Панель трафика в реальном времени
+  [3] 📈 Планировщик ёмкости анонсов
+  [4] 🔙 Назад в главное меню
+
+""",
+        "no_tcp_targets": "ℹ️  Нет включённых TCP клиентских интерфейсов для мониторинга.",
+        "monitor_auto_disable": "Автоматически отключать постоянно недоступные интерфейсы? (д/н): ",
+        "monitor_stop_hint": "Нажмите Ctrl+C, чтобы остановить мониторинг.",
+        "directory_select": "Номер узла для добавления, [r] обновить, [s] задать источник, Enter для возврата: ",
+        "stats_unavailable": "⚠️  Не удалось получить статистику интерфейсов. rnsd запущен?",
+        "select_profile": "Выберите номер профиля: ",
+        "apply_profile_confirm": "Применить эти изменения? (д/н): ",
+        "profile_applied": "✅ Профиль применён:",
+        "profile_no_changes": "ℹ️  Конфигурация уже соответствует этому профилю.",
+        "enter_destinations": "Ожидаемое число адресатов (по умолчанию 100): ",
+        "enter_announce_interval": "Интервал анонсов на адресата в минутах (по умолчанию 30): ",
+        "external_change": "⚠️  Файл конфигурации был изменён другой программой.",
+        "external_reloaded": "🔄 Загружена новая версия (несохранённых изменений не было).",
+        "external_merged": "🔀 Ваши несохранённые изменения объединены с новой версией.",
+        "merge_conflict_choice": "   Какое значение оставить? (m = моё, t = на диске): ",
+        "profiles_title": "🎛️  Профили производительности",
+        "monitor_title": "🩺 Состояние TCP-интерфейсов - раунд {round}, каждые {interval} с",
+        "monitor_row": "медиана {median}  потеряно {lost}",
+        "health_ok": "ок",
+        "health_slow": "медленно",
+        "health_down": "недоступен",
+        "health_disabled": "отключён",
+        "health_unknown": "ожидание",
+        "monitor_disabled": "⚠️  Отключены: {names} (сохраните, чтобы оставить изменение)",
+        "directory_title": "🗂️  Каталог публичных узлов",
+        "directory_source": "Источник: {source} (обновлено: {updated})",
+        "directory_builtin_only": "только встроенный список",
+        "directory_never": "никогда",
+        "directory_refresh_failed": "⚠️  Последнее обновление не удалось:",
+        "directory_refreshing": "⏳ Обновление...",
+        "directory_enter_source": "Путь к файлу или URL http(s): ",
+        "node_added": "✅ Добавлен:",
+        "node_skipped": "ℹ️  Пропущен (уже есть):",
+        "node_unreachable": "недоступен",
+        "node_loss": "(потеряно {loss})",
+        "dashboard_title": "📊 Трафик интерфейсов - {time}, каждые {interval} с",
+        "dashboard_interface": "Интерфейс",
+        "dashboard_stop_hint": "Нажмите Ctrl+C, чтобы вернуться в меню.",
+        "planner_title": "📈 Планировщик ёмкости анонсов",
+        "add_interface_title": "➕ Добавить новый интерфейс",
+        "rnode_title": "📻 Добавить интерфейс LoRa RNode",
+        "merge_conflict": "{where}: моё = {ours}, на диске = {theirs}",
+        "merge_present": "есть",
+        "merge_removed": "удалена",
+    },
+}
@@ -0,0 +1,271 @@
+"""Differential screen updates for the interactive menus over plain ANSI sequences"""
+
+import io
+import os
+import sys
+import atexit
+import shutil
+import unicodedata
+
+
+CSI = "\033["
+HOME = CSI + "H"
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_LINE = CSI + "2K"
+CLEAR_TO_END = CSI + "K"
+CLEAR_BELOW = CSI + "J"
+
+_screen = None
+
+
+def display_width(text):
+    """Number of terminal columns a string takes, counting wide characters twice"""
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.combining(char) or char in "\u200d\ufe0f":
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+    return width
+
+
+def move_to(row, column=0):
+    """Sequence placing the cursor at a 0-based screen row and column"""
+    return f"{CSI}{row + 1};{column + 1}H"
+
+
+def update_line(row, old, new):
+    """Sequence turning the old text of a row into the new one, None if unknown"""
+    if old is None:
+        return move_to(row) + CLEAR_LINE + new
+    # Skip the shared start, as far as every character is known to take one column
+    column = 0
+    for old_char, new_char in zip(old, new):
+        if old_char != new_char or not (" " <= old_char < "\x7f" or "\u2500" <= old_char <= "\u259f"):
+            break
+        column += 1
+    return move_to(row, column) + new[column:] + CLEAR_TO_END
+
+
+class InputEcho:
+    """Stand-in for stdin telling the screen where the terminal echoed a line of input"""
+    
+    def __init__(self, stream, screen):
+        self.stream = stream
+        self.screen = screen
+    
+    def readline(self, size=-1):
+        line = self.stream.readline(size)
+        self.screen.input_done()
+        return line
+    
+    def fileno(self):
+        # Without a file descriptor input() reads through readline() instead of the C tty path
+        raise io.UnsupportedOperation("fileno")
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class Screen:
+    """Stand-in for stdout that draws each frame as an update of the previous one
+    
+    clear() homes the cursor instead of erasing the screen. Every printed line is
+    compared with the line on the same row of the previous frame: unchanged rows
+    are skipped and changed rows are rewritten in place. Rows left over from a
+    longer previous frame are erased on flush(), which input() always calls.
+    """
+    
+    def __init__(self, stream=None, stdin=None):
+        self.stream = stream or sys.stdout
+        self.stdin = stdin or sys.stdin
+        self.installed = False
+        # Rows on the terminal, None where unknown; None for an unknown screen
+        self.drawn = None
+        # Rows of the frame being drawn; None outside a frame, when writes pass through
+        self.frame = None
+        # Text after the last newline, not yet on screen and already on screen
+        self.pending = ""
+        self.shown = ""
+        self.settled = False
+        # Row the cursor is on, and whether it waits at the start of the next frame row
+        self.cursor_row = None
+        self.parked = False
+        # First of the rows known to be blank down to the bottom, None if unknown
+        self.blank_from = None
+        self.size = None
+    
+    @property
+    def enabled(self):
+        """Whether this is an interactive ANSI terminal the screen can take over"""
+        if os.name == "nt" or os.environ.get("TERM") == "dumb":
+            return False
+        try:
+            return self.stream.isatty() and self.stdin.isatty()
+        except (AttributeError, ValueError):
+            return False
+    
+    def install(self):
+        """Route stdout and stdin through the screen until the program exits"""
+        if self.installed:
+            return
+        sys.stdout = self
+        sys.stdin = InputEcho(self.stdin, self)
+        self.installed = True
+        atexit.register(self.uninstall)
+    
+    def uninstall(self):
+        """Flush the last frame and give the real streams back"""
+        if not self.installed:
+            return
+        self.invalidate()
+        sys.stdout = self.stream
+        sys.stdin = self.stdin
+        self.installed = False
+    
+    def clear(self):
+        """Start a new frame, erasing the screen only when its content is unknown"""
+        if not self.enabled:
+            if os.name == "nt":
+                os.system("cls")
+            elif self.stream.isatty():
+                self.stream.write(HOME + CLEAR_SCREEN)
+            return
+        self.install()
+        
+        if self.frame is not None:
+            self.drawn = self.frame + ([None] if self.shown else [])
+        size = shutil.get_terminal_size()
+        self.parked = False
+        if self.drawn is None or size != self.size:
+            self.stream.write(HOME + CLEAR_SCREEN)
+            self.drawn = []
+            self.cursor_row = 0
+            self.parked = True
+            self.blank_from = 0
+        self.size = size
+        self.frame = []
+        self.pending = ""
+        self.shown = ""
+        self.settled = False
+    
+    def invalidate(self):
+        """Forget the screen content, before something else writes to the terminal"""
+        self.flush()
+        self._forget()
+    
+    def _forget(self):
+        self.frame = None
+        self.drawn = None
+        self.cursor_row = None
+        self.blank_from = None
+        self.shown = ""
+    
+    def write(self, text):
+        if self.frame is None:
+            return self.stream.write(text)
+        
+        *lines, self.pending = (self.pending + text).split("\n")
+        for number, line in enumerate(lines):
+            self._line(line)
+            if self.frame is None:
+                # Fell back to plain output in the middle of the text
+                self.stream.write("\n".join(lines[number + 1:] + [self.pending]))
+                self.pending = ""
+                break
+        if lines:
+            if self.frame is not None and not self.parked:
+                self._park()
+            self.settled = False
+            self.stream.flush()
+        return len(text)
+    
+    def _line(self, line):
+        """Put one complete line of the frame on its row"""
+        row = len(self.frame)
+        line = self.shown + line
+        if display_width(line) > self.size.columns or row > self.size.lines - 3:
+            # Wrapped or scrolling text cannot be updated in place: print the rest plainly
+            self.stream.write(move_to(row) + CLEAR_BELOW + line + "\n")
+            self._forget()
+            return
+        old = self.shown or (self.drawn[row] if row < len(self.drawn) else None)
+        if old is None and self.blank_from is not None and row >= self.blank_from:
+            old = ""
+        if old != line:
+            if old == "":
+                # Nothing to erase: print the line as plain output would
+                self.stream.write(self._row_start(row) + line)
+            else:
+                self.stream.write(update_line(row, old, line))
+            self.cursor_row = row
+            self.parked = False
+            if self.blank_from is not None:
+                self.blank_from = max(self.blank_from, row + 1)
+        self.frame.append(line)
+        self.shown = ""
+    
+    def _park(self):
+        """Leave the cursor where the next row starts, as plain printing would"""
+        # Keys typed ahead while the program sleeps are echoed there
+        row = len(self.frame)
+        self.stream.write(self._row_start(row))
+        self.cursor_row = row
+        self.parked = True
+    
+    def _row_start(self, row):
+        """Sequence moving the cursor to the start of a row from where it is"""
+        if self.parked and self.cursor_row == row:
+            return ""
+        if self.cursor_row == row - 1:
+            return "\r\n"
+        return move_to(row)
+    
+    def flush(self):
+        """Show any partial line and erase the rows left over from the previous frame"""
+        if self.frame is not None and not (self.settled and not self.pending):
+            row = len(self.frame)
+            text = self.shown + self.pending
+            if self.blank_from is not None and row >= self.blank_from:
+                self.stream.write(self._row_start(row) + text)
+            else:
+                self.stream.write(self._row_start(row) + CLEAR_BELOW + text)
+            self.pending = ""
+            self.cursor_row = row
+            self.parked = not text
+            self.blank_from = row + 1 if text else row
+            if display_width(text) >= self.size.columns:
+                # A prompt that wraps leaves the input row unknown
+                self._forget()
+            else:
+                self.shown = text
+                self.drawn = self.drawn[:row]
+                self.settled = True
+        self.stream.flush()
+    
+    def input_done(self):
+        """Account for the row the terminal echoed a line of input on"""
+        if self.frame is not None:
+            # The row now holds the prompt plus whatever was typed
+            self.frame.append(None)
+            self.shown = ""
+            self.settled = False
+            self.cursor_row = len(self.frame)
+            self.parked = True
+            if self.blank_from is not None:
+                self.blank_from = max(self.blank_from, self.cursor_row)
+    
+    def isatty(self):
+        return self.stream.isatty()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def get_screen():
+    """The process-wide Screen over the real stdout and stdin"""
+    global _screen
+    if _screen is None:
+        _screen = Screen()
+    return _screen
@@ -0,0 +1,113 @@
+"""Notice edits made to a config file by other programs"""
+
+import os
+import sys
+import select
+import struct
+import threading
+from pathlib import Path
+
+
+WATCH_POLL_INTERVAL = 1.0
+
+# inotify(7) constants, stable across Linux architectures
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def _inotify_init(directory):
+    """Watch a directory with inotify, return the file descriptor or None if unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    import ctypes
+    import ctypes.util
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(fd, os.fsencode(str(directory)), mask) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+
+class ConfigWatcher:
+    """Notice changes to a config file made by other programs"""
+    
+    def __init__(self, path, poll_interval=WATCH_POLL_INTERVAL):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.changed = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.backend = None
+    
+    def signature(self):
+        """Identity of the file on disk, changes on every write or replace"""
+        try:
+            st = self.path.stat()
+            return (st.st_ino, st.st_size, st.st_mtime_ns)
+        except OSError:
+            return None
+    
+    def start(self):
+        """Start watching in a background thread"""
+        if self.thread:
+            return
+        fd = _inotify_init(self.path.parent)
+        self.backend = "inotify" if fd is not None else "polling"
+        target = self._watch_inotify if fd is not None else self._watch_polling
+        self.thread = threading.Thread(target=target, args=(fd,) if fd is not None else (), daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop the background thread"""
+        self.stopped.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+            self.thread = None
+    
+    def acknowledge(self):
+        """Clear the changed flag after the new content has been handled"""
+        self.changed.clear()
+    
+    def _watch_inotify(self, fd):
+        """Read inotify events for the config's directory and flag events for the config file"""
+        name = os.fsencode(self.path.name)
+        try:
+            while not self.stopped.is_set():
+                ready, _, _ = select.select([fd], [], [], self.poll_interval)
+                if not ready:
+                    continue
+                try:
+                    data = os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                offset = 0
+                while offset < len(data):
+                    _, _, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += INOTIFY_EVENT.size
+                    if data[offset:offset + length].rstrip(b"\0") == name:
+                        self.changed.set()
+                    offset += length
+        finally:
+            os.close(fd)
+    
+    def _watch_polling(self):
+        """Compare the file's signature at a fixed interval"""
+        last = self.signature()
+        while not self.stopped.wait(self.poll_interval):
+            current = self.signature()
+            if current != last:
+                last = current
+                self.changed.set()
@@ -0,0 +1,91 @@
+"""Management API: request checks, auth and the Unix socket path"""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from rnstools.api import ConfigApi, make_api_server, remove_stale_socket
+from rnstools.reticulum import ReticulumConfigurator
+
+
+CONFIG = """[reticulum]
+  enable_transport = No
+  share_instance = Yes
+
+[logging]
+  loglevel = 4
+
+[interfaces]
+  [[Default Interface]]
+    type = AutoInterface
+    enabled = yes
+"""
+
+
+@pytest.fixture
+def api(tmp_path):
+    (tmp_path / "config").write_text(CONFIG)
+    configurator = ReticulumConfigurator(config_path=tmp_path / "config")
+    configurator.read_config()
+    return ConfigApi(configurator)
+
+
+@pytest.fixture
+def server(api):
+    server = make_api_server(api, "127.0.0.1", 0, token="secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(server, body, headers):
+    connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+    connection.request("POST", "/", body=body, headers=headers)
+    response = connection.getresponse()
+    payload = response.read()
+    connection.close()
+    return response.status, json.loads(payload) if payload else None
+
+
+def _call(method, **params):
+    return json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+
+
+def test_token_is_required(server):
+    headers = {"Content-Type": "application/json"}
+    assert _post(server, _call("config.get"), headers)[0] == 401
+    assert _post(server, _call("config.get"), dict(headers, Authorization="Bearer wrong"))[0] == 401
+    status, reply = _post(server, _call("settings.get", section="reticulum", key="share_instance"), dict(headers, Authorization="Bearer secret"))
+    assert status == 200
+    assert reply["result"] == "Yes"
+
+
+def test_cross_site_requests_are_refused(server):
+    headers = {"Authorization": "Bearer secret", "Content-Type": "application/json"}
+    assert _post(server, _call("config.get"), dict(headers, Origin="http://example.org"))[0] == 403
+    assert _post(server, _call("config.get"), dict(headers, **{"Content-Type": "text/plain"}))[0] == 415
+
+
+def test_bad_content_length(server):
+    headers = {"Authorization": "Bearer secret", "Content-Type": "application/json", "Content-Length": "many"}
+    assert _post(server, "{}", headers)[0] == 400
+
+
+def test_param_types_are_checked(api):
+    reply = api.handle({"jsonrpc": "2.0", "id": 1, "method": "interfaces.toggle",
+                        "params": {"name": "Default Interface", "enabled": "false"}})
+    assert reply["error"]["code"] == -32602
+    assert "enabled = yes" in api.configurator.config_content
+
+
+def test_stale_socket_path_must_be_a_socket(tmp_path):
+    config = tmp_path / "config"
+    config.write_text(CONFIG)
+    with pytest.raises(FileExistsError):
+        remove_stale_socket(config)
+    assert config.read_text() == CONFIG
+    remove_stale_socket(tmp_path / "missing")
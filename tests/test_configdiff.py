@@ -0,0 +1,130 @@
+"""Diff, patch and three-way merge round trips"""
+
+import random
+
+from rnstools.configdiff import (
+    ConfigIndex,
+    apply_patch,
+    diff_configs,
+    key_indent,
+    parse_config_tree,
+    section_header,
+    three_way_merge,
+)
+
+
+BASE = """[reticulum]
+  enable_transport = No
+
+[interfaces]
+  [[Default Interface]]
+    type = AutoInterface
+    enabled = yes
+"""
+
+
+def _render(tree):
+    """Config text for a parsed tree"""
+    lines = [f"{key} = {value}" for key, value in tree.get((), {}).items()]
+    for path, keys in tree.items():
+        if path:
+            lines += ["", section_header(path)] + [f"{key_indent(path)}{key} = {value}" for key, value in keys.items()]
+    return "\n".join(lines) + "\n"
+
+
+def _random_tree(rng):
+    tree = {(): {"loglevel": str(rng.randint(0, 7))} if rng.random() < 0.3 else {}}
+    for top in rng.sample(["reticulum", "logging", "interfaces"], rng.randint(0, 3)):
+        tree[(top,)] = {key: str(rng.randint(0, 2)) for key in rng.sample(["a", "b", "c"], rng.randint(0, 3))}
+        if top == "interfaces":
+            for name in rng.sample(["Default Interface", "Hub", "LoRa"], rng.randint(0, 3)):
+                keys = rng.sample(["type", "mode", "port", "enabled"], rng.randint(0, 4))
+                tree[(top, name)] = {key: str(rng.randint(0, 2)) for key in keys}
+    return tree
+
+
+def test_key_added_to_last_section_stays_out_of_new_sibling():
+    changes = [
+        {"op": "add_section", "section": ["interfaces", "Hub"], "keys": {"type": "TCPServerInterface"}},
+        {"op": "set", "section": ["interfaces", "Default Interface"], "key": "mode", "value": "gateway"},
+    ]
+    tree = parse_config_tree(apply_patch(BASE, changes))
+    assert tree[("interfaces", "Default Interface")]["mode"] == "gateway"
+    assert tree[("interfaces", "Hub")] == {"type": "TCPServerInterface"}
+
+
+def test_new_subsection_lands_before_new_top_level_section():
+    changes = [
+        {"op": "add_section", "section": ["logging"], "keys": {"loglevel": "4"}},
+        {"op": "add_section", "section": ["interfaces", "Hub"], "keys": {"type": "TCPServerInterface"}},
+    ]
+    tree = parse_config_tree(apply_patch(BASE, changes))
+    assert tree[("interfaces", "Hub")] == {"type": "TCPServerInterface"}
+    assert tree[("logging",)] == {"loglevel": "4"}
+
+
+def test_patch_leaves_untouched_lines_alone():
+    text = BASE.replace("enabled = yes", "enabled = yes  # keep me")
+    patched = apply_patch(text, [{"op": "set", "section": ["reticulum"], "key": "enable_transport", "value": "Yes"}])
+    assert "enabled = yes  # keep me" in patched
+    assert "enable_transport = Yes" in patched
+
+
+def test_diff_then_apply_round_trip():
+    rng = random.Random(38)
+    for _ in range(2000):
+        a, b = _render(_random_tree(rng)), _render(_random_tree(rng))
+        assert parse_config_tree(apply_patch(a, diff_configs(a, b))) == parse_config_tree(b)
+
+
+def test_merge_external_new_section_with_our_key_on_last_section():
+    theirs = BASE + "\n  [[Hub]]\n    type = TCPServerInterface\n"
+    ours = BASE.replace("    enabled = yes\n", "    enabled = yes\n    mode = gateway\n")
+    merged, conflicts = three_way_merge(BASE, theirs, ours)
+    tree = parse_config_tree(merged)
+    assert conflicts == []
+    assert tree[("interfaces", "Default Interface")]["mode"] == "gateway"
+    assert tree[("interfaces", "Hub")] == {"type": "TCPServerInterface"}
+
+
+def test_merge_conflict_goes_to_resolver():
+    theirs = BASE.replace("enable_transport = No", "enable_transport = Yes")
+    ours = BASE.replace("enable_transport = No", "enable_transport = False")
+    seen = []
+    
+    def resolve(conflict):
+        seen.append((conflict["key"], conflict["ours"], conflict["theirs"]))
+        return "ours"
+    
+    merged, conflicts = three_way_merge(BASE, theirs, ours, resolve)
+    assert seen == [("enable_transport", "False", "Yes")]
+    assert conflicts[0]["resolution"] == "ours"
+    assert parse_config_tree(merged)[("reticulum",)]["enable_transport"] == "False"
+
+
+def test_merge_with_base_index_matches_full_parse():
+    rng = random.Random(39)
+    for _ in range(500):
+        base, theirs, ours = (_render(_random_tree(rng)) for _ in range(3))
+        assert three_way_merge(base, theirs, ours, base_index=ConfigIndex(base)) == three_way_merge(base, theirs, ours)
+
+
+def test_updated_index_matches_full_parse():
+    rng = random.Random(139)
+    lines = BASE.split("\n")
+    pool = lines + ["[logging]", "  [[Hub]]", "    port = 4242", "", "# comment", "loglevel = 7"]
+    for _ in range(2000):
+        edited = list(lines)
+        for _ in range(rng.randint(1, 3)):
+            position = rng.randint(0, len(edited) - 1)
+            edit = rng.random()
+            if edit < 0.4:
+                edited.insert(position, rng.choice(pool))
+            elif edit < 0.7:
+                edited.pop(position)
+            else:
+                edited[position] = rng.choice(pool)
+        content = "\n".join(edited)
+        updated = ConfigIndex(BASE).updated(content)
+        full = ConfigIndex(content)
+        assert list(updated.sections.items()) == list(full.sections.items())
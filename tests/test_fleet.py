@@ -0,0 +1,75 @@
+"""Fleet operations: order, key syntax and change detection"""
+
+from rnstools.fleet import fleet_apply_one
+from rnstools.reticulum_cli import build_cli_parser, run_cli
+
+
+CONFIG = """[reticulum]
+  enable_transport = No
+  share_instance = Yes
+
+[logging]
+  loglevel = 4
+
+[interfaces]
+  [[Default Interface]]
+    type = AutoInterface
+    enabled = yes
+
+  [[Hub]]
+    type = TCPClientInterface
+    enabled = yes
+    target_host = old.example.org
+    target_port = 4242
+"""
+
+
+def _nodes(tmp_path, count=2):
+    paths = []
+    for i in range(count):
+        node = tmp_path / f"node{i}"
+        node.mkdir()
+        (node / "config").write_text(CONFIG)
+        paths.append(node / "config")
+    return paths
+
+
+def test_operations_keep_command_line_order():
+    args = build_cli_parser().parse_args([
+        "fleet", "x", "--remove", "Hub", "--add-tcp", "Hub", "new.example.org", "4242",
+        "--set", "interfaces/Hub", "mode", "gateway", "--profile", "leaf", "--toggle", "Hub", "off",
+    ])
+    assert [operation[0] for operation in args.operations] == ["remove", "add_tcp", "set", "profile", "toggle"]
+    assert args.operations[0] == ("remove", "Hub")
+
+
+def test_remove_then_add_replaces_the_interface(tmp_path):
+    path = _nodes(tmp_path, 1)[0]
+    result = fleet_apply_one(path, [("remove", "Hub"), ("add_tcp", "Hub", "new.example.org", 4242)])
+    content = path.read_text()
+    assert result["status"] == "changed"
+    assert result["applied"] == 2
+    assert content.count("[[Hub]]") == 1
+    assert "new.example.org" in content
+    assert "old.example.org" not in content
+
+
+def test_set_interface_key_and_no_op_set(tmp_path):
+    path = _nodes(tmp_path, 1)[0]
+    result = fleet_apply_one(path, [("set", "interfaces/Hub", "mode", "gateway"),
+                                    ("set", "reticulum", "enable_transport", "False")])
+    assert result["applied"] == 1
+    assert "    mode = gateway" in path.read_text()
+    assert "enable_transport = No" in path.read_text()
+    
+    result = fleet_apply_one(path, [("set", "interfaces/Hub", "mode", "gateway"), ("toggle", "Hub", "on")])
+    assert result["status"] == "unchanged"
+    assert result["applied"] == 0
+
+
+def test_fleet_command_dry_run(tmp_path, capsys):
+    paths = _nodes(tmp_path)
+    code = run_cli(["fleet", str(tmp_path / "node*"), "--dry-run", "--set", "reticulum", "enable_transport", "Yes"])
+    assert code == 0
+    assert "2 would change" in capsys.readouterr().out
+    assert all(path.read_text() == CONFIG for path in paths)
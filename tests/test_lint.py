@@ -0,0 +1,59 @@
+"""Lint rules and their fixes"""
+
+from rnstools.lint import VALIDATION_LINT_CODES, apply_edits, lint_config
+
+
+COMMENTED = """[reticulum]
+  enable_transport = No  # not a transport node
+  share_instance = "Yes"
+  shared_instance_port = 37428 # default
+
+[logging]
+  loglevel = 4  # info
+
+[interfaces]
+  [[Default Interface]]
+    type = AutoInterface  # local
+    enabled = yes # on
+
+  [[Hub]]
+    type = "TCPClientInterface"
+    enabled = 'yes'
+    target_host = "hub.example.org"
+    target_port = 4242  # default port
+"""
+
+
+def test_inline_comments_and_quotes_are_clean():
+    assert lint_config(COMMENTED, codes=VALIDATION_LINT_CODES) == []
+    assert [d["code"] for d in lint_config(COMMENTED) if d["severity"] == "error"] == []
+
+
+def test_invalid_value_behind_a_comment_is_reported():
+    content = COMMENTED.replace("enable_transport = No  #", "enable_transport = maybe  #")
+    diagnostics = [d for d in lint_config(content) if d["code"] == "invalid-value"]
+    assert len(diagnostics) == 1
+    assert diagnostics[0]["line"] == 2
+    assert diagnostics[0]["params"] == {"key": "enable_transport", "value": "maybe"}
+
+
+def test_unknown_quoted_type_is_reported():
+    content = COMMENTED.replace('"TCPClientInterface"', '"TCPClientInterfac"')
+    messages = [d["message"] for d in lint_config(content) if d["code"] == "interface-type"]
+    assert messages == ["Unknown interface type 'TCPClientInterfac' in 'Hub'"]
+
+
+def test_missing_required_key_of_quoted_enabled_interface():
+    content = COMMENTED.replace('    target_host = "hub.example.org"\n', "")
+    messages = [d["message"] for d in lint_config(content) if d["code"] == "interface-type"]
+    assert messages == ["Interface 'Hub' (TCPClientInterface) is missing 'target_host'"]
+
+
+def test_fixes_apply_in_one_pass():
+    content = "[reticulum]\n  enable_transport = No\n\n[interfaces]\n  [[A]]\n    type = AutoInterface\n\n  [[A]]\n    type = AutoInterface\n"
+    fixes = [d for d in lint_config(content) if d["fix"]]
+    assert fixes
+    fixed = apply_edits(content, [edit for d in fixes for edit in d["fix"]["edits"]])
+    assert [d for d in lint_config(fixed) if d["fix"]] == []
+    assert fixed.count("[[A]]") == 1
+    assert "[logging]" in fixed
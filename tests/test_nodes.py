@@ -0,0 +1,79 @@
+"""Latency probe against TCP servers on the loopback interface"""
+
+import asyncio
+import socket
+
+from rnstools import nodes
+from rnstools.nodes import _probe_node, probe_tcp_nodes
+
+
+def _closed_port():
+    """A loopback port nothing listens on"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_probe_reachable_node():
+    async def probe():
+        server = await asyncio.start_server(lambda reader, writer: writer.close(), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await _probe_node("local", {"name": "Local", "host": "127.0.0.1", "port": port}, 3, 2.0)
+    
+    result = asyncio.run(probe())
+    assert result["reachable"]
+    assert result["loss"] == 0
+    assert 0 <= result["latency"] < 2000
+    assert result["jitter"] >= 0
+
+
+def test_probe_unreachable_node_ranks_last():
+    port = _closed_port()
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        targets = {
+            "down": {"name": "Down", "host": "127.0.0.1", "port": port},
+            "up": {"name": "Up", "host": "127.0.0.1", "port": listener.getsockname()[1]},
+        }
+        results = probe_tcp_nodes(targets, samples=2, timeout=2.0)
+    
+    assert [result["key"] for result in results] == ["up", "down"]
+    assert results[1]["loss"] == 1
+    assert results[1]["latency"] is None
+    assert not results[1]["reachable"]
+
+
+def test_probe_stops_after_first_timeout(monkeypatch):
+    calls = []
+    
+    async def hanging_connect(address, port, timeout):
+        calls.append(address)
+        raise asyncio.TimeoutError
+    
+    monkeypatch.setattr(nodes, "_probe_connect", hanging_connect)
+    result = asyncio.run(_probe_node("slow", {"name": "Slow", "host": "localhost", "port": 4242}, 4, 0.5))
+    assert len(calls) == 1
+    assert calls[0] in ["127.0.0.1", "::1"]  # resolved once, before timing
+    assert result["loss"] == 1
+    assert not result["reachable"]
+
+
+def test_probe_concurrency_is_bounded(monkeypatch):
+    running = []
+    peak = []
+    
+    async def counting_probe(key, node, samples, timeout):
+        running.append(key)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(key)
+        return {"key": key, "name": key, "host": "", "port": 0, "reachable": False,
+                "latency": None, "jitter": 0.0, "loss": 1.0}
+    
+    monkeypatch.setattr(nodes, "_probe_node", counting_probe)
+    monkeypatch.setattr(nodes, "PROBE_CONCURRENCY", 3)
+    results = probe_tcp_nodes({str(i): {} for i in range(10)})
+    assert len(results) == 10
+    assert max(peak) == 3
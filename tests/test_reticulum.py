@@ -0,0 +1,63 @@
+"""Reticulum configurator checks that do not need rnsd"""
+
+from rnstools.reticulum import ReticulumConfigurator
+
+
+# Written the way people hand-edit configs: inline comments, quoted values
+REAL_WORLD_CONFIG = """[reticulum]
+  enable_transport = False  # leaf node
+  share_instance = "Yes"
+  shared_instance_port = 37428 # default
+  instance_control_port = '37429'
+
+[logging]
+  loglevel = 4  # 4 = info
+
+[interfaces]
+  [[Default Interface]]
+    type = AutoInterface  # local segment
+    enabled = Yes
+
+  [[RNS Testnet Dublin]]
+    type = "TCPClientInterface"
+    enabled = "yes"  # uplink
+    target_host = "dublin.connect.reticulum.network"
+    target_port = 4965
+    mode = ptp
+"""
+
+
+def _configurator(tmp_path, content):
+    configurator = ReticulumConfigurator(config_path=tmp_path / "config")
+    configurator.config_content = content
+    return configurator
+
+
+def test_commented_and_quoted_config_validates(tmp_path):
+    assert _configurator(tmp_path, REAL_WORLD_CONFIG).validate_config_inprocess() == (True, None)
+
+
+def test_bad_value_behind_a_comment_fails_validation(tmp_path):
+    content = REAL_WORLD_CONFIG.replace("enable_transport = False", "enable_transport = sometimes")
+    valid, error = _configurator(tmp_path, content).validate_config_inprocess()
+    assert not valid
+    assert error == "line 2: Invalid value for 'enable_transport': sometimes"
+
+
+def test_profile_leaves_equivalent_values_alone(tmp_path):
+    content = REAL_WORLD_CONFIG.replace("    mode = ptp\n", "    mode = full\n    announce_cap = 2.0\n")
+    configurator = _configurator(tmp_path, content)
+    configurator.apply_profile("leaf")
+    # Only the AutoInterface gains a key; the equivalent values stay as written
+    assert configurator.config_content.count("\n") == content.count("\n") + 1
+    assert "enable_transport = False  # leaf node" in configurator.config_content
+    assert 'share_instance = "Yes"' in configurator.config_content
+    assert "announce_cap = 2.0" in configurator.config_content
+    assert "  [[Default Interface]]\n    type = AutoInterface  # local segment\n    enabled = Yes\n    mode = full" in configurator.config_content
+
+
+def test_profile_writes_changed_values(tmp_path):
+    configurator = _configurator(tmp_path, REAL_WORLD_CONFIG)
+    configurator.apply_profile("tcp_hub")
+    assert "enable_transport = Yes" in configurator.config_content
+    assert 'share_instance = "Yes"' in configurator.config_content
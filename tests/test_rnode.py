@@ -0,0 +1,35 @@
+"""RNode discovery from a fake sysfs tree"""
+
+from rnstools.rnode import find_serial_ports
+
+
+def _add_tty(root, name, usb_port, usb_ids, product, acm=False):
+    """Create class/tty/<name> pointing into a USB device the way the kernel lays it out"""
+    usb = root / "devices" / "pci0000:00" / "usb1" / f"1-{usb_port}"
+    interface = usb / f"{usb.name}:1.0"
+    device = interface if acm else interface / name
+    device.mkdir(parents=True)
+    (usb / "idVendor").write_text(usb_ids[0] + "\n")
+    (usb / "idProduct").write_text(usb_ids[1] + "\n")
+    (usb / "product").write_text(product + "\n")
+    (root / "class" / "tty" / name).mkdir()
+    (root / "class" / "tty" / name / "device").symlink_to(device)
+
+
+def test_find_rnode_in_sysfs(tmp_path):
+    (tmp_path / "class" / "tty").mkdir(parents=True)
+    (tmp_path / "class" / "tty" / "tty0").mkdir()  # virtual console, no device link
+    _add_tty(tmp_path, "ttyACM0", 1, ("2341", "0043"), "Arduino Uno", acm=True)
+    _add_tty(tmp_path, "ttyUSB0", 2, ("10C4", "EA60"), "CP2102 USB to UART Bridge Controller")
+    
+    ports = find_serial_ports(tmp_path)
+    
+    assert [port["port"] for port in ports] == ["/dev/ttyUSB0", "/dev/ttyACM0"]
+    assert ports[0]["likely_rnode"]
+    assert ports[0]["chip"] == "Silicon Labs CP210x"
+    assert (ports[0]["vid"], ports[0]["pid"]) == ("10c4", "ea60")
+    assert not ports[1]["likely_rnode"]
+
+
+def test_no_sysfs(tmp_path):
+    assert find_serial_ports(tmp_path / "missing") == []
@@ -0,0 +1,23 @@
+"""Backup store settings"""
+
+import pytest
+
+from rnstools.store import BACKUP_RETENTION_ENV, DEFAULT_BACKUP_RETENTION, BackupStore
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("5", 5),
+    ("0", 0),
+    ("abc", DEFAULT_BACKUP_RETENTION),
+    ("-3", DEFAULT_BACKUP_RETENTION),
+    ("", DEFAULT_BACKUP_RETENTION),
+])
+def test_retention_from_environment(tmp_path, monkeypatch, value, expected):
+    monkeypatch.setenv(BACKUP_RETENTION_ENV, value)
+    assert BackupStore(tmp_path / "config").retention == expected
+
+
+def test_bad_retention_does_not_stop_a_backup(tmp_path, monkeypatch):
+    monkeypatch.setenv(BACKUP_RETENTION_ENV, "abc")
+    store = BackupStore(tmp_path / "config")
+    assert store.save("[reticulum]\n").exists()